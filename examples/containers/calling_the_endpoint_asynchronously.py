@@ -1,8 +1,6 @@
 import os
-from time import sleep
 
 from verda import VerdaClient
-from verda.inference_client import AsyncStatus
 
 # Configuration - replace with your deployment name
 DEPLOYMENT_NAME = os.environ.get('VERDA_DEPLOYMENT_NAME')
@@ -40,7 +38,6 @@ response = deployment.run(
     headers=header,
 )
 
-while response.status() != AsyncStatus.Completed:
-    print(response.status_json())
-    sleep(1)
-print(response.output())
+# Wait for the result. The execution is polled in the background with adaptive backoff;
+# in asyncio code use `await response` instead.
+print(response.future().result())
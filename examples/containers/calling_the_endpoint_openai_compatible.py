@@ -0,0 +1,40 @@
+import os
+
+from verda import VerdaClient
+from verda.inference_client import OpenAICompatibleClient
+
+# Configuration - replace with your deployment name
+DEPLOYMENT_NAME = os.environ.get('VERDA_DEPLOYMENT_NAME')
+
+# Get client secret and id from environment variables
+CLIENT_ID = os.environ.get('VERDA_CLIENT_ID')
+CLIENT_SECRET = os.environ.get('VERDA_CLIENT_SECRET')
+INFERENCE_KEY = os.environ.get('VERDA_INFERENCE_KEY')
+
+# Verda client instance
+verda = VerdaClient(
+    CLIENT_ID,
+    CLIENT_SECRET,
+    inference_key=INFERENCE_KEY,
+)
+
+# Get the deployment
+deployment = verda.containers.get_deployment_by_name(DEPLOYMENT_NAME)
+
+# Typed client for deployments serving an OpenAI-compatible API, e.g. SGLang or vLLM.
+# It reuses the pooled connections of the deployment's inference client.
+client = OpenAICompatibleClient(
+    deployment.inference_client, model='deepseek-ai/deepseek-llm-7b-chat'
+)
+
+messages = [{'role': 'user', 'content': 'Explain keep-alive connections in one sentence.'}]
+
+# Wait for the whole reply
+reply = client.chat_completions(messages, max_tokens=128, temperature=0.7)
+print(reply.content)
+
+# Stream the reply as it is generated
+with client.stream_chat_completions(messages, max_tokens=128) as stream:
+    for text in stream:
+        print(text, end='', flush=True)
+print(f'\nFinish reason: {stream.finish_reason}')
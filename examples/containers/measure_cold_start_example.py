@@ -0,0 +1,33 @@
+import os
+
+from verda import VerdaClient
+from verda.containers import ColdStartMeter, DeploymentTransition
+
+# Configuration - replace with your deployment name
+DEPLOYMENT_NAME = os.environ.get('VERDA_DEPLOYMENT_NAME')
+
+# Get client secret and id from environment variables
+CLIENT_ID = os.environ.get('VERDA_CLIENT_ID')
+CLIENT_SECRET = os.environ.get('VERDA_CLIENT_SECRET')
+INFERENCE_KEY = os.environ.get('VERDA_INFERENCE_KEY')
+
+# Verda client instance
+verda = VerdaClient(
+    CLIENT_ID,
+    CLIENT_SECRET,
+    inference_key=INFERENCE_KEY,
+)
+
+# Pause and resume the deployment three times, timing each resume until the
+# deployment's health check first passes
+meter = ColdStartMeter(verda.containers, DEPLOYMENT_NAME, poll_interval_seconds=5)
+report = meter.run(DeploymentTransition.RESUME, trials=3, cooldown_seconds=60)
+
+for trial in report.trials:
+    print(f'Trial started at {trial.started_at}')
+    for event in trial.events:
+        print(f'  {event.seconds:8.1f}s  {event.type.value:<9}  {event.value}')
+
+print(f'First replica: p50 {report.first_replica.p50:.1f}s, max {report.first_replica.max:.1f}s')
+print(f'Ready:         p50 {report.ready.p50:.1f}s, max {report.ready.max:.1f}s')
+print(f'Timed out:     {report.timeouts} of {len(report.trials)}')
@@ -4,7 +4,6 @@ This script provides an example of deploying a SGLang server with deepseek-ai/de
 including creation, monitoring, testing, and cleanup.
 """
 
-import json
 import os
 import signal
 import sys
@@ -28,6 +27,7 @@ from verda.containers import (
     UtilizationScalingTrigger,
 )
 from verda.exceptions import APIException
+from verda.inference_client import default_token_metrics
 
 CURRENT_TIMESTAMP = datetime.now().strftime('%Y%m%d-%H%M%S').lower()  # e.g. 20250403-120000
 
@@ -235,28 +235,31 @@ try:
         print('Completions API is working!')
         print(f'Response: {completions_response.output()}\n')
 
+        # Record time to first token and decode speed of streamed responses
+        created_deployment.inference_client.token_metrics = default_token_metrics
+
         # Make a stream sync inference request to the SGLang server
         completions_response_stream = created_deployment.run_sync(
             {**completions_data, 'stream': True}, path='/v1/completions', stream=True
         )
         print('Stream completions API is working!')
-        # Print the streamed response
-        for line in completions_response_stream.stream(as_text=True):
-            if line:
-                line = line.decode('utf-8')
-
-                if line.startswith('data:'):
-                    data = line[5:]  # Remove 'data: ' prefix
-                    if data == '[DONE]':
-                        break
-                    try:
-                        event_data = json.loads(data)
-                        token_text = event_data['choices'][0]['text']
-
-                        # Print token immediately to show progress
-                        print(token_text, end='', flush=True)
-                    except json.JSONDecodeError:
-                        continue
+        # Print the streamed response, stream_json() parses the Server-Sent Events for us
+        for chunk in completions_response_stream.stream_json():
+            token_text = chunk['choices'][0]['text']
+
+            # Print token immediately to show progress
+            print(token_text, end='', flush=True)
+
+        # Time to first token and decode speed of the stream we just read
+        stream_metrics = completions_response_stream.stream_metrics
+        if stream_metrics is not None and stream_metrics.ttft_seconds is not None:
+            print(
+                f'\n\nTTFT: {stream_metrics.ttft_seconds:.3f}s, '
+                f'{stream_metrics.completion_tokens} tokens at '
+                f'{stream_metrics.tokens_per_second:.1f} tokens/s'
+            )
+        else:
+            print('\n\nNo tokens were streamed')
 
     except Exception as e:
         print(f'Error testing deployment: {e}')
@@ -0,0 +1,192 @@
+import itertools
+from unittest.mock import Mock
+
+import pytest
+
+from verda.containers import (
+    ColdStartMeter,
+    ColdStartReport,
+    ColdStartTrial,
+    ContainerDeploymentStatus,
+    DeploymentTransition,
+    ReplicaInfo,
+    TimelineEventType,
+)
+
+DEPLOYMENT_NAME = 'test-deployment'
+
+
+def replicas(count, first=1):
+    return [
+        ReplicaInfo(f'replica-{i}', 'running', '2024-01-01T00:00:00+00:00')
+        for i in range(first, first + count)
+    ]
+
+
+@pytest.fixture
+def containers_service():
+    return Mock()
+
+
+class TestColdStartMeter:
+    def test_resume_timeline(self, containers_service):
+        containers_service.get_deployment_status.side_effect = [
+            ContainerDeploymentStatus.PAUSED,  # preparation
+            ContainerDeploymentStatus.PAUSED,  # before the trigger
+            ContainerDeploymentStatus.PAUSED,
+            ContainerDeploymentStatus.IMAGE_PULLING,
+            ContainerDeploymentStatus.HEALTHY,
+        ]
+        containers_service.get_deployment_replicas.side_effect = [
+            replicas(0),  # before the trigger
+            replicas(1),
+            replicas(1),
+            replicas(1),
+        ]
+        probe = Mock(side_effect=[RuntimeError('starting'), RuntimeError('starting'), None])
+        meter = ColdStartMeter(
+            containers_service, DEPLOYMENT_NAME, probe=probe, poll_interval_seconds=0
+        )
+
+        trial = meter.measure(DeploymentTransition.RESUME)
+
+        containers_service.pause_deployment.assert_called_once_with(DEPLOYMENT_NAME)
+        containers_service.resume_deployment.assert_called_once_with(DEPLOYMENT_NAME)
+        assert [(e.type, e.value) for e in trial.events] == [
+            (TimelineEventType.TRIGGERED, 'resume'),
+            (TimelineEventType.REPLICAS, '1'),
+            (TimelineEventType.STATUS, 'image_pulling'),
+            (TimelineEventType.STATUS, 'healthy'),
+            (TimelineEventType.READY, 'healthy'),
+        ]
+        assert trial.first_replica_seconds <= trial.first_status_change_seconds
+        assert trial.ready_seconds >= trial.first_status_change_seconds
+        assert not trial.timed_out
+        probe.assert_called_with(containers_service.get_deployment_by_name.return_value)
+
+    def test_restart_times_out(self, containers_service):
+        containers_service.get_deployment_status.return_value = ContainerDeploymentStatus.HEALTHY
+        containers_service.get_deployment_replicas.return_value = replicas(1)
+        meter = ColdStartMeter(
+            containers_service,
+            DEPLOYMENT_NAME,
+            probe=Mock(side_effect=RuntimeError('down')),
+            poll_interval_seconds=0.01,
+            timeout_seconds=0.05,
+        )
+
+        trial = meter.measure(DeploymentTransition.RESTART)
+
+        containers_service.restart_deployment.assert_called_once_with(DEPLOYMENT_NAME)
+        assert trial.timed_out
+        assert [e.type for e in trial.events] == [TimelineEventType.TRIGGERED]
+
+    def test_scale_from_zero_waits_for_no_replicas(self, containers_service):
+        containers_service.get_deployment_status.return_value = ContainerDeploymentStatus.HEALTHY
+        containers_service.get_deployment_replicas.side_effect = [
+            replicas(1),  # preparation, still scaling down
+            replicas(0),
+            replicas(0),  # before the trigger
+            replicas(1),
+        ]
+        meter = ColdStartMeter(
+            containers_service, DEPLOYMENT_NAME, probe=Mock(), poll_interval_seconds=0
+        )
+
+        trial = meter.measure('scale_from_zero')
+
+        assert trial.first_replica_seconds is not None
+        assert trial.events[-1].type == TimelineEventType.READY
+        containers_service.resume_deployment.assert_not_called()
+        containers_service.restart_deployment.assert_not_called()
+
+    def test_preparation_timeout(self, containers_service):
+        containers_service.get_deployment_status.return_value = ContainerDeploymentStatus.HEALTHY
+        meter = ColdStartMeter(
+            containers_service, DEPLOYMENT_NAME, poll_interval_seconds=0.01, timeout_seconds=0.03
+        )
+
+        with pytest.raises(TimeoutError, match='not paused'):
+            meter.measure(DeploymentTransition.RESUME)
+
+    def test_restart_is_ready_only_after_replicas_turn_over(self, containers_service):
+        containers_service.get_deployment_status.return_value = ContainerDeploymentStatus.HEALTHY
+        containers_service.get_deployment_replicas.side_effect = [
+            replicas(1),  # before the trigger
+            replicas(1),  # old replica still serving
+            replicas(1, first=2),
+        ]
+        probe = Mock()
+        meter = ColdStartMeter(
+            containers_service, DEPLOYMENT_NAME, probe=probe, poll_interval_seconds=0
+        )
+
+        trial = meter.measure(DeploymentTransition.RESTART)
+
+        probe.assert_called_once()
+        assert not trial.timed_out
+        assert [e.type for e in trial.events] == [
+            TimelineEventType.TRIGGERED,
+            TimelineEventType.READY,
+        ]
+
+    def test_restart_without_transition_is_not_ready(self, containers_service):
+        containers_service.get_deployment_status.return_value = ContainerDeploymentStatus.HEALTHY
+        containers_service.get_deployment_replicas.return_value = replicas(2)
+        probe = Mock()
+        meter = ColdStartMeter(
+            containers_service,
+            DEPLOYMENT_NAME,
+            probe=probe,
+            poll_interval_seconds=0.01,
+            timeout_seconds=0.05,
+        )
+
+        trial = meter.measure(DeploymentTransition.RESTART)
+
+        assert trial.timed_out
+        probe.assert_not_called()
+
+    def test_run_summarizes_trials(self, containers_service):
+        # every trial: healthy before the trigger, then updating
+        containers_service.get_deployment_status.side_effect = itertools.cycle(
+            [ContainerDeploymentStatus.HEALTHY, ContainerDeploymentStatus.VERSION_UPDATING]
+        )
+        containers_service.get_deployment_replicas.return_value = replicas(1)
+        probe = Mock()
+        meter = ColdStartMeter(
+            containers_service, DEPLOYMENT_NAME, probe=probe, poll_interval_seconds=0
+        )
+
+        report = meter.run(DeploymentTransition.RESTART, trials=3)
+
+        assert len(report.trials) == 3
+        assert report.ready.count == 3
+        assert report.first_status_change.count == 3
+        assert report.timeouts == 0
+        assert probe.call_count == 3
+        for trial in report.trials:
+            assert [e.type for e in trial.events][-2:] == [
+                TimelineEventType.STATUS,
+                TimelineEventType.READY,
+            ]
+        assert ColdStartReport.from_json(report.to_json()) == report
+
+
+class TestColdStartReport:
+    def test_summary_skips_missing_samples(self):
+        trials = [
+            ColdStartTrial(DeploymentTransition.RESUME, 'a', first_replica_seconds=10.0),
+            ColdStartTrial(
+                DeploymentTransition.RESUME, 'b', first_replica_seconds=20.0, ready_seconds=40.0
+            ),
+        ]
+
+        report = ColdStartReport.from_trials(DeploymentTransition.RESUME, trials)
+
+        assert report.first_replica.count == 2
+        assert report.first_replica.mean == 15.0
+        assert report.ready.count == 1
+        assert report.ready.max == 40.0
+        assert report.first_status_change.count == 0
+        assert report.timeouts == 1
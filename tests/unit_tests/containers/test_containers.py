@@ -202,6 +202,21 @@ class TestContainersService:
         assert deployment.compute.name == COMPUTE_RESOURCE_NAME_GENERAL_COMPUTE
         assert responses.assert_call_count(url, 1) is True
 
+    @responses.activate
+    def test_get_deployments_share_inference_client(self, http_client, deployments_endpoint):
+        # arrange - add response mock
+        containers_service = ContainersService(http_client, 'test-inference-key')
+        url = f'{deployments_endpoint}/{DEPLOYMENT_NAME}'
+        responses.add(responses.GET, deployments_endpoint, json=[DEPLOYMENT_DATA], status=200)
+        responses.add(responses.GET, url, json=DEPLOYMENT_DATA, status=200)
+
+        # act
+        first = containers_service.get_deployments()[0]
+        second = containers_service.get_deployment_by_name(DEPLOYMENT_NAME)
+
+        # assert
+        assert first.inference_client is second.inference_client
+
     @responses.activate
     def test_get_deployment_by_name_error(self, containers_service, deployments_endpoint):
         # arrange - add response mock
@@ -0,0 +1,208 @@
+import threading
+from datetime import datetime, time, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from verda.containers import (
+    DeploymentWarmKeeper,
+    ScalingOptions,
+    ScalingPolicy,
+    ScalingTriggers,
+    TrafficForecast,
+    WarmWindow,
+    _warm_keeper,
+)
+
+DEPLOYMENT_NAME = 'test-deployment'
+MONDAY_NOON = datetime(2024, 1, 1, 12, 0)
+
+
+def scaling_options(min_replica_count=0):
+    return ScalingOptions(
+        min_replica_count=min_replica_count,
+        max_replica_count=5,
+        scale_down_policy=ScalingPolicy(delay_seconds=300),
+        scale_up_policy=ScalingPolicy(delay_seconds=0),
+        queue_message_ttl_seconds=500,
+        concurrent_requests_per_replica=1,
+        scaling_triggers=ScalingTriggers(),
+    )
+
+
+@pytest.fixture
+def containers_service():
+    service = Mock()
+    service.get_deployment_scaling_options.return_value = scaling_options()
+
+    def update(_name, options):
+        service.get_deployment_scaling_options.return_value = options
+        return options
+
+    service.update_deployment_scaling_options.side_effect = update
+    return service
+
+
+class TestWarmWindow:
+    def test_contains(self):
+        window = WarmWindow(time(8), time(20), weekdays=(0, 1, 2, 3, 4))
+
+        assert window.contains(MONDAY_NOON)
+        assert not window.contains(MONDAY_NOON.replace(hour=21))
+        assert not window.contains(MONDAY_NOON + timedelta(days=5))
+
+    def test_window_past_midnight_belongs_to_its_start_day(self):
+        window = WarmWindow(time(22), time(2), weekdays=(0,))
+
+        assert window.contains(MONDAY_NOON.replace(hour=23))
+        assert window.contains(MONDAY_NOON.replace(hour=1) + timedelta(days=1))
+        assert not window.contains(MONDAY_NOON.replace(hour=1))
+
+
+class TestDeploymentWarmKeeper:
+    def test_pings_only_during_warm_windows(self, containers_service):
+        ping = Mock()
+        keeper = DeploymentWarmKeeper(
+            containers_service, DEPLOYMENT_NAME, windows=[WarmWindow(time(8), time(20))], ping=ping
+        )
+
+        keeper.run_once(MONDAY_NOON)
+        keeper.run_once(MONDAY_NOON.replace(hour=22))
+
+        ping.assert_called_once_with(containers_service.get_deployment_by_name.return_value)
+        containers_service.get_deployment_by_name.assert_called_once_with(DEPLOYMENT_NAME)
+        assert keeper.stats.pings == 1
+
+    def test_default_ping_uses_health(self, containers_service):
+        keeper = DeploymentWarmKeeper(containers_service, DEPLOYMENT_NAME)
+
+        keeper.run_once(MONDAY_NOON)
+
+        containers_service.get_deployment_by_name.return_value.health.assert_called_once()
+
+    def test_failed_pings_are_counted(self, containers_service):
+        keeper = DeploymentWarmKeeper(
+            containers_service, DEPLOYMENT_NAME, ping=Mock(side_effect=RuntimeError('cold'))
+        )
+
+        keeper.run_once(MONDAY_NOON)
+
+        stats = keeper.stats
+        assert stats.failed_pings == 1
+        assert stats.last_error == 'cold'
+
+    def test_keeps_connections_with_concurrent_pings(self, containers_service):
+        barrier = threading.Barrier(3, timeout=5)
+        keeper = DeploymentWarmKeeper(
+            containers_service,
+            DEPLOYMENT_NAME,
+            ping=lambda _deployment: barrier.wait(),
+            keep_connections=3,
+        )
+
+        keeper.run_once(MONDAY_NOON)
+        keeper.close()
+
+        assert keeper.stats.pings == 3
+        assert keeper.stats.failed_pings == 0
+
+    def test_prescales_for_forecast_and_restores(self, containers_service):
+        forecast = TrafficForecast(
+            MONDAY_NOON, MONDAY_NOON + timedelta(hours=1), min_replica_count=3, lead_seconds=600
+        )
+        keeper = DeploymentWarmKeeper(
+            containers_service, DEPLOYMENT_NAME, windows=[], forecasts=[forecast], ping=Mock()
+        )
+
+        keeper.run_once(MONDAY_NOON - timedelta(minutes=20))
+        containers_service.update_deployment_scaling_options.assert_not_called()
+
+        keeper.run_once(MONDAY_NOON - timedelta(minutes=5))
+        keeper.run_once(MONDAY_NOON)
+        options = containers_service.update_deployment_scaling_options.call_args.args[1]
+        assert options.min_replica_count == 3
+        assert keeper.stats.prescaled_min_replica_count == 3
+        assert containers_service.update_deployment_scaling_options.call_count == 1
+
+        keeper.run_once(MONDAY_NOON + timedelta(hours=1))
+        options = containers_service.update_deployment_scaling_options.call_args.args[1]
+        assert options.min_replica_count == 0
+        assert keeper.stats.prescaled_min_replica_count is None
+        assert keeper.stats.scaling_updates == 2
+
+    def test_failed_scaling_update_still_pings(self, containers_service):
+        containers_service.update_deployment_scaling_options.side_effect = RuntimeError(
+            'unavailable'
+        )
+        forecast = TrafficForecast(MONDAY_NOON, MONDAY_NOON + timedelta(hours=1), 3)
+        ping = Mock()
+        keeper = DeploymentWarmKeeper(
+            containers_service, DEPLOYMENT_NAME, forecasts=[forecast], ping=ping
+        )
+
+        keeper.run_once(MONDAY_NOON)
+
+        ping.assert_called_once()
+        stats = keeper.stats
+        assert stats.pings == 1
+        assert stats.scale_errors == 1
+        assert stats.last_error == 'unavailable'
+        assert stats.prescaled_min_replica_count is None
+
+    def test_close_restores_min_replica_count(self, containers_service):
+        forecast = TrafficForecast(MONDAY_NOON, MONDAY_NOON + timedelta(hours=1), 10)
+        keeper = DeploymentWarmKeeper(
+            containers_service, DEPLOYMENT_NAME, forecasts=[forecast], ping=Mock()
+        )
+
+        keeper.run_once(MONDAY_NOON)
+        assert containers_service.get_deployment_scaling_options.return_value.min_replica_count == 5
+        keeper.close()
+
+        assert containers_service.get_deployment_scaling_options.return_value.min_replica_count == 0
+
+    def test_close_retries_and_records_failed_restore(self, containers_service, monkeypatch):
+        monkeypatch.setattr(_warm_keeper, '_RESTORE_RETRY_SECONDS', 0)
+        forecast = TrafficForecast(MONDAY_NOON, MONDAY_NOON + timedelta(hours=1), 3)
+        keeper = DeploymentWarmKeeper(
+            containers_service, DEPLOYMENT_NAME, forecasts=[forecast], ping=Mock()
+        )
+        keeper.run_once(MONDAY_NOON)
+        update = containers_service.update_deployment_scaling_options
+        failures = [RuntimeError('unavailable')]
+        succeed = update.side_effect
+
+        def fail_once(name, options):
+            if failures:
+                raise failures.pop()
+            return succeed(name, options)
+
+        update.side_effect = fail_once
+
+        keeper.close()
+
+        assert keeper.stats.scale_errors == 1
+        assert keeper.stats.prescaled_min_replica_count is None
+        assert containers_service.get_deployment_scaling_options.return_value.min_replica_count == 0
+
+    def test_close_warns_when_restore_keeps_failing(self, containers_service, monkeypatch):
+        monkeypatch.setattr(_warm_keeper, '_RESTORE_RETRY_SECONDS', 0)
+        forecast = TrafficForecast(MONDAY_NOON, MONDAY_NOON + timedelta(hours=1), 3)
+        keeper = DeploymentWarmKeeper(
+            containers_service, DEPLOYMENT_NAME, forecasts=[forecast], ping=Mock()
+        )
+        keeper.run_once(MONDAY_NOON)
+        containers_service.update_deployment_scaling_options.side_effect = RuntimeError('down')
+
+        with pytest.warns(RuntimeWarning, match='down'):
+            keeper.close()
+
+        assert keeper.stats.scale_errors == 3
+
+    def test_background_thread_pings(self, containers_service):
+        pinged = threading.Event()
+
+        with DeploymentWarmKeeper(
+            containers_service, DEPLOYMENT_NAME, ping=lambda _deployment: pinged.set()
+        ):
+            assert pinged.wait(5)
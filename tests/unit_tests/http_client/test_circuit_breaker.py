@@ -0,0 +1,102 @@
+import time
+from unittest.mock import Mock
+
+from verda.http_client import CircuitBreaker, CircuitBreakerPolicy, CircuitState
+
+POLICY = CircuitBreakerPolicy(
+    failure_rate_threshold=0.5, minimum_calls=4, window_size=10, open_seconds=0.05
+)
+
+
+def open_breaker(breaker):
+    for _ in range(POLICY.minimum_calls):
+        assert breaker.allow()
+        breaker.record_failure()
+
+
+class TestCircuitBreaker:
+    def test_stays_closed_below_minimum_calls(self):
+        breaker = CircuitBreaker(POLICY)
+
+        for _ in range(POLICY.minimum_calls - 1):
+            breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow()
+
+    def test_stays_closed_below_failure_rate(self):
+        breaker = CircuitBreaker(POLICY)
+
+        for _ in range(6):
+            breaker.record_success()
+        for _ in range(4):
+            breaker.record_failure()
+
+        stats = breaker.stats()
+        assert stats.state == CircuitState.CLOSED
+        assert stats.failure_rate == 0.4
+
+    def test_opens_at_failure_rate_and_fails_fast(self):
+        breaker = CircuitBreaker(POLICY)
+
+        open_breaker(breaker)
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+        stats = breaker.stats()
+        assert stats.rejected == 1
+        assert stats.times_opened == 1
+
+    def test_half_open_probe_success_closes(self):
+        probe = Mock()
+        breaker = CircuitBreaker(POLICY, probe=probe)
+        open_breaker(breaker)
+
+        time.sleep(POLICY.open_seconds)
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow()
+
+        probe.assert_called_once()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_probe_failure_reopens(self):
+        breaker = CircuitBreaker(POLICY)
+        open_breaker(breaker)
+        time.sleep(POLICY.open_seconds)
+
+        assert not breaker.allow(probe=Mock(side_effect=ConnectionError))
+
+        stats = breaker.stats()
+        assert stats.state == CircuitState.OPEN
+        assert stats.times_opened == 2
+
+    def test_half_open_without_probe_lets_trial_calls_through(self):
+        breaker = CircuitBreaker(POLICY)
+        open_breaker(breaker)
+        time.sleep(POLICY.open_seconds)
+
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow()
+
+    def test_failed_trial_call_reopens(self):
+        breaker = CircuitBreaker(POLICY)
+        open_breaker(breaker)
+        time.sleep(POLICY.open_seconds)
+
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_reset_closes(self):
+        breaker = CircuitBreaker(POLICY)
+        open_breaker(breaker)
+
+        breaker.reset()
+
+        assert breaker.allow()
+        assert breaker.stats().calls == 0
@@ -1,9 +1,11 @@
 from unittest.mock import Mock
 
 import pytest
+import requests
 import responses  # https://github.com/getsentry/responses
 
 from verda.exceptions import APIException
+from verda.http_client import CircuitBreakerPolicy, CircuitState
 
 INVALID_REQUEST = 'invalid_request'
 INVALID_REQUEST_MESSAGE = 'Your existence is invalid'
@@ -198,3 +200,57 @@ class TestHttpClient:
         # assert
         assert excinfo.value.code == INVALID_REQUEST
         assert excinfo.value.message == INVALID_REQUEST_MESSAGE
+
+
+class TestHttpClientCircuitBreaker:
+    @pytest.fixture
+    def http_client(self, http_client):
+        http_client._circuit_breaker_policy = CircuitBreakerPolicy(minimum_calls=2)
+        return http_client
+
+    def test_route_fails_fast_after_server_errors(self, http_client):
+        responses.add(
+            method=responses.GET,
+            url=(http_client._base_url + '/instances'),
+            status=503,
+            json={'code': 'service_unavailable', 'message': 'down'},
+        )
+        for _ in range(2):
+            with pytest.raises(APIException, match='down'):
+                http_client.get('/instances')
+
+        with pytest.raises(APIException, match='circuit breaker is open') as excinfo:
+            http_client.get('/instances/123')
+
+        assert excinfo.value.code == 'service_unavailable'
+        assert len(responses.calls) == 2
+        assert http_client.circuit_breakers['GET /instances'].state == CircuitState.OPEN
+
+    def test_routes_have_separate_breakers(self, http_client):
+        responses.add(
+            method=responses.GET,
+            url=(http_client._base_url + '/instances'),
+            body=requests.exceptions.ConnectionError('refused'),
+        )
+        responses.add(
+            method=responses.GET, url=(http_client._base_url + '/volumes'), status=200, json=[]
+        )
+        for _ in range(2):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                http_client.get('/instances')
+
+        assert http_client.get('/volumes').ok
+        assert http_client.circuit_breakers['GET /volumes'].state == CircuitState.CLOSED
+
+    def test_client_errors_keep_route_closed(self, http_client):
+        responses.add(
+            method=responses.POST,
+            url=(http_client._base_url + '/instances'),
+            status=400,
+            json={'code': INVALID_REQUEST, 'message': INVALID_REQUEST_MESSAGE},
+        )
+        for _ in range(3):
+            with pytest.raises(APIException, match=INVALID_REQUEST_MESSAGE):
+                http_client.post('/instances')
+
+        assert http_client.circuit_breakers['POST /instances'].state == CircuitState.CLOSED
@@ -0,0 +1,48 @@
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Answers with the request body, content type and transfer headers."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.send_response(200)
+        self.send_header('Content-Type', self.headers['Content-Type'])
+        self.send_header('X-Request-Length', self.headers['Content-Length'])
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except ConnectionError:
+            pass  # the client closed the response without reading it
+
+    do_PUT = do_POST
+
+    def log_message(self, *_args):
+        pass
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # tests close pooled connections the server is still waiting on for a next request
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+@pytest.fixture
+def local_endpoint():
+    """Endpoint base URL of a local server echoing request bodies over a real socket."""
+    server = _QuietHTTPServer(('127.0.0.1', 0), _EchoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}'
+    responses.add_passthru(url)
+    yield f'{url}/test-deployment'
+    server.shutdown()
+    server.server_close()
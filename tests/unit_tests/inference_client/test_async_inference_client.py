@@ -0,0 +1,261 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from verda.containers import Deployment  # noqa: E402
+from verda.inference_client import (  # noqa: E402
+    AsyncClientInferenceExecution,
+    AsyncInferenceClient,
+    AsyncInferenceResponse,
+    AsyncStatus,
+    InferenceClientError,
+    RawBody,
+)
+
+INFERENCE_KEY = 'test-inference-key'
+BASE_DOMAIN = 'https://containers.datacrunch.io'
+DEPLOYMENT_NAME = 'test-deployment'
+ENDPOINT_BASE_URL = f'{BASE_DOMAIN}/{DEPLOYMENT_NAME}'
+
+
+def make_client(handler, **kwargs) -> AsyncInferenceClient:
+    client = AsyncInferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL, **kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestAsyncInferenceClient:
+    def test_invalid_parameters(self):
+        with pytest.raises(InferenceClientError):
+            AsyncInferenceClient('', ENDPOINT_BASE_URL)
+        with pytest.raises(InferenceClientError):
+            AsyncInferenceClient(INFERENCE_KEY, 'not-a-url')
+
+    def test_pool_limits(self):
+        client = AsyncInferenceClient(
+            INFERENCE_KEY,
+            ENDPOINT_BASE_URL,
+            max_connections=7,
+            max_keepalive_connections=3,
+            keepalive_expiry=11.0,
+        )
+        pool = client._client._transport._pool
+
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 11.0
+        asyncio.run(client.aclose())
+
+    def test_run_sync(self):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={'result': 'ok'})
+
+        async def main():
+            async with make_client(handler) as client:
+                response = await client.run_sync({'prompt': 'hi'}, path='v1/completions')
+                return response, await response.output()
+
+        response, output = asyncio.run(main())
+
+        assert isinstance(response, AsyncInferenceResponse)
+        assert response.status_code == 200
+        assert output == {'result': 'ok'}
+        request = requests_seen[0]
+        assert str(request.url) == f'{ENDPOINT_BASE_URL}/v1/completions'
+        assert request.headers['Authorization'] == f'Bearer {INFERENCE_KEY}'
+        assert json.loads(request.content) == {'prompt': 'hi'}
+
+    def test_run_sync_error(self):
+        def handler(_request):
+            return httpx.Response(500, text='boom')
+
+        async def main():
+            async with make_client(handler) as client:
+                await client.run_sync({})
+
+        with pytest.raises(InferenceClientError, match='failed'):
+            asyncio.run(main())
+
+    def test_raw_body(self):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={})
+
+        async def main():
+            async with make_client(handler) as client:
+                await client.run_sync(
+                    RawBody(memoryview(bytearray(b'\x01\x02')), 'application/x-raw')
+                )
+                await client.post('generate', data=bytearray(b'{}'))
+
+        asyncio.run(main())
+
+        assert requests_seen[0].headers['Content-Type'] == 'application/x-raw'
+        assert requests_seen[0].content == b'\x01\x02'
+        assert requests_seen[1].headers['Content-Type'] == 'application/json'
+        assert requests_seen[1].content == b'{}'
+
+    def test_buffer_body_is_sent_in_slices(self):
+        requests_seen = []
+        body = bytearray(os.urandom(3 * 1024 * 1024 + 5))
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={})
+
+        async def main():
+            async with make_client(handler) as client:
+                await client.run_sync(memoryview(body))
+
+        asyncio.run(main())
+
+        assert requests_seen[0].headers['Content-Length'] == str(len(body))
+        assert 'Transfer-Encoding' not in requests_seen[0].headers
+        assert requests_seen[0].content == body
+
+    def test_stream(self):
+        def handler(_request):
+            return httpx.Response(
+                200,
+                headers={'Content-Type': 'text/event-stream'},
+                content=b'data: 1\n\ndata: 2\n\n',
+            )
+
+        async def main():
+            async with make_client(handler) as client:
+                response = await client.run_sync({}, stream=True)
+                return [line async for line in response.stream()]
+
+        assert asyncio.run(main()) == ['data: 1', 'data: 2']
+
+    def test_stream_json(self):
+        def handler(_request):
+            return httpx.Response(
+                200,
+                headers={'Content-Type': 'text/event-stream'},
+                content=b'data: {"n": 1}\n\ndata: {"n": 2}\n\ndata: [DONE]\n\n',
+            )
+
+        async def main():
+            async with make_client(handler) as client:
+                response = await client.run_sync({}, stream=True)
+                return [chunk async for chunk in response.stream_json()]
+
+        assert asyncio.run(main()) == [{'n': 1}, {'n': 2}]
+
+    def test_stream_to_buffer(self):
+        body = bytes(range(256)) * 64
+
+        def handler(_request):
+            return httpx.Response(200, content=body)
+
+        async def main(buffer):
+            async with make_client(handler) as client:
+                response = await client.run_sync({}, stream=True)
+                return await response.stream_to(buffer)
+
+        buffer = bytearray(len(body))
+        assert asyncio.run(main(buffer)) == len(body)
+        assert buffer == body
+        with pytest.raises(InferenceClientError, match='larger than the destination'):
+            asyncio.run(main(bytearray(10)))
+
+    def test_stream_to_file_object_grows_chunks(self):
+        class Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for _ in range(64):
+                    yield b'x' * 10_000
+
+        class Recorder:
+            def __init__(self):
+                self.sizes = []
+                self.data = bytearray()
+
+            def write(self, chunk):
+                self.sizes.append(len(chunk))
+                self.data += chunk
+
+        def handler(_request):
+            return httpx.Response(200, stream=Body())
+
+        async def main(out):
+            async with make_client(handler) as client:
+                response = await client.run_sync({}, stream=True)
+                return await response.stream_to(out)
+
+        out = Recorder()
+        assert asyncio.run(main(out)) == 640_000
+        assert out.data == b'x' * 640_000
+        # the same sizes as the sync stream_to: doubling while reads fill the buffer
+        assert out.sizes == [65536, 131072, 262144, 181248]
+
+    def test_run_and_poll(self):
+        def handler(request):
+            if request.url.path == f'/{DEPLOYMENT_NAME}/':
+                assert request.headers['Prefer'] == 'respond-async'
+                return httpx.Response(200, json={'Id': 'exec-1'})
+            assert request.headers[AsyncClientInferenceExecution.INFERENCE_ID_HEADER] == 'exec-1'
+            if request.url.path == f'/status/{DEPLOYMENT_NAME}':
+                return httpx.Response(200, json={'Status': 'Completed'})
+            return httpx.Response(200, json={'answer': 42})
+
+        async def main():
+            async with make_client(handler) as client:
+                execution = await client.run({'prompt': 'hi'})
+                await execution.status_json()
+                return execution, await execution.result()
+
+        execution, result = asyncio.run(main())
+
+        assert execution.id == 'exec-1'
+        assert execution.status() == AsyncStatus.Completed
+        assert result == {'answer': 42}
+
+    def test_streamed_response_release(self):
+        class Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b'x' * 1024
+
+        def handler(_request):
+            return httpx.Response(200, stream=Body())
+
+        async def main():
+            async with make_client(handler) as client:
+                async with await client.run_sync({}, stream=True) as response:
+                    assert not response.closed
+                assert response.closed
+
+                response = await client.run_sync({}, stream=True)
+                with pytest.warns(ResourceWarning, match='was not read to the end or closed'):
+                    del response
+                return client.leaked_responses
+
+        assert asyncio.run(main()) == 1
+
+    def test_deployment_creates_async_client(self):
+        deployment = Deployment.from_dict_with_inference_key(
+            {
+                'name': DEPLOYMENT_NAME,
+                'containers': [],
+                'compute': {'name': 'H100', 'size': 1},
+                'endpoint_base_url': ENDPOINT_BASE_URL,
+            },
+            INFERENCE_KEY,
+        )
+
+        client = deployment.create_async_inference_client(max_connections=5)
+
+        assert isinstance(client, AsyncInferenceClient)
+        assert client.endpoint_base_url == ENDPOINT_BASE_URL
+        assert client.inference_key == INFERENCE_KEY
+        assert deployment.inference_client.endpoint_base_url == ENDPOINT_BASE_URL
+        asyncio.run(client.aclose())
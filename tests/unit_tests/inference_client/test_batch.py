@@ -0,0 +1,138 @@
+import json
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.inference_client import (
+    BatchInferenceRunner,
+    InferenceClient,
+    InferenceClientError,
+    RetryPolicy,
+)
+
+INFERENCE_KEY = 'test-inference-key'
+ENDPOINT_BASE_URL = 'https://containers.datacrunch.io/test-deployment'
+NO_WAIT_RETRIES = RetryPolicy(max_attempts=3, backoff_seconds=0, jitter=False)
+
+
+@pytest.fixture
+def inference_client():
+    return InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+
+
+def echo_callback(request):
+    body = json.loads(request.body)
+    return 200, {'Content-Type': 'application/json'}, json.dumps({'echo': body['i']})
+
+
+def read_output(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestBatchInferenceRunner:
+    def test_run_jsonl_ordered(self, inference_client, tmp_path):
+        # arrange
+        responses.add_callback(responses.POST, f'{ENDPOINT_BASE_URL}/v1/embed', echo_callback)
+        inputs = tmp_path / 'inputs.jsonl'
+        inputs.write_text('\n'.join(json.dumps({'i': i}) for i in range(20)) + '\n')
+        output = tmp_path / 'outputs.jsonl'
+
+        # act
+        runner = BatchInferenceRunner(inference_client, path='v1/embed', concurrency=4)
+        report = runner.run(inputs, output)
+
+        # assert
+        records = read_output(output)
+        assert [r['index'] for r in records] == list(range(20))
+        assert [r['output'] for r in records] == [{'echo': i} for i in range(20)]
+        assert report.total == 20
+        assert report.succeeded == 20
+        assert report.failed == 0
+        assert report.latency.count == 20
+        assert report.throughput > 0
+
+    def test_unordered_with_request_fn(self, inference_client, tmp_path):
+        output = tmp_path / 'outputs.jsonl'
+
+        runner = BatchInferenceRunner(
+            inference_client, concurrency=3, ordered=False, request_fn=lambda d: d['i'] * 2
+        )
+        report = runner.run(({'i': i} for i in range(10)), output)
+
+        records = read_output(output)
+        assert sorted((r['index'], r['output']) for r in records) == [(i, i * 2) for i in range(10)]
+        assert report.succeeded == 10
+
+    def test_retries_then_fails(self, inference_client, tmp_path):
+        calls = []
+
+        def flaky(data):
+            calls.append(data)
+            if data['i'] == 1:
+                raise InferenceClientError('unavailable', status_code=503)
+            if data['i'] == 2 and len([c for c in calls if c['i'] == 2]) < 2:
+                raise InferenceClientError('timed out')
+            return data['i']
+
+        output = tmp_path / 'outputs.jsonl'
+        runner = BatchInferenceRunner(
+            inference_client, concurrency=1, retry_policy=NO_WAIT_RETRIES, request_fn=flaky
+        )
+        report = runner.run([{'i': 0}, {'i': 1}, {'i': 2}], output)
+
+        records = read_output(output)
+        assert records[1]['error'] == 'unavailable'
+        assert records[2]['output'] == 2
+        assert report.succeeded == 2
+        assert report.failed == 1
+        assert report.retries == 3
+
+    def test_non_retryable_status(self, inference_client, tmp_path):
+        calls = []
+
+        def bad_request(data):
+            calls.append(data)
+            raise InferenceClientError('bad request', status_code=400)
+
+        runner = BatchInferenceRunner(
+            inference_client, retry_policy=NO_WAIT_RETRIES, request_fn=bad_request
+        )
+        report = runner.run([{'i': 0}], tmp_path / 'outputs.jsonl')
+
+        assert len(calls) == 1
+        assert report.failed == 1
+
+    def test_resume_from_checkpoint(self, inference_client, tmp_path):
+        # arrange - first run fails on odd items
+        output = tmp_path / 'outputs.jsonl'
+        checkpoint = tmp_path / 'outputs.ckpt'
+        inputs = [{'i': i} for i in range(6)]
+
+        def odd_fails(data):
+            if data['i'] % 2:
+                raise ValueError('crashed')
+            return data['i']
+
+        first = BatchInferenceRunner(inference_client, request_fn=odd_fails)
+        first.run(inputs, output, checkpoint_path=checkpoint)
+
+        # act - resumed run only resends the items that did not complete
+        sent = []
+
+        def record(data):
+            sent.append(data['i'])
+            return data['i']
+
+        second = BatchInferenceRunner(inference_client, request_fn=record)
+        report = second.run(inputs, output, checkpoint_path=checkpoint)
+
+        # assert
+        assert sorted(sent) == [1, 3, 5]
+        assert report.skipped == 3
+        assert report.succeeded == 3
+        assert checkpoint.read_text().split() == ['0', '2', '4', '1', '3', '5']
+
+    def test_invalid_concurrency(self, inference_client):
+        with pytest.raises(ValueError, match='concurrency'):
+            BatchInferenceRunner(inference_client, concurrency=0)
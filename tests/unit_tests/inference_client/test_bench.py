@@ -0,0 +1,173 @@
+import csv
+import json
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.inference_client import (
+    InferenceBenchmark,
+    InferenceClient,
+    InferenceClientError,
+    PollingPolicy,
+    RequestTemplate,
+)
+from verda.inference_client.bench import main
+
+INFERENCE_KEY = 'test-inference-key'
+BASE_DOMAIN = 'https://containers.datacrunch.io'
+ENDPOINT_BASE_URL = f'{BASE_DOMAIN}/test-deployment'
+GENERATE_URL = f'{ENDPOINT_BASE_URL}/generate'
+
+
+@pytest.fixture
+def inference_client():
+    return InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+
+
+class TestRequestTemplate:
+    def test_render_cycles_payloads_and_substitutes_index(self):
+        template = RequestTemplate([{'prompt': 'a {{index}}', 'n': 1}, {'tags': ['{{index}}']}])
+
+        assert template.render(0) == {'prompt': 'a 0', 'n': 1}
+        assert template.render(1) == {'tags': ['1']}
+        assert template.render(2) == {'prompt': 'a 2', 'n': 1}
+
+    def test_from_jsonl_file(self, tmp_path):
+        path = tmp_path / 'payloads.jsonl'
+        path.write_text('{"prompt": "a"}\n\n{"prompt": "b"}\n')
+
+        template = RequestTemplate.from_file(path, path='generate')
+
+        assert template.payloads == [{'prompt': 'a'}, {'prompt': 'b'}]
+        assert template.path == 'generate'
+
+
+class TestInferenceBenchmark:
+    def test_closed_loop(self, inference_client):
+        responses.post(GENERATE_URL, json={'ok': True})
+        benchmark = InferenceBenchmark(
+            inference_client, RequestTemplate([{'prompt': '{{index}}'}], path='generate')
+        )
+
+        report = benchmark.closed_loop(concurrency=4, requests=20, warmup_requests=2)
+
+        assert report.mode == 'closed'
+        assert report.concurrency == 4
+        assert report.requests == report.succeeded == report.latency.count == 20
+        assert report.error_rate == 0.0
+        assert report.rps > 0
+        assert report.ttfb is None
+        prompts = {json.loads(call.request.body)['prompt'] for call in responses.calls}
+        assert prompts == {str(i) for i in range(22)}
+
+    def test_errors_are_counted_by_status(self, inference_client):
+        responses.post(GENERATE_URL, status=503)
+        benchmark = InferenceBenchmark(inference_client, RequestTemplate(path='generate'))
+
+        report = benchmark.closed_loop(concurrency=2, requests=6)
+
+        assert report.failed == 6
+        assert report.error_rate == 1.0
+        assert report.errors == {'503': 6}
+        assert report.latency.count == 0
+
+    def test_open_loop(self, inference_client):
+        responses.post(GENERATE_URL, json={})
+        benchmark = InferenceBenchmark(inference_client, RequestTemplate(path='generate'))
+
+        report = benchmark.open_loop(rate=500, requests=25, seed=1)
+
+        assert report.mode == 'open'
+        assert report.rate == 500
+        assert report.succeeded == 25
+        assert report.latency.p99 <= report.latency.max
+
+    def test_duration_limit(self, inference_client):
+        responses.post(GENERATE_URL, json={})
+        benchmark = InferenceBenchmark(inference_client, RequestTemplate(path='generate'))
+
+        report = benchmark.closed_loop(concurrency=2, duration_seconds=0.2)
+
+        assert report.requests > 0
+        assert report.duration_seconds >= 0.2
+
+    def test_streaming_measures_time_to_first_byte(self, inference_client):
+        responses.post(GENERATE_URL, body=b'data: hi\n\n' * 100)
+        benchmark = InferenceBenchmark(
+            inference_client, RequestTemplate(path='generate'), stream=True
+        )
+
+        report = benchmark.closed_loop(concurrency=2, requests=5)
+
+        assert report.ttfb is not None
+        assert report.ttfb.count == 5
+        assert report.ttfb.max <= report.latency.max
+
+    def test_async_requests(self, inference_client):
+        responses.post(GENERATE_URL, json={'Id': 'exec-1'})
+        responses.get(f'{BASE_DOMAIN}/status/test-deployment', json={'Status': 'Completed'})
+        responses.get(f'{BASE_DOMAIN}/result/test-deployment', json={'answer': 42})
+        benchmark = InferenceBenchmark(
+            inference_client,
+            RequestTemplate(path='generate'),
+            async_requests=True,
+            polling_policy=PollingPolicy(initial_interval_seconds=0.001, jitter=False),
+        )
+
+        report = benchmark.closed_loop(concurrency=3, requests=6)
+
+        assert report.succeeded == 6
+        submitted = [call for call in responses.calls if call.request.url == GENERATE_URL]
+        assert len(submitted) == 6
+        assert all(call.request.headers['Prefer'] == 'respond-async' for call in submitted)
+
+    def test_requires_a_limit(self, inference_client):
+        benchmark = InferenceBenchmark(inference_client)
+
+        with pytest.raises(InferenceClientError, match='Pass requests, duration_seconds'):
+            benchmark.closed_loop(concurrency=1)
+
+
+class TestBenchCommandLine:
+    def test_concurrency_sweep_with_exports(self, tmp_path, capsys):
+        responses.post(GENERATE_URL, json={})
+        json_path = tmp_path / 'curve.json'
+        csv_path = tmp_path / 'curve.csv'
+
+        reports = main(
+            [
+                ENDPOINT_BASE_URL,
+                '--inference-key',
+                INFERENCE_KEY,
+                '--path',
+                'generate',
+                '--data',
+                '{"prompt": "hi {{index}}"}',
+                '--header',
+                'X-Test: 1',
+                '--concurrency',
+                '1,2',
+                '--requests',
+                '4',
+                '--json',
+                str(json_path),
+                '--csv',
+                str(csv_path),
+            ]
+        )
+
+        assert [report.concurrency for report in reports] == [1, 2]
+        assert responses.calls[0].request.headers['X-Test'] == '1'
+        assert 'concurrency=2: 4 requests' in capsys.readouterr().out
+        exported = json.loads(json_path.read_text())
+        assert [report['requests'] for report in exported] == [4, 4]
+        with open(csv_path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert [row['concurrency'] for row in rows] == ['1', '2']
+        assert float(rows[0]['latency_p50']) > 0
+
+    def test_requires_inference_key(self, monkeypatch):
+        monkeypatch.delenv('VERDA_INFERENCE_KEY', raising=False)
+
+        with pytest.raises(SystemExit):
+            main([ENDPOINT_BASE_URL])
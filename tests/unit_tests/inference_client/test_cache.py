@@ -0,0 +1,223 @@
+import time
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.inference_client import (
+    CachedInferenceClient,
+    InferenceCache,
+    InferenceClient,
+    InferenceClientError,
+    RawBody,
+    StreamingBody,
+    cache_key,
+)
+
+INFERENCE_KEY = 'test-inference-key'
+ENDPOINT_BASE_URL = 'https://containers.datacrunch.io/test-deployment'
+URL = f'{ENDPOINT_BASE_URL}/v1/embeddings'
+KEY_A = 'a' * 64
+KEY_B = 'b' * 64
+
+
+@pytest.fixture
+def cached_client():
+    return CachedInferenceClient(InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL))
+
+
+class TestCacheKey:
+    def test_dict_key_order_is_ignored(self):
+        assert cache_key('POST', 'v1', {'a': 1, 'b': 2}) == cache_key(
+            'post', '/v1', {'b': 2, 'a': 1}
+        )
+
+    def test_body_and_selected_headers_are_part_of_the_key(self):
+        base = cache_key('POST', 'v1', {'a': 1}, {'X-Model': 'm1', 'X-Trace': '1'}, ['x-model'])
+
+        assert base == cache_key(
+            'POST', 'v1', {'a': 1}, {'x-model': 'm1', 'X-Trace': '2'}, ['X-Model']
+        )
+        assert base != cache_key('POST', 'v1', {'a': 1}, {'X-Model': 'm2'}, ['x-model'])
+        assert base != cache_key('POST', 'v1', {'a': 2}, {'X-Model': 'm1'}, ['x-model'])
+        assert cache_key('POST', 'v1', b'{}') != cache_key('POST', 'v1', '{}')
+
+    def test_endpoint_is_part_of_the_key(self):
+        key = cache_key('POST', 'v1', {'a': 1}, endpoint_base_url='https://a.example/one')
+
+        assert key != cache_key('POST', 'v1', {'a': 1}, endpoint_base_url='https://a.example/two')
+        assert key == cache_key('POST', 'v1', {'a': 1}, endpoint_base_url='https://a.example/one/')
+
+
+class TestInferenceCache:
+    def test_lru_eviction(self):
+        cache = InferenceCache(max_entries=2)
+        cache.put('a', 200, 'OK', {}, b'a')
+        cache.put('b', 200, 'OK', {}, b'b')
+        cache.get('a')
+        cache.put('c', 200, 'OK', {}, b'c')
+
+        assert cache.get('b') is None
+        assert cache.get('a').body == b'a'
+        assert cache.get('c').body == b'c'
+        assert cache.stats.evictions == 1
+
+    def test_max_bytes(self):
+        cache = InferenceCache(max_bytes=10)
+        cache.put('a', 200, 'OK', {}, b'x' * 6)
+        cache.put('b', 200, 'OK', {}, b'x' * 6)
+
+        assert len(cache) == 1
+        assert cache.get('b') is not None
+
+    def test_ttl(self):
+        cache = InferenceCache(ttl_seconds=0.01)
+        cache.put('a', 200, 'OK', {}, b'a')
+        time.sleep(0.02)
+
+        assert cache.get('a') is None
+        assert cache.stats.expirations == 1
+
+    def test_disk_tier(self, tmp_path):
+        cache = InferenceCache(max_entries=1, disk_path=tmp_path)
+        cache.put(KEY_A, 200, 'OK', {'Content-Type': 'application/json'}, b'{"a": 1}')
+        cache.put(KEY_B, 200, 'OK', {}, b'b')
+
+        entry = cache.get(KEY_A)
+
+        assert entry.body == b'{"a": 1}'
+        assert entry.headers == {'Content-Type': 'application/json'}
+        assert cache.stats.disk_hits == 1
+        # a new cache over the same directory sees entries evicted to disk
+        reopened = InferenceCache(disk_path=tmp_path)
+        assert reopened.get(KEY_B).body == b'b'
+
+    def test_disk_index_skips_interrupted_writes(self, tmp_path):
+        (tmp_path / f'{KEY_A}.tmp').write_bytes(b'partial')
+
+        cache = InferenceCache(disk_path=tmp_path)
+
+        assert cache.get(f'{KEY_A}.tmp') is None
+        assert cache.get(KEY_A) is None
+        assert cache.stats.disk_hits == 0
+
+    def test_clear_leaves_unrelated_files(self, tmp_path):
+        (tmp_path / 'notes.txt').write_text('keep me')
+        cache = InferenceCache(max_entries=1, disk_path=tmp_path)
+        cache.put(KEY_A, 200, 'OK', {}, b'a')
+        cache.put(KEY_B, 200, 'OK', {}, b'b')
+
+        cache.clear()
+
+        assert [path.name for path in tmp_path.iterdir()] == ['notes.txt']
+
+    def test_failed_disk_write_drops_entry(self, tmp_path, monkeypatch):
+        cache = InferenceCache(max_entries=1, disk_path=tmp_path)
+
+        def disk_full(*_args, **_kwargs):
+            raise OSError(28, 'No space left on device')
+
+        monkeypatch.setattr('builtins.open', disk_full)
+        cache.put(KEY_A, 200, 'OK', {}, b'a')
+        cache.put(KEY_B, 200, 'OK', {}, b'b')
+        monkeypatch.undo()
+
+        assert cache.get(KEY_B).body == b'b'
+        assert cache.get(KEY_A) is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_disk_max_bytes(self, tmp_path):
+        cache = InferenceCache(max_entries=1, disk_path=tmp_path, disk_max_bytes=200)
+        for key in 'abcd':
+            cache.put(key * 64, 200, 'OK', {}, b'x' * 100)
+
+        assert len(list(tmp_path.iterdir())) == 1
+        assert cache.get(KEY_A) is None
+        assert cache.get('c' * 64) is not None
+
+
+class TestCachedInferenceClient:
+    @responses.activate
+    def test_run_sync_hits_cache(self, cached_client):
+        responses.post(URL, json={'embedding': [0.1, 0.2]}, status=200)
+
+        first = cached_client.run_sync({'input': 'hi', 'model': 'm'}, path='v1/embeddings')
+        second = cached_client.run_sync({'model': 'm', 'input': 'hi'}, path='v1/embeddings')
+
+        assert len(responses.calls) == 1
+        assert first.output() == second.output() == {'embedding': [0.1, 0.2]}
+        assert second.status_code == 200
+        assert second.headers['Content-Type'] == 'application/json'
+        assert cached_client.stats.hits == 1
+        assert cached_client.stats.misses == 1
+        assert cached_client.stats.hit_rate == 0.5
+
+    @responses.activate
+    def test_stream_bypasses_cache(self, cached_client):
+        responses.post(URL, body=b'data', status=200)
+
+        cached_client.run_sync({}, path='v1/embeddings', stream=True)
+        cached_client.run_sync({}, path='v1/embeddings', stream=True)
+
+        assert len(responses.calls) == 2
+        assert cached_client.stats.misses == 0
+
+    @responses.activate
+    def test_errors_are_not_cached(self, cached_client):
+        responses.post(URL, body='boom', status=500)
+
+        for _ in range(2):
+            with pytest.raises(InferenceClientError):
+                cached_client.run_sync({}, path='v1/embeddings')
+
+        assert len(responses.calls) == 2
+        assert len(cached_client.cache) == 0
+
+    @responses.activate
+    def test_post(self, cached_client):
+        responses.post(URL, json={'ok': True}, status=200)
+
+        cached_client.post('v1/embeddings', json={'input': 'a'})
+        response = cached_client.post('v1/embeddings', json={'input': 'a'})
+        cached_client.post('v1/embeddings', json={'input': 'b'})
+
+        assert response.json() == {'ok': True}
+        assert response.url == URL
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_deployments_sharing_a_cache_are_kept_apart(self):
+        other_url = 'https://containers.datacrunch.io/other-deployment/v1/embeddings'
+        responses.post(URL, json={'model': 'one'})
+        responses.post(other_url, json={'model': 'two'})
+        cache = InferenceCache()
+        one = CachedInferenceClient(InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL), cache)
+        two = CachedInferenceClient(
+            InferenceClient(INFERENCE_KEY, 'https://containers.datacrunch.io/other-deployment'),
+            cache,
+        )
+
+        assert one.run_sync({'input': 'a'}, 'v1/embeddings').output() == {'model': 'one'}
+        assert two.run_sync({'input': 'a'}, 'v1/embeddings').output() == {'model': 'two'}
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_post_raw_bodies(self, cached_client):
+        responses.post(URL, json={'ok': True})
+
+        cached_client.post('v1/embeddings', data=b'\x00\x01')
+        cached_client.post('v1/embeddings', data=bytearray(b'\x00\x01'))
+        cached_client.post('v1/embeddings', data=RawBody(b'\x00\x01'))
+        cached_client.post('v1/embeddings', data=b'\x00\x01', params={'n': 2})
+
+        # bytes and bytearray hash alike, the RawBody content type and the query differ
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_unhashable_bodies_bypass_cache(self, cached_client):
+        responses.post(URL, json={'ok': True})
+
+        for _ in range(2):
+            cached_client.run_sync(StreamingBody(iter([b'a', b'b'])), 'v1/embeddings')
+
+        assert len(responses.calls) == 2
+        assert len(cached_client.cache) == 0
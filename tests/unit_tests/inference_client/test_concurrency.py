@@ -0,0 +1,215 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.inference_client import (
+    AdaptiveConcurrencyInferenceClient,
+    AdaptiveConcurrencyLimit,
+    InferenceClient,
+    InferenceClientError,
+)
+
+INFERENCE_KEY = 'test-inference-key'
+ENDPOINT_BASE_URL = 'https://containers.datacrunch.io/test-deployment'
+
+
+def overloaded():
+    return InferenceClientError('Too Many Requests', status_code=429)
+
+
+class TestAdaptiveConcurrencyLimit:
+    def test_limit_starts_at_capacity(self):
+        limit = AdaptiveConcurrencyLimit(replicas=3, concurrent_requests_per_replica=4)
+
+        stats = limit.stats()
+        assert stats.limit == 12
+        assert stats.capacity == 12
+
+    def test_overload_halves_limit_once_per_window(self):
+        limit = AdaptiveConcurrencyLimit(replicas=2, concurrent_requests_per_replica=8)
+        tokens = [limit.acquire() for _ in range(4)]
+
+        for token in tokens:
+            limit.release(token, overloaded())
+
+        stats = limit.stats()
+        assert stats.limit == 8
+        assert stats.overloads == 4
+        assert stats.decreases == 1
+        assert stats.in_flight == 0
+
+        limit.release(limit.acquire(), overloaded())
+        assert limit.limit == 4
+
+    def test_success_increases_limit_additively_up_to_capacity(self):
+        limit = AdaptiveConcurrencyLimit(replicas=1, concurrent_requests_per_replica=8)
+        limit.release(limit.acquire(), overloaded())
+        assert limit.limit == 4
+
+        for _ in range(5):
+            limit.release(limit.acquire())
+        assert limit.limit == 5
+
+        for _ in range(100):
+            limit.release(limit.acquire())
+        assert limit.limit == 8
+
+    def test_other_errors_leave_limit_unchanged(self):
+        limit = AdaptiveConcurrencyLimit(replicas=1, concurrent_requests_per_replica=8)
+
+        limit.release(limit.acquire(), InferenceClientError('Bad Request', status_code=400))
+        limit.release(limit.acquire(), InferenceClientError('Service Unavailable', 503))
+
+        assert limit.stats().overloads == 1
+        assert limit.limit == 4
+
+    def test_capacity_change_moves_limit(self):
+        limit = AdaptiveConcurrencyLimit(replicas=2, concurrent_requests_per_replica=4)
+        limit.release(limit.acquire(), overloaded())
+        assert limit.limit == 4
+
+        limit.set_capacity(4)
+        assert limit.limit == 12
+
+        limit.set_capacity(1, 2)
+        assert limit.limit == 2
+
+    def test_zero_replicas_allow_min_limit(self):
+        limit = AdaptiveConcurrencyLimit(replicas=0, concurrent_requests_per_replica=4)
+
+        assert limit.limit == 1
+
+    def test_acquire_times_out_when_limit_reached(self):
+        limit = AdaptiveConcurrencyLimit()
+        limit.acquire()
+
+        with pytest.raises(InferenceClientError, match='still reached'):
+            limit.acquire(timeout=0.01)
+
+    def test_release_wakes_waiting_request(self):
+        limit = AdaptiveConcurrencyLimit()
+        token = limit.acquire()
+        acquired = threading.Event()
+
+        def wait_for_slot():
+            limit.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=wait_for_slot)
+        thread.start()
+        assert not acquired.wait(0.05)
+        limit.release(token)
+        assert acquired.wait(1)
+        thread.join()
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match='decrease_factor'):
+            AdaptiveConcurrencyLimit(decrease_factor=1.0)
+        with pytest.raises(ValueError, match='min_limit'):
+            AdaptiveConcurrencyLimit(min_limit=0)
+
+
+class TestAdaptiveConcurrencyInferenceClient:
+    def test_in_flight_requests_stay_within_limit(self):
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def run_sync(*_args):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return 'ok'
+
+        inner = Mock()
+        inner.run_sync.side_effect = run_sync
+        client = AdaptiveConcurrencyInferenceClient(
+            inner, AdaptiveConcurrencyLimit(replicas=1, concurrent_requests_per_replica=3)
+        )
+
+        threads = [threading.Thread(target=client.run_sync, args=({},)) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak <= 3
+        assert client.stats.requests == 12
+        assert client.stats.in_flight == 0
+
+    def test_failed_request_releases_slot_and_reports_overload(self):
+        inner = Mock()
+        inner.run_sync.side_effect = overloaded()
+        client = AdaptiveConcurrencyInferenceClient(
+            inner, AdaptiveConcurrencyLimit(replicas=1, concurrent_requests_per_replica=4)
+        )
+
+        with pytest.raises(InferenceClientError, match='Too Many Requests'):
+            client.run_sync({})
+
+        assert client.stats.in_flight == 0
+        assert client.stats.limit == 2
+
+    @responses.activate
+    def test_streamed_response_holds_slot_until_consumed(self):
+        responses.post(ENDPOINT_BASE_URL + '/generate', body=b'a\nb\n')
+        client = AdaptiveConcurrencyInferenceClient(
+            InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+        )
+
+        response = client.run_sync({}, 'generate', stream=True)
+        assert client.stats.in_flight == 1
+
+        assert list(response.stream()) == [b'a', b'b']
+        assert client.stats.in_flight == 0
+        response.close()
+        assert client.stats.in_flight == 0
+
+    def test_from_deployment_follows_replicas(self):
+        containers = Mock()
+        containers.get_deployment_scaling_options.return_value = Mock(
+            concurrent_requests_per_replica=4
+        )
+        containers.get_deployment_replicas.return_value = [
+            Mock(status='running'),
+            Mock(status='running'),
+            Mock(status='pending'),
+        ]
+        inner = Mock()
+
+        client = AdaptiveConcurrencyInferenceClient.from_deployment(
+            containers, 'my-deployment', inner, refresh_interval_seconds=None
+        )
+        assert client.stats.limit == 8
+        assert client.stats.replicas == 2
+        containers.get_deployment_replicas.assert_called_with('my-deployment')
+
+        containers.get_deployment_replicas.return_value = [Mock(status='running')] * 5
+        client.refresh()
+        assert client.stats.limit == 20
+
+    def test_background_refresh_survives_api_errors(self):
+        capacities = iter([(1, 2), InferenceClientError('unavailable')])
+
+        def capacity_source():
+            value = next(capacities, (3, 2))
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        with AdaptiveConcurrencyInferenceClient(
+            Mock(), capacity_source=capacity_source, refresh_interval_seconds=0.01
+        ) as client:
+            assert client.stats.limit == 2
+            deadline = time.monotonic() + 2
+            while client.stats.limit != 6 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert client.stats.limit == 6
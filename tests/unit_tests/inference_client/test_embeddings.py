@@ -0,0 +1,144 @@
+import base64
+import json
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+np = pytest.importorskip('numpy')
+
+from verda.inference_client import (  # noqa: E402
+    EmbeddingBatcher,
+    InferenceClient,
+    InferenceClientError,
+    RetryPolicy,
+)
+
+INFERENCE_KEY = 'test-inference-key'
+ENDPOINT_BASE_URL = 'https://containers.datacrunch.io/test-deployment'
+EMBEDDINGS_URL = f'{ENDPOINT_BASE_URL}/v1/embeddings'
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def vector(text):
+    i = int(text[1:])
+    return [i, i + 0.5, -i]
+
+
+def embeddings_callback(request):
+    payload = json.loads(request.body)
+    data = []
+    # answer in reverse order, the batcher must place rows by index
+    for index, text in reversed(list(enumerate(payload['input']))):
+        embedding = vector(text)
+        if payload.get('encoding_format') == 'base64':
+            embedding = base64.b64encode(np.asarray(embedding, dtype='<f4').tobytes()).decode()
+        data.append({'object': 'embedding', 'index': index, 'embedding': embedding})
+    return 200, {}, json.dumps({'model': 'e5', 'data': data})
+
+
+def expected(count):
+    return np.asarray([vector(f't{i}') for i in range(count)], dtype=np.float32)
+
+
+@pytest.fixture
+def inference_client():
+    return InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+
+
+@pytest.fixture
+def endpoint():
+    responses.add_callback(responses.POST, EMBEDDINGS_URL, callback=embeddings_callback)
+
+
+@pytest.mark.usefixtures('endpoint')
+class TestEmbeddingBatcher:
+    def test_embeds_in_input_order(self, inference_client):
+        batcher = EmbeddingBatcher(inference_client, model='e5', batch_size=3, concurrency=4)
+
+        matrix = batcher.embed([f't{i}' for i in range(10)])
+
+        assert matrix.dtype == np.float32
+        np.testing.assert_array_equal(matrix, expected(10))
+        assert len(responses.calls) == 4
+        assert json.loads(responses.calls[0].request.body)['model'] == 'e5'
+
+    def test_generator_into_preallocated_array(self, inference_client):
+        out = np.zeros((7, 3), dtype=np.float32)
+        batcher = EmbeddingBatcher(inference_client, batch_size=2)
+
+        result = batcher.embed((f't{i}' for i in range(7)), out=out)
+
+        assert result is out
+        np.testing.assert_array_equal(out, expected(7))
+
+    def test_memory_mapped_npy(self, inference_client, tmp_path):
+        path = tmp_path / 'corpus.npy'
+        batcher = EmbeddingBatcher(inference_client, batch_size=4, encoding_format='base64')
+
+        matrix = batcher.embed((f't{i}' for i in range(9)), count=9, npy_path=path)
+
+        assert isinstance(matrix, np.memmap)
+        np.testing.assert_array_equal(np.load(path), expected(9))
+        assert json.loads(responses.calls[0].request.body)['encoding_format'] == 'base64'
+
+    def test_count_mismatch(self, inference_client):
+        batcher = EmbeddingBatcher(inference_client, batch_size=2, retry_policy=NO_RETRY)
+
+        with pytest.raises(InferenceClientError, match='Embedded 3 texts, expected 4'):
+            batcher.embed((f't{i}' for i in range(3)), count=4)
+        with pytest.raises(InferenceClientError, match='more than the expected 2'):
+            batcher.embed((f't{i}' for i in range(3)), count=2)
+
+    def test_requires_a_count_for_iterators(self, inference_client):
+        with pytest.raises(InferenceClientError, match='Pass count'):
+            EmbeddingBatcher(inference_client).embed(iter(['t0']))
+
+
+class TestEmbeddingBatcherErrors:
+    def test_retries_failed_batches(self, inference_client):
+        responses.post(EMBEDDINGS_URL, status=503)
+        responses.add_callback(responses.POST, EMBEDDINGS_URL, callback=embeddings_callback)
+        batcher = EmbeddingBatcher(
+            inference_client, retry_policy=RetryPolicy(backoff_seconds=0, jitter=False)
+        )
+
+        np.testing.assert_array_equal(batcher.embed(['t0', 't1']), expected(2))
+
+    def test_response_size_mismatch(self, inference_client):
+        responses.post(EMBEDDINGS_URL, json={'data': [{'index': 0, 'embedding': [1.0]}]})
+        batcher = EmbeddingBatcher(inference_client, retry_policy=NO_RETRY)
+
+        with pytest.raises(InferenceClientError, match='1 items for 2 inputs'):
+            batcher.embed(['t0', 't1'])
+
+    def test_items_without_index_are_placed_in_order(self, inference_client):
+        def callback(request):
+            texts = json.loads(request.body)['input']
+            data = [{'embedding': vector(text)} for text in texts]
+            return 200, {}, json.dumps({'data': data})
+
+        responses.add_callback(responses.POST, EMBEDDINGS_URL, callback=callback)
+        batcher = EmbeddingBatcher(inference_client, batch_size=3, retry_policy=NO_RETRY)
+
+        np.testing.assert_array_equal(batcher.embed([f't{i}' for i in range(7)]), expected(7))
+
+    def test_short_response_without_index(self, inference_client):
+        responses.post(
+            EMBEDDINGS_URL, json={'data': [{'embedding': [3.0, 3.0]}, {'embedding': [4.0, 4.0]}]}
+        )
+        batcher = EmbeddingBatcher(inference_client, retry_policy=NO_RETRY)
+
+        with pytest.raises(InferenceClientError, match='2 items for 3 inputs'):
+            batcher.embed(['t0', 't1', 't2'])
+
+    @pytest.mark.parametrize(
+        ('indices', 'message'),
+        [([0, 2], 'index 2 for 2 inputs'), ([-1, 0], 'index -1'), ([1, 1], 'repeats index 1')],
+    )
+    def test_rejects_indices_outside_the_batch(self, inference_client, indices, message):
+        data = [{'index': index, 'embedding': [1.0, 2.0]} for index in indices]
+        responses.post(EMBEDDINGS_URL, json={'data': data})
+        batcher = EmbeddingBatcher(inference_client, retry_policy=NO_RETRY)
+
+        with pytest.raises(InferenceClientError, match=message):
+            batcher.embed(['t0', 't1'])
@@ -0,0 +1,136 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from verda.inference_client import (
+    HedgedInferenceClient,
+    HedgingPolicy,
+    InferenceClientError,
+)
+
+
+class FakeInferenceClient:
+    """Answers each call after the delay given for that call number."""
+
+    def __init__(self, delays, errors=()):
+        self.delays = list(delays)
+        self.errors = set(errors)
+        self.calls = 0
+        self.responses = []
+        self._lock = threading.Lock()
+
+    def run_sync(self, *_args):
+        with self._lock:
+            call = self.calls
+            self.calls += 1
+        time.sleep(self.delays[call])
+        if call in self.errors:
+            raise InferenceClientError(f'call {call} failed')
+        response = Mock(call=call)
+        self.responses.append(response)
+        return response
+
+
+def always_hedge(**kwargs):
+    return HedgingPolicy(initial_delay_seconds=0.05, budget_ratio=1.0, **kwargs)
+
+
+class TestHedgedInferenceClient:
+    def test_fast_request_is_not_hedged(self):
+        client = FakeInferenceClient([0])
+        with HedgedInferenceClient(client, always_hedge()) as hedged:
+            response = hedged.run_sync({})
+
+        assert response.call == 0
+        assert client.calls == 1
+        assert hedged.stats.hedges_sent == 0
+
+    def test_slow_request_is_hedged_and_loser_closed(self):
+        client = FakeInferenceClient([0.5, 0])
+        with HedgedInferenceClient(client, always_hedge()) as hedged:
+            response = hedged.run_sync({})
+            stats = hedged.stats
+
+        assert response.call == 1
+        assert stats.hedges_sent == 1
+        assert stats.hedge_wins == 1
+        assert stats.win_rate == 1.0
+        time.sleep(0.6)
+        loser = next(r for r in client.responses if r.call == 0)
+        loser._original_response.close.assert_called_once()
+
+    def test_original_wins_after_hedge(self):
+        client = FakeInferenceClient([0.1, 0.5])
+        with HedgedInferenceClient(client, always_hedge()) as hedged:
+            response = hedged.run_sync({})
+
+        assert response.call == 0
+        assert hedged.stats.hedges_sent == 1
+        assert hedged.stats.hedge_wins == 0
+
+    def test_failed_original_falls_back_to_hedge(self):
+        client = FakeInferenceClient([0.1, 0.2], errors={0})
+        with HedgedInferenceClient(client, always_hedge()) as hedged:
+            assert hedged.run_sync({}).call == 1
+
+    def test_all_failed_raises_original_error(self):
+        client = FakeInferenceClient([0.1, 0.1], errors={0, 1})
+        with (
+            HedgedInferenceClient(client, always_hedge()) as hedged,
+            pytest.raises(InferenceClientError, match='call 0'),
+        ):
+            hedged.run_sync({})
+
+    def test_busy_hedge_workers_dont_delay_original(self):
+        client = FakeInferenceClient([0.05])
+        with HedgedInferenceClient(client, always_hedge(), max_workers=1) as hedged:
+            hedged._executor.submit(time.sleep, 0.5)
+            start = time.monotonic()
+            assert hedged.run_sync({}).call == 0
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 0.4
+        assert hedged._latencies[0] == pytest.approx(0.05, abs=0.04)
+
+    def test_loser_closed_when_both_succeed_together(self):
+        barrier = threading.Barrier(2, timeout=5)
+        client = FakeInferenceClient([0, 0])
+        run_sync = client.run_sync
+
+        def answer_together(*args):
+            barrier.wait()
+            return run_sync(*args)
+
+        client.run_sync = answer_together
+        with HedgedInferenceClient(client, always_hedge()) as hedged:
+            response = hedged.run_sync({})
+
+        time.sleep(0.1)
+        loser = next(r for r in client.responses if r is not response)
+        loser._original_response.close.assert_called_once()
+        response._original_response.close.assert_not_called()
+
+    def test_budget_limits_hedges(self):
+        client = FakeInferenceClient([0.1] * 4)
+        policy = HedgingPolicy(initial_delay_seconds=0.01, budget_ratio=0.5)
+        with HedgedInferenceClient(client, policy) as hedged:
+            hedged.run_sync({})  # budget 0.5, no hedge
+            hedged.run_sync({})  # budget 1.0, hedged
+            stats = hedged.stats
+
+        assert stats.requests == 2
+        assert stats.hedges_sent == 1
+        assert stats.budget_denied == 1
+
+    def test_hedge_delay_uses_latency_percentile(self):
+        policy = HedgingPolicy(percentile=90, min_samples=10, min_delay_seconds=0)
+        hedged = HedgedInferenceClient(Mock(), policy)
+        assert hedged.hedge_delay() == policy.initial_delay_seconds
+
+        for latency in range(1, 101):
+            hedged._record(latency / 100)
+
+        assert hedged.hedge_delay() == pytest.approx(0.9)
+        hedged.close()
@@ -0,0 +1,313 @@
+import array
+import gzip
+import io
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.http_client import CircuitBreaker, CircuitBreakerPolicy, CircuitState
+from verda.inference_client import InferenceClient, InferenceClientError, RawBody
+
+INFERENCE_KEY = 'test-inference-key'
+ENDPOINT_BASE_URL = 'https://containers.datacrunch.io/test-deployment'
+BINARY_URL = f'{ENDPOINT_BASE_URL}/generate'
+BODY = bytes(range(256)) * 1024  # 256 KiB, spans several chunk buffer sizes
+
+
+@pytest.fixture
+def inference_client():
+    return InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+
+
+class TestInferenceResponseBinaryStreaming:
+    @pytest.fixture(autouse=True)
+    def binary_endpoint(self):
+        responses.add(
+            responses.POST, BINARY_URL, body=BODY, content_type='application/octet-stream'
+        )
+
+    def test_stream_to_path(self, inference_client, tmp_path):
+        response = inference_client.run_sync({}, path='generate', stream=True)
+
+        written = response.stream_to(tmp_path / 'out.bin')
+
+        assert written == len(BODY)
+        assert (tmp_path / 'out.bin').read_bytes() == BODY
+
+    def test_stream_to_file_object(self, inference_client):
+        out = io.BytesIO()
+        response = inference_client.run_sync({}, path='generate', stream=True)
+
+        assert response.stream_to(out) == len(BODY)
+        assert out.getvalue() == BODY
+
+    def test_stream_to_bytearray(self, inference_client):
+        buffer = bytearray(len(BODY) + 10)
+        response = inference_client.run_sync({}, path='generate', stream=True)
+
+        written = response.stream_to(buffer)
+
+        assert written == len(BODY)
+        assert buffer[:written] == BODY
+
+    def test_stream_to_mmap(self, inference_client):
+        response = inference_client.run_sync({}, path='generate', stream=True)
+
+        with mmap.mmap(-1, len(BODY)) as buffer:
+            assert response.stream_to(buffer) == len(BODY)
+            assert buffer[:] == BODY
+
+    def test_stream_to_buffer_too_small(self, inference_client):
+        response = inference_client.run_sync({}, path='generate', stream=True)
+
+        with pytest.raises(InferenceClientError, match='larger than the destination'):
+            response.stream_to(bytearray(100))
+
+    def test_readinto_in_pieces(self, inference_client):
+        response = inference_client.run_sync({}, path='generate', stream=True)
+        buffer = memoryview(bytearray(len(BODY)))
+
+        total = 0
+        while n := response.readinto(buffer[total : total + 1000]):
+            total += n
+
+        assert total == len(BODY)
+        assert buffer.tobytes() == BODY
+
+    def test_stream_to_non_streamed_response(self, inference_client):
+        response = inference_client.run_sync({}, path='generate')
+        out = io.BytesIO()
+
+        assert response.stream_to(out) == len(BODY)
+        assert out.getvalue() == BODY
+
+
+class TestInferenceResponseCompressedStreaming:
+    def test_stream_to_gzip_body_is_decoded(self, inference_client):
+        responses.add(
+            responses.POST,
+            BINARY_URL,
+            body=gzip.compress(BODY),
+            headers={'Content-Encoding': 'gzip'},
+            content_type='application/octet-stream',
+        )
+        response = inference_client.run_sync({}, path='generate', stream=True)
+        out = io.BytesIO()
+
+        assert response.stream_to(out) == len(BODY)
+        assert out.getvalue() == BODY
+
+
+class TestInferenceClientThreadSafety:
+    def test_concurrent_global_header_updates(self, inference_client):
+        def update(i):
+            inference_client.set_global_header(f'X-Header-{i}', str(i))
+            assert 'Authorization' in inference_client._build_request_headers()
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            list(pool.map(update, range(200)))
+
+        headers = inference_client.global_headers
+        assert all(headers[f'X-Header-{i}'] == str(i) for i in range(200))
+
+    def test_remove_global_header(self, inference_client):
+        inference_client.set_global_headers({'X-A': '1', 'X-B': '2'})
+        inference_client.remove_global_header('X-A')
+        inference_client.remove_global_header('X-Missing')
+
+        assert 'X-A' not in inference_client.global_headers
+        assert inference_client.global_headers['X-B'] == '2'
+
+
+class TestInferenceClientConnectionPool:
+    def test_pool_configuration(self):
+        client = InferenceClient(
+            INFERENCE_KEY, ENDPOINT_BASE_URL, pool_connections=2, pool_maxsize=64, pool_block=True
+        )
+        adapter = client._session.get_adapter(ENDPOINT_BASE_URL)
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_block is True
+
+    def test_keep_alive_disabled(self):
+        client = InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL, keep_alive=False)
+
+        assert client._session.headers['Connection'] == 'close'
+
+    def test_pool_stats(self, local_endpoint):
+        client = InferenceClient(INFERENCE_KEY, local_endpoint, pool_maxsize=8)
+        assert client.pool_stats() == []
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: client.run_sync({}), range(40)))
+        stats = client.pool_stats()
+
+        assert len(stats) == 1
+        assert stats[0].host == '127.0.0.1'
+        assert stats[0].maxsize == 8
+        assert stats[0].in_use == 0
+        assert stats[0].requests == 40
+        assert 1 <= stats[0].idle == stats[0].connections_created <= 8
+
+
+class TestPreEncodedBodies:
+    def test_raw_body_sets_content_type(self, inference_client):
+        responses.post(BINARY_URL, body=b'ok')
+
+        inference_client.run_sync(RawBody(b'\x00\x01', 'application/x-tensor'), path='generate')
+
+        request = responses.calls[0].request
+        assert request.headers['Content-Type'] == 'application/x-tensor'
+        assert request.body == b'\x00\x01'
+
+    def test_json_bytes_keep_json_content_type(self, inference_client):
+        responses.post(BINARY_URL, json={'ok': True})
+
+        inference_client.run_sync(b'{"prompt": "hi"}', path='generate')
+
+        request = responses.calls[0].request
+        assert request.headers['Content-Type'] == 'application/json'
+        assert request.body == b'{"prompt": "hi"}'
+
+    def test_explicit_content_type_header_wins(self, inference_client):
+        responses.post(BINARY_URL, body=b'ok')
+
+        inference_client.post(
+            'generate', data=RawBody(b'x'), headers={'content-type': 'application/custom'}
+        )
+
+        assert responses.calls[0].request.headers['Content-Type'] == 'application/custom'
+
+    def test_run_with_raw_body(self, inference_client):
+        responses.post(f'{ENDPOINT_BASE_URL}/', json={'Id': 'exec-1'})
+
+        execution = inference_client.run(RawBody.json('{"prompt": "hi"}'))
+
+        assert execution.id == 'exec-1'
+        assert responses.calls[0].request.body == b'{"prompt": "hi"}'
+
+    def test_msgpack_round_trip(self, inference_client):
+        msgpack = pytest.importorskip('msgpack')
+        payload = {'inputs': [1, 2, 3], 'blob': b'\x00\xff'}
+        responses.post(
+            BINARY_URL, body=msgpack.packb({'outputs': [4, 5]}), content_type='application/msgpack'
+        )
+
+        response = inference_client.run_sync(RawBody.msgpack(payload), path='generate')
+
+        request = responses.calls[0].request
+        assert request.headers['Content-Type'] == 'application/msgpack'
+        assert msgpack.unpackb(request.body) == payload
+        assert response.output() == {'outputs': [4, 5]}
+
+    def test_memoryview_body_over_socket(self, local_endpoint):
+        client = InferenceClient(INFERENCE_KEY, local_endpoint)
+        values = array.array('f', range(100_000))
+
+        response = client.run_sync(RawBody(memoryview(values)))
+
+        assert response.headers['Content-Type'] == 'application/octet-stream'
+        assert array.array('f', response._original_response.content) == values
+
+
+class TestStreamedResponseRelease:
+    PAYLOAD = b'x' * (1024 * 1024)
+
+    @pytest.fixture
+    def client(self, local_endpoint):
+        return InferenceClient(INFERENCE_KEY, local_endpoint, pool_maxsize=2)
+
+    def test_context_manager_releases_unread_body(self, client):
+        with client.run_sync(self.PAYLOAD, stream=True) as response:
+            assert client.pool_stats()[0].in_use == 1
+
+        assert response.closed
+        assert client.pool_stats()[0].in_use == 0
+
+    def test_early_stop_releases_connection(self, client):
+        response = client.run_sync(self.PAYLOAD, stream=True)
+        for _chunk in response.stream(chunk_size=1024, as_text=False):
+            break
+
+        assert response.closed
+        assert client.pool_stats()[0].in_use == 0
+
+    def test_full_consumption_releases_connection(self, client):
+        response = client.run_sync(self.PAYLOAD, stream=True)
+        buffer = bytearray(64 * 1024)
+        total = 0
+        while n := response.readinto(buffer):
+            total += n
+
+        assert total == len(self.PAYLOAD)
+        assert response.closed
+        assert client.pool_stats()[0].in_use == 0
+
+    def test_leaked_response_is_reported_and_released(self, client):
+        response = client.run_sync(self.PAYLOAD, stream=True)
+
+        with pytest.warns(ResourceWarning, match='was not read to the end or closed'):
+            del response
+
+        assert client.leaked_responses == 1
+        assert client.pool_stats()[0].in_use == 0
+
+    def test_read_responses_are_not_reported(self, client):
+        client.run_sync(self.PAYLOAD, stream=True).stream_to(io.BytesIO())
+        client.run_sync(self.PAYLOAD)
+
+        assert client.leaked_responses == 0
+
+
+class TestInferenceClientCircuitBreaker:
+    POLICY = CircuitBreakerPolicy(minimum_calls=2, open_seconds=60)
+
+    @pytest.fixture
+    def breaker(self):
+        return CircuitBreaker(self.POLICY)
+
+    @pytest.fixture
+    def client(self, breaker):
+        return InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL, circuit_breaker=breaker)
+
+    def test_fails_fast_after_endpoint_failures(self, client, breaker):
+        responses.post(BINARY_URL, status=502)
+        for _ in range(2):
+            with pytest.raises(InferenceClientError, match='502'):
+                client.run_sync({}, 'generate')
+
+        with pytest.raises(InferenceClientError, match='failed fast'):
+            client.run_sync({}, 'generate')
+
+        assert len(responses.calls) == 2
+        assert breaker.state == CircuitState.OPEN
+
+    def test_client_errors_do_not_open(self, client, breaker):
+        responses.post(BINARY_URL, status=422)
+        for _ in range(3):
+            with pytest.raises(InferenceClientError, match='422'):
+                client.run_sync({}, 'generate')
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_probes_health(self, client, breaker):
+        responses.post(BINARY_URL, status=503)
+        health = responses.get(f'{ENDPOINT_BASE_URL}/health', status=200)
+        for _ in range(2):
+            with pytest.raises(InferenceClientError, match='503'):
+                client.run_sync({}, 'generate')
+        breaker._opened_at -= self.POLICY.open_seconds
+        responses.replace(responses.POST, BINARY_URL, json={'ok': True})
+
+        assert client.run_sync({}, 'generate').output() == {'ok': True}
+        assert health.call_count == 1
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_health_bypasses_open_breaker(self, client, breaker):
+        responses.get(f'{ENDPOINT_BASE_URL}/health', status=200)
+        breaker._open()
+
+        assert client.health().ok
@@ -0,0 +1,145 @@
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.inference_client import (
+    AsyncExecutionScheduler,
+    ExecutionJournal,
+    InferenceClient,
+    InferenceClientError,
+    PollingPolicy,
+    cache_key,
+)
+
+BASE_DOMAIN = 'https://containers.datacrunch.io'
+ENDPOINT_BASE_URL = f'{BASE_DOMAIN}/test-deployment'
+RUN_URL = f'{ENDPOINT_BASE_URL}/v1/completions'
+STATUS_URL = f'{BASE_DOMAIN}/status/test-deployment'
+RESULT_URL = f'{BASE_DOMAIN}/result/test-deployment'
+
+
+@pytest.fixture
+def client():
+    return InferenceClient('test-inference-key', ENDPOINT_BASE_URL)
+
+
+@pytest.fixture
+def scheduler():
+    policy = PollingPolicy(initial_interval_seconds=0.001, max_interval_seconds=0.01, jitter=False)
+    with AsyncExecutionScheduler(policy) as scheduler:
+        yield scheduler
+
+
+@pytest.fixture
+def journal(tmp_path):
+    with ExecutionJournal(tmp_path / 'executions.db') as journal:
+        yield journal
+
+
+class TestExecutionJournal:
+    def test_submit_records_status_and_result(self, journal, client, scheduler):
+        responses.post(RUN_URL, json={'Id': 'exec-1'})
+        responses.get(STATUS_URL, json={'Status': 'Inference'})
+        responses.get(STATUS_URL, json={'Status': 'Completed'})
+        responses.get(RESULT_URL, json={'answer': 42})
+
+        future = journal.submit(
+            client, {'prompt': 'hi'}, path='v1/completions', scheduler=scheduler
+        )
+
+        assert future.result(timeout=5) == {'answer': 42}
+        scheduler.close()  # wait for the done callbacks
+        entry = journal.get('exec-1')
+        assert entry.status == 'Completed'
+        assert entry.path == 'v1/completions'
+        assert entry.endpoint_base_url == ENDPOINT_BASE_URL
+        assert not entry.is_pending
+        assert journal.result('exec-1') == {'answer': 42}
+
+    def test_completed_payload_is_not_resubmitted(self, journal, client, scheduler):
+        responses.post(RUN_URL, json={'Id': 'exec-1'})
+        responses.get(STATUS_URL, json={'Status': 'Completed'})
+        responses.get(RESULT_URL, json={'answer': 42})
+        journal.submit(client, {'a': 1, 'b': 2}, 'v1/completions', scheduler=scheduler).result(5)
+        scheduler.close()
+
+        future = journal.submit(client, {'b': 2, 'a': 1}, 'v1/completions')
+
+        assert future.result(timeout=0) == {'answer': 42}
+        assert len([c for c in responses.calls if c.request.method == 'POST']) == 1
+        assert len(journal.entries()) == 1
+
+    def test_resume_after_restart(self, tmp_path, client, scheduler):
+        responses.post(RUN_URL, json={'Id': 'exec-1'})
+        path = tmp_path / 'executions.db'
+        with ExecutionJournal(path) as journal:
+            execution = client.run({'prompt': 'hi'}, 'v1/completions')
+            journal.record(execution, 'hash', 'v1/completions')
+        responses.get(STATUS_URL, json={'Status': 'Completed'})
+        responses.get(RESULT_URL, json={'answer': 42})
+
+        with ExecutionJournal(path) as journal:
+            assert [e.id for e in journal.entries(pending_only=True)] == ['exec-1']
+            futures = journal.resume(client, scheduler)
+            assert futures['exec-1'].result(timeout=5) == {'answer': 42}
+            scheduler.close()
+            assert journal.entries(pending_only=True) == []
+
+    def test_resume_keeps_submission_time(self, tmp_path, client):
+        responses.post(RUN_URL, json={'Id': 'exec-1'})
+        responses.get(STATUS_URL, json={'Status': 'Queue'})
+        path = tmp_path / 'executions.db'
+        with ExecutionJournal(path) as journal:
+            execution = client.run({'prompt': 'hi'}, 'v1/completions')
+            execution.submitted_at -= 120
+            journal.record(execution, 'hash', 'v1/completions')
+
+        policy = PollingPolicy(initial_interval_seconds=0.001, jitter=False)
+        with (
+            ExecutionJournal(path) as journal,
+            AsyncExecutionScheduler(policy, queue_ttl_seconds=60) as scheduler,
+        ):
+            future = journal.resume(client, scheduler)['exec-1']
+            with pytest.raises(InferenceClientError, match='still queued'):
+                future.result(timeout=5)
+
+    def test_pending_payload_is_polled_not_resubmitted(self, journal, client, scheduler):
+        responses.post(RUN_URL, json={'Id': 'exec-1'})
+        execution = client.run({'prompt': 'hi'}, 'v1/completions')
+        journal.record(execution, cache_key('POST', 'v1/completions', {'prompt': 'hi'}))
+        responses.get(STATUS_URL, json={'Status': 'Completed'})
+        responses.get(RESULT_URL, json={'answer': 1})
+
+        future = journal.submit(client, {'prompt': 'hi'}, 'v1/completions', scheduler=scheduler)
+
+        assert future.result(timeout=5) == {'answer': 1}
+        assert len([c for c in responses.calls if c.request.method == 'POST']) == 1
+
+    def test_failed_execution_is_recorded_and_resubmitted(self, journal, client):
+        responses.post(RUN_URL, json={'Id': 'exec-1'})
+        responses.get(STATUS_URL, json={'Status': 'Queue'})
+        policy = PollingPolicy(initial_interval_seconds=0.001, jitter=False)
+        with AsyncExecutionScheduler(policy, queue_ttl_seconds=0.01) as scheduler:
+            future = journal.submit(client, {}, 'v1/completions', scheduler=scheduler)
+            with pytest.raises(InferenceClientError, match='still queued'):
+                future.result(timeout=5)
+
+        assert 'still queued' in journal.get('exec-1').error
+        assert journal.entries(pending_only=True) == []
+        responses.post(RUN_URL, json={'Id': 'exec-2'})
+        with AsyncExecutionScheduler(policy) as scheduler:
+            journal.submit(client, {}, 'v1/completions', scheduler=scheduler)
+        assert journal.get('exec-2') is not None
+
+    def test_closing_journal_does_not_fail_pending_executions(self, tmp_path, client, scheduler):
+        responses.post(RUN_URL, json={'Id': 'exec-1'})
+        responses.get(STATUS_URL, json={'Status': 'Inference'})
+        responses.get(STATUS_URL, json={'Status': 'Completed'})
+        responses.get(RESULT_URL, json={'answer': 42})
+        path = tmp_path / 'executions.db'
+        with ExecutionJournal(path) as journal:
+            future = journal.submit(client, {}, 'v1/completions', scheduler=scheduler)
+
+        assert future.result(timeout=5) == {'answer': 42}
+        scheduler.close()
+        with ExecutionJournal(path) as journal:
+            assert [e.id for e in journal.entries(pending_only=True)] == ['exec-1']
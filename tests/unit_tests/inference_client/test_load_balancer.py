@@ -0,0 +1,128 @@
+from unittest.mock import Mock
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.containers import Deployment
+from verda.inference_client import (
+    InferenceClientError,
+    LoadBalancedInferenceClient,
+    LoadBalancingStrategy,
+)
+
+INFERENCE_KEY = 'test-inference-key'
+BASE_DOMAIN = 'https://containers.datacrunch.io'
+
+
+def make_client(name):
+    client = Mock()
+    client.endpoint_base_url = f'{BASE_DOMAIN}/{name}'
+    client.run_sync.return_value = name
+    return client
+
+
+def make_deployment(name):
+    return Deployment.from_dict_with_inference_key(
+        {
+            'name': name,
+            'containers': [
+                {
+                    'image': 'nginx',
+                    'exposed_port': 80,
+                    'healthcheck': {'enabled': True, 'port': 80, 'path': '/ready'},
+                }
+            ],
+            'compute': {'name': 'H100', 'size': 1},
+            'endpoint_base_url': f'{BASE_DOMAIN}/{name}',
+        },
+        INFERENCE_KEY,
+    )
+
+
+class TestLoadBalancedInferenceClient:
+    def test_requires_clients(self):
+        with pytest.raises(ValueError, match='At least one'):
+            LoadBalancedInferenceClient([])
+
+    def test_prefers_lower_latency(self):
+        fast, slow = make_client('fast'), make_client('slow')
+        balancer = LoadBalancedInferenceClient([fast, slow])
+        fast_endpoint, slow_endpoint = balancer._endpoints
+        fast_endpoint.ewma, slow_endpoint.ewma = 0.1, 1.0
+
+        assert {balancer.run_sync({}) for _ in range(10)} == {'fast'}
+
+    def test_outstanding_requests_spill_over(self):
+        fast, slow = make_client('fast'), make_client('slow')
+        balancer = LoadBalancedInferenceClient([fast, slow])
+        fast_endpoint, slow_endpoint = balancer._endpoints
+        fast_endpoint.ewma, slow_endpoint.ewma = 0.1, 0.3
+        fast_endpoint.outstanding = 5
+
+        assert balancer.run_sync({}) == 'slow'
+
+    def test_least_outstanding(self):
+        a, b = make_client('a'), make_client('b')
+        balancer = LoadBalancedInferenceClient(
+            [a, b], strategy=LoadBalancingStrategy.LEAST_OUTSTANDING
+        )
+        balancer._endpoints[0].outstanding = 1
+
+        assert balancer.run_sync({}) == 'b'
+
+    def test_failures_eject_endpoint(self):
+        bad, good = make_client('bad'), make_client('good')
+        bad.run_sync.side_effect = InferenceClientError('unavailable', status_code=503)
+        balancer = LoadBalancedInferenceClient([bad, good], max_consecutive_failures=2)
+        balancer._endpoints[1].outstanding = 100  # force traffic to the bad endpoint
+
+        for _ in range(2):
+            with pytest.raises(InferenceClientError):
+                balancer.run_sync({})
+
+        stats = balancer.endpoint_stats()
+        assert stats[0].healthy is False
+        assert stats[0].failures == 2
+        assert balancer.run_sync({}) == 'good'
+
+    def test_client_errors_do_not_eject(self):
+        client = make_client('a')
+        client.run_sync.side_effect = InferenceClientError('bad request', status_code=400)
+        balancer = LoadBalancedInferenceClient([client], max_consecutive_failures=1)
+
+        with pytest.raises(InferenceClientError):
+            balancer.run_sync({})
+
+        assert balancer.endpoint_stats()[0].healthy is True
+
+    def test_health_checks_eject_and_reinstate(self):
+        a, b = make_client('a'), make_client('b')
+        a.health.side_effect = InferenceClientError('Health check failed')
+        balancer = LoadBalancedInferenceClient([a, b])
+
+        balancer.check_health()
+        assert [s.healthy for s in balancer.endpoint_stats()] == [False, True]
+
+        a.health.side_effect = None
+        balancer.check_health()
+        assert [s.healthy for s in balancer.endpoint_stats()] == [True, True]
+
+    def test_all_ejected_fails_open(self):
+        client = make_client('only')
+        client.health.side_effect = InferenceClientError('Health check failed')
+        balancer = LoadBalancedInferenceClient([client])
+        balancer.check_health()
+
+        assert balancer.run_sync({}) == 'only'
+
+    def test_from_deployments_uses_healthcheck_path(self):
+        deployments = [make_deployment('eu'), make_deployment('us')]
+        responses.add(responses.GET, f'{BASE_DOMAIN}/eu/ready', status=200)
+        responses.add(responses.GET, f'{BASE_DOMAIN}/us/ready', status=503)
+
+        with LoadBalancedInferenceClient.from_deployments(deployments) as balancer:
+            balancer.check_health()
+            stats = balancer.endpoint_stats()
+
+        assert [s.endpoint_base_url for s in stats] == [f'{BASE_DOMAIN}/eu', f'{BASE_DOMAIN}/us']
+        assert [s.healthy for s in stats] == [True, False]
@@ -0,0 +1,102 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from verda.inference_client import InferenceClientError, MicroBatchingInferenceClient
+
+
+class FakeEmbeddingClient:
+    """Embeds a batch of strings as their lengths."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.payloads = []
+        self._lock = threading.Lock()
+
+    def run_sync(self, data, **_kwargs):
+        with self._lock:
+            self.payloads.append(data)
+        if self.error is not None:
+            raise self.error
+        return Mock(output=Mock(return_value={'data': [len(text) for text in data['input']]}))
+
+
+def merge(items):
+    return {'input': items}
+
+
+def split(output, _items):
+    return output['data']
+
+
+class TestMicroBatchingInferenceClient:
+    def test_concurrent_calls_are_batched(self):
+        client = FakeEmbeddingClient()
+        texts = ['a' * n for n in range(1, 9)]
+
+        with MicroBatchingInferenceClient(
+            client, merge, split, max_batch_size=4, max_wait_ms=500
+        ) as batcher:
+            futures = [batcher.submit(text) for text in texts]
+            results = [future.result(timeout=5) for future in futures]
+
+        assert results == list(range(1, 9))
+        assert [len(p['input']) for p in client.payloads] == [4, 4]
+        assert batcher.stats.batches == 2
+        assert batcher.stats.mean_batch_size == 4
+
+    def test_max_wait_sends_partial_batch(self):
+        client = FakeEmbeddingClient()
+
+        with MicroBatchingInferenceClient(client, merge, split, max_wait_ms=1) as batcher:
+            assert batcher.infer('abc', timeout=5) == 3
+
+        assert client.payloads == [{'input': ['abc']}]
+
+    def test_infer_from_many_threads(self):
+        client = FakeEmbeddingClient()
+
+        with MicroBatchingInferenceClient(client, merge, split, max_wait_ms=20) as batcher:
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                results = list(pool.map(lambda n: batcher.infer('x' * n, timeout=5), range(64)))
+
+        assert results == list(range(64))
+        assert sum(len(p['input']) for p in client.payloads) == 64
+        assert len(client.payloads) < 64
+
+    def test_batch_error_reaches_every_caller(self):
+        client = FakeEmbeddingClient(error=InferenceClientError('boom', status_code=503))
+
+        with MicroBatchingInferenceClient(client, merge, split, max_wait_ms=50) as batcher:
+            futures = [batcher.submit('a'), batcher.submit('b')]
+            for future in futures:
+                with pytest.raises(InferenceClientError, match='boom'):
+                    future.result(timeout=5)
+
+        assert batcher.stats.failed_batches == 1
+
+    def test_split_result_count_mismatch(self):
+        client = FakeEmbeddingClient()
+
+        with MicroBatchingInferenceClient(
+            client, merge, lambda _output, _items: [], max_wait_ms=1
+        ) as batcher:
+            with pytest.raises(InferenceClientError, match='0 results for a batch of 1'):
+                batcher.infer('a', timeout=5)
+
+    def test_close_flushes_and_rejects_new_items(self):
+        client = FakeEmbeddingClient()
+        batcher = MicroBatchingInferenceClient(client, merge, split, max_wait_ms=10_000)
+        future = batcher.submit('ab')
+
+        batcher.close()
+
+        assert future.result(timeout=0) == 2
+        with pytest.raises(InferenceClientError, match='closed'):
+            batcher.submit('c')
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError, match='max_batch_size'):
+            MicroBatchingInferenceClient(FakeEmbeddingClient(), merge, split, max_batch_size=0)
@@ -0,0 +1,200 @@
+import asyncio
+import json
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.inference_client import (
+    ChatMessage,
+    InferenceClient,
+    InferenceClientError,
+    OpenAICompatibleClient,
+    TokenMetrics,
+)
+
+INFERENCE_KEY = 'test-inference-key'
+ENDPOINT_BASE_URL = 'https://containers.datacrunch.io/test-deployment'
+CHAT_URL = f'{ENDPOINT_BASE_URL}/v1/chat/completions'
+COMPLETIONS_URL = f'{ENDPOINT_BASE_URL}/v1/completions'
+EMBEDDINGS_URL = f'{ENDPOINT_BASE_URL}/v1/embeddings'
+
+CHAT_COMPLETION = {
+    'id': 'chatcmpl-1',
+    'object': 'chat.completion',
+    'created': 1700000000,
+    'model': 'llama',
+    'choices': [
+        {
+            'index': 0,
+            'message': {'role': 'assistant', 'content': 'Hello!'},
+            'finish_reason': 'stop',
+        }
+    ],
+    'usage': {'prompt_tokens': 5, 'completion_tokens': 2, 'total_tokens': 7},
+}
+
+
+def sse(chunks):
+    body = ''.join(f'data: {json.dumps(chunk)}\n\n' for chunk in chunks)
+    return (body + 'data: [DONE]\n\n').encode()
+
+
+CHAT_STREAM = sse(
+    [
+        {'id': 'c1', 'model': 'llama', 'choices': [{'index': 0, 'delta': {'role': 'assistant'}}]},
+        {'id': 'c1', 'model': 'llama', 'choices': [{'index': 0, 'delta': {'content': 'Hel'}}]},
+        {'id': 'c1', 'model': 'llama', 'choices': [{'index': 0, 'delta': {'content': 'lo'}}]},
+        {
+            'id': 'c1',
+            'model': 'llama',
+            'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}],
+        },
+        {
+            'id': 'c1',
+            'model': 'llama',
+            'choices': [],
+            'usage': {'prompt_tokens': 3, 'completion_tokens': 2, 'total_tokens': 5},
+        },
+    ]
+)
+
+
+@pytest.fixture
+def client():
+    inference_client = InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+    inference_client.token_metrics = TokenMetrics()
+    return OpenAICompatibleClient(inference_client, model='llama')
+
+
+class TestOpenAICompatibleClient:
+    def test_chat_completions(self, client):
+        responses.post(CHAT_URL, json=CHAT_COMPLETION)
+
+        reply = client.chat_completions(
+            [ChatMessage('system', 'Be brief'), {'role': 'user', 'content': 'Hi'}],
+            max_tokens=16,
+        )
+
+        assert reply.content == 'Hello!'
+        assert reply.choices[0].finish_reason == 'stop'
+        assert reply.usage.total_tokens == 7
+        assert json.loads(responses.calls[0].request.body) == {
+            'messages': [
+                {'role': 'system', 'content': 'Be brief'},
+                {'role': 'user', 'content': 'Hi'},
+            ],
+            'model': 'llama',
+            'max_tokens': 16,
+        }
+
+    def test_stream_chat_completions(self, client):
+        responses.post(CHAT_URL, body=CHAT_STREAM, content_type='text/event-stream')
+
+        with client.stream_chat_completions([{'role': 'user', 'content': 'Hi'}]) as stream:
+            deltas = list(stream)
+
+        assert deltas == ['Hel', 'lo']
+        assert stream.id == 'c1'
+        assert stream.finish_reason == 'stop'
+        assert stream.usage.completion_tokens == 2
+        assert stream.response.closed
+        assert stream.response.stream_metrics.completion_tokens == 2
+        assert json.loads(responses.calls[0].request.body)['stream'] is True
+
+    def test_stream_closed_early_releases_response(self, client):
+        responses.post(CHAT_URL, body=CHAT_STREAM, content_type='text/event-stream')
+
+        with client.stream_chat_completions([{'role': 'user', 'content': 'Hi'}]) as stream:
+            assert next(stream) == 'Hel'
+
+        assert stream.response.closed
+
+    def test_completions(self, client):
+        responses.post(
+            COMPLETIONS_URL,
+            json={
+                'id': 'cmpl-1',
+                'model': 'other',
+                'choices': [{'index': 0, 'text': ' world', 'finish_reason': 'length'}],
+            },
+        )
+
+        completion = client.completions('Hello', model='other', temperature=0)
+
+        assert completion.text == ' world'
+        assert completion.usage is None
+        assert json.loads(responses.calls[0].request.body)['model'] == 'other'
+
+    def test_stream_completions_text(self, client):
+        responses.post(
+            COMPLETIONS_URL,
+            body=sse([{'choices': [{'index': 0, 'text': t}]} for t in ('a', '', 'b', 'c')]),
+            content_type='text/event-stream',
+        )
+
+        assert client.stream_completions('x').text() == 'abc'
+
+    def test_embeddings(self, client):
+        responses.post(
+            EMBEDDINGS_URL,
+            json={
+                'model': 'e5',
+                'data': [
+                    {'object': 'embedding', 'index': 1, 'embedding': [0.3, 0.4]},
+                    {'object': 'embedding', 'index': 0, 'embedding': [0.1, 0.2]},
+                ],
+            },
+        )
+
+        response = client.embeddings(['a', 'b'])
+
+        assert response.embeddings == [[0.1, 0.2], [0.3, 0.4]]
+
+    def test_unexpected_response(self, client):
+        responses.post(CHAT_URL, json={'error': 'model not loaded'})
+
+        with pytest.raises(InferenceClientError, match='Unexpected ChatCompletion response'):
+            client.chat_completions([{'role': 'user', 'content': 'Hi'}])
+
+    def test_path_prefix(self):
+        responses.post(
+            f'{ENDPOINT_BASE_URL}/openai/v1/embeddings', json={'model': 'e5', 'data': []}
+        )
+        client = OpenAICompatibleClient(
+            InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL), path_prefix='/openai/v1/'
+        )
+
+        assert client.embeddings('a').embeddings == []
+        assert 'model' not in json.loads(responses.calls[0].request.body)
+
+
+class TestAsyncOpenAICompatibleClient:
+    def test_chat_and_stream(self):
+        httpx = pytest.importorskip('httpx')
+        from verda.inference_client import AsyncInferenceClient, AsyncOpenAICompatibleClient
+
+        def handler(request):
+            if json.loads(request.content).get('stream'):
+                return httpx.Response(
+                    200, content=CHAT_STREAM, headers={'Content-Type': 'text/event-stream'}
+                )
+            return httpx.Response(200, json=CHAT_COMPLETION)
+
+        async def main():
+            inference_client = AsyncInferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+            inference_client.token_metrics = None
+            inference_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            client = AsyncOpenAICompatibleClient(inference_client)
+            async with inference_client:
+                reply = await client.chat_completions([{'role': 'user', 'content': 'Hi'}])
+                async with await client.stream_chat_completions(
+                    [{'role': 'user', 'content': 'Hi'}]
+                ) as stream:
+                    deltas = [delta async for delta in stream]
+            return reply, deltas, stream
+
+        reply, deltas, stream = asyncio.run(main())
+
+        assert reply.content == 'Hello!'
+        assert deltas == ['Hel', 'lo']
+        assert stream.finish_reason == 'stop'
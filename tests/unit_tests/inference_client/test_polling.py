@@ -0,0 +1,213 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, as_completed
+from unittest.mock import Mock
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.inference_client import (
+    AsyncExecutionScheduler,
+    AsyncStatus,
+    InferenceClient,
+    InferenceClientError,
+    PollingPolicy,
+    _polling,
+    default_execution_scheduler,
+)
+
+BASE_DOMAIN = 'https://containers.datacrunch.io'
+ENDPOINT_BASE_URL = f'{BASE_DOMAIN}/test-deployment'
+
+FAST = PollingPolicy(initial_interval_seconds=0.001, max_interval_seconds=0.01, jitter=False)
+
+
+class FakeExecution:
+    """Walks through the given statuses, one per status_json() call."""
+
+    def __init__(self, id, statuses, result=None, errors=()):
+        self.id = id
+        self.statuses = list(statuses)
+        self.errors = set(errors)
+        self._status = AsyncStatus.Initialized
+        self._result = result
+        self.polls = 0
+        self._lock = threading.Lock()
+
+    def status(self):
+        return self._status
+
+    def status_json(self):
+        with self._lock:
+            poll = self.polls
+            self.polls += 1
+        if poll in self.errors:
+            raise InferenceClientError('status unavailable', status_code=503)
+        self._status = self.statuses[min(poll, len(self.statuses) - 1)]
+        return {'Status': self._status.value}
+
+    def result(self):
+        return self._result
+
+
+class TestAsyncExecutionScheduler:
+    def test_resolves_results(self):
+        executions = [
+            FakeExecution(str(i), [AsyncStatus.Queue] * i + [AsyncStatus.Completed], result=i)
+            for i in range(20)
+        ]
+
+        with AsyncExecutionScheduler(FAST) as scheduler:
+            futures = [scheduler.add(execution) for execution in executions]
+            results = sorted(f.result(timeout=5) for f in as_completed(futures, timeout=5))
+
+        assert results == list(range(20))
+        assert scheduler.pending == 0
+
+    def test_backoff_and_reset_on_status_change(self):
+        scheduler = AsyncExecutionScheduler(
+            PollingPolicy(initial_interval_seconds=1, max_interval_seconds=4, jitter=False)
+        )
+        scheduler.close()
+        execution = Mock(status=Mock(return_value=AsyncStatus.Queue))
+        tracked = Mock(
+            execution=execution, future=Future(), status=AsyncStatus.Queue, interval=1, errors=0
+        )
+
+        assert [scheduler._backoff(i) for i in (1, 2, 3, 4)] == [1.5, 3, 4, 4]
+        scheduler._in_flight = 1
+        scheduler._poll(tracked)
+        assert tracked.interval == 1.5
+        execution.status.return_value = AsyncStatus.Inference
+        scheduler._in_flight = 1
+        tracked.interval = 4
+        tracked.future = Future()
+        scheduler._poll(tracked)
+        assert tracked.interval == 1
+        assert tracked.status == AsyncStatus.Inference
+
+    def test_poll_errors_are_retried(self):
+        execution = FakeExecution('1', [AsyncStatus.Completed], result='ok', errors={0, 1})
+
+        with AsyncExecutionScheduler(FAST) as scheduler:
+            assert scheduler.add(execution).result(timeout=5) == 'ok'
+
+    def test_too_many_poll_errors(self):
+        execution = FakeExecution('1', [AsyncStatus.Completed], errors=range(10))
+        policy = PollingPolicy(initial_interval_seconds=0.001, max_poll_errors=3, jitter=False)
+
+        with AsyncExecutionScheduler(policy) as scheduler:
+            with pytest.raises(InferenceClientError, match='status unavailable'):
+                scheduler.add(execution).result(timeout=5)
+
+        assert execution.polls == 3
+
+    def test_queue_ttl(self):
+        execution = FakeExecution('1', [AsyncStatus.Queue])
+
+        with AsyncExecutionScheduler(FAST, queue_ttl_seconds=0.05) as scheduler:
+            with pytest.raises(InferenceClientError, match='still queued'):
+                scheduler.add(execution).result(timeout=5)
+
+    def test_queue_ttl_counts_from_submission(self):
+        execution = FakeExecution('1', [AsyncStatus.Queue])
+
+        with AsyncExecutionScheduler(FAST, queue_ttl_seconds=60) as scheduler:
+            future = scheduler.add(execution, submitted_at=time.time() - 120)
+            with pytest.raises(InferenceClientError, match='still queued'):
+                future.result(timeout=5)
+
+    def test_from_deployment_uses_queue_message_ttl(self):
+        deployment = Mock(scaling=Mock(queue_message_ttl_seconds=300))
+
+        with AsyncExecutionScheduler.from_deployment(deployment) as scheduler:
+            assert scheduler.queue_ttl_seconds == 300
+
+    def test_fetch_result_disabled(self):
+        execution = FakeExecution('1', [AsyncStatus.Completed])
+
+        with AsyncExecutionScheduler(FAST, fetch_result=False) as scheduler:
+            assert scheduler.add(execution).result(timeout=5) is execution
+
+    def test_bounded_concurrency(self):
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        class SlowExecution(FakeExecution):
+            def status_json(self):
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                threading.Event().wait(0.005)
+                with lock:
+                    active.pop()
+                return super().status_json()
+
+        executions = [SlowExecution(str(i), [AsyncStatus.Completed]) for i in range(30)]
+        with AsyncExecutionScheduler(FAST, max_concurrent_polls=3) as scheduler:
+            for future in [scheduler.add(execution) for execution in executions]:
+                future.result(timeout=5)
+
+        assert max(peak) <= 3
+
+    def test_close_cancels_pending(self):
+        scheduler = AsyncExecutionScheduler(PollingPolicy(initial_interval_seconds=60))
+        future = scheduler.add(FakeExecution('1', [AsyncStatus.Queue]))
+
+        scheduler.close()
+
+        assert future.cancelled()
+        with pytest.raises(InferenceClientError, match='closed'):
+            scheduler.add(FakeExecution('2', [AsyncStatus.Queue]))
+
+
+@pytest.fixture
+def fast_default_scheduler(monkeypatch):
+    scheduler = AsyncExecutionScheduler(FAST)
+    monkeypatch.setattr(_polling, '_default_scheduler', scheduler)
+    yield scheduler
+    scheduler.close()
+
+
+@pytest.fixture
+def async_endpoint():
+    responses.post(f'{ENDPOINT_BASE_URL}/', json={'Id': 'exec-1'})
+    responses.get(f'{BASE_DOMAIN}/status/test-deployment', json={'Status': 'Queue'})
+    responses.get(f'{BASE_DOMAIN}/status/test-deployment', json={'Status': 'Completed'})
+    responses.get(f'{BASE_DOMAIN}/result/test-deployment', json={'answer': 42})
+
+
+@pytest.mark.usefixtures('async_endpoint')
+class TestAsyncInferenceExecutionFuture:
+    @pytest.mark.usefixtures('fast_default_scheduler')
+    def test_future(self):
+        execution = InferenceClient('key', ENDPOINT_BASE_URL).run({'prompt': 'hi'})
+
+        future = execution.future()
+
+        assert execution.future() is future
+        assert future.result(timeout=5) == {'answer': 42}
+        assert execution.status() == AsyncStatus.Completed
+
+    @pytest.mark.usefixtures('fast_default_scheduler')
+    def test_await(self):
+        execution = InferenceClient('key', ENDPOINT_BASE_URL).run({'prompt': 'hi'})
+
+        async def main():
+            return await asyncio.gather(execution, execution)
+
+        assert asyncio.run(main()) == [{'answer': 42}, {'answer': 42}]
+
+    def test_default_scheduler_is_shared(self, fast_default_scheduler):
+        assert default_execution_scheduler() is fast_default_scheduler
+
+    def test_status_and_result_use_client_timeout(self):
+        execution = InferenceClient('key', ENDPOINT_BASE_URL, timeout_seconds=7).run({})
+
+        execution.status_json()
+        assert execution.result() == {'answer': 42}
+
+        polls = [call for call in responses.calls if call.request.method == 'GET']
+        assert [call.request.req_kwargs['timeout'] for call in polls] == [7, 7]
@@ -0,0 +1,37 @@
+from verda.inference_client import InferenceClient, InferenceClientRegistry
+
+INFERENCE_KEY = 'test-inference-key'
+ENDPOINT_BASE_URL = 'https://containers.datacrunch.io/test-deployment'
+
+
+class TestInferenceClientRegistry:
+    def test_same_endpoint_and_key_share_client(self):
+        registry = InferenceClientRegistry()
+
+        client = registry.get(INFERENCE_KEY, ENDPOINT_BASE_URL)
+
+        assert isinstance(client, InferenceClient)
+        assert registry.get(INFERENCE_KEY, ENDPOINT_BASE_URL + '/') is client
+        assert registry.get('other-key', ENDPOINT_BASE_URL) is not client
+        assert registry.get(INFERENCE_KEY, ENDPOINT_BASE_URL + '-2') is not client
+        assert len(registry) == 3
+
+    def test_new_options_replace_client(self):
+        registry = InferenceClientRegistry()
+        client = registry.get(INFERENCE_KEY, ENDPOINT_BASE_URL, pool_maxsize=8)
+
+        assert registry.get(INFERENCE_KEY, ENDPOINT_BASE_URL) is client
+        assert registry.get(INFERENCE_KEY, ENDPOINT_BASE_URL, pool_maxsize=8) is client
+        replaced = registry.get(INFERENCE_KEY, ENDPOINT_BASE_URL, pool_maxsize=64)
+        assert replaced is not client
+        assert registry.get(INFERENCE_KEY, ENDPOINT_BASE_URL) is replaced
+
+    def test_remove_and_clear(self):
+        registry = InferenceClientRegistry()
+        client = registry.get(INFERENCE_KEY, ENDPOINT_BASE_URL)
+
+        registry.remove(INFERENCE_KEY, ENDPOINT_BASE_URL)
+        assert registry.get(INFERENCE_KEY, ENDPOINT_BASE_URL) is not client
+
+        registry.clear()
+        assert len(registry) == 0
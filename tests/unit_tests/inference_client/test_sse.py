@@ -0,0 +1,137 @@
+import json
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.inference_client import (
+    InferenceClient,
+    NDJSONParser,
+    ServerSentEvent,
+    SSEParser,
+    iter_ndjson,
+    iter_sse_events,
+    iter_sse_json,
+)
+
+ENDPOINT_BASE_URL = 'https://containers.datacrunch.io/test-deployment'
+
+OPENAI_STREAM = (
+    b'data: {"choices": [{"text": "Hel"}]}\n\n'
+    b': keep-alive\n\n'
+    b'data: {"choices": [{"text": "lo"}]}\r\n\r\n'
+    b'data: [DONE]\n\n'
+)
+
+
+def split_every(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestSSEParser:
+    @pytest.mark.parametrize('chunk_size', [1, 2, 7, 1024])
+    def test_events_split_across_chunks(self, chunk_size):
+        events = list(iter_sse_events(split_every(OPENAI_STREAM, chunk_size)))
+
+        assert [e.data for e in events] == [
+            '{"choices": [{"text": "Hel"}]}',
+            '{"choices": [{"text": "lo"}]}',
+            '[DONE]',
+        ]
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 1024])
+    def test_bare_cr_line_endings(self, chunk_size):
+        stream = b'data: one\r\rdata: two\r\ndata: more\r\n\rdata: three\r\r\n'
+
+        events = list(iter_sse_events(split_every(stream, chunk_size)))
+
+        assert [e.data for e in events] == ['one', 'two\nmore', 'three']
+
+    def test_cr_lf_split_across_chunks(self):
+        parser = SSEParser()
+
+        assert parser.feed(b'data: a\r') == []
+        assert [e.data for e in parser.feed(b'\n\r')] == ['a']
+        assert parser.feed(b'\ndata: b\r\n') == []
+        assert parser.flush() == [ServerSentEvent(data='b')]
+
+    def test_multi_line_event_fields(self):
+        parser = SSEParser()
+
+        events = parser.feed(b'id: 7\nevent: update\nretry: 300\ndata: line one\ndata:line two\n\n')
+
+        assert events == [
+            ServerSentEvent(data='line one\nline two', event='update', id='7', retry=300)
+        ]
+
+    def test_partial_event_is_buffered(self):
+        parser = SSEParser()
+
+        assert parser.feed(b'data: {"a"') == []
+        assert parser.feed(b': 1}\n') == []
+        assert parser.feed(b'\n')[0].json() == {'a': 1}
+
+    def test_flush_dispatches_unterminated_event(self):
+        parser = SSEParser()
+        parser.feed(b'data: last')
+
+        assert [e.data for e in parser.flush()] == ['last']
+
+    def test_iter_sse_json_stops_at_done(self):
+        chunks = split_every(OPENAI_STREAM + b'data: {"after": true}\n\n', 5)
+
+        values = list(iter_sse_json(chunks))
+
+        assert [v['choices'][0]['text'] for v in values] == ['Hel', 'lo']
+
+
+class TestNDJSONParser:
+    def test_values_split_across_chunks(self):
+        data = b'{"a": 1}\n\n{"b": [1, 2]}\r\n{"c": null}'
+
+        assert list(iter_ndjson(split_every(data, 3))) == [{'a': 1}, {'b': [1, 2]}, {'c': None}]
+
+    def test_feed_returns_completed_values(self):
+        parser = NDJSONParser()
+
+        assert parser.feed(b'{"a": 1}\n{"b"') == [{'a': 1}]
+        assert parser.feed(b': 2}\n') == [{'b': 2}]
+        assert parser.flush() == []
+
+
+class TestInferenceResponseStreaming:
+    def test_stream_json_event_stream(self):
+        responses.add(
+            responses.POST,
+            f'{ENDPOINT_BASE_URL}/v1/completions',
+            body=OPENAI_STREAM,
+            content_type='text/event-stream',
+        )
+        client = InferenceClient('key', ENDPOINT_BASE_URL)
+
+        response = client.run_sync({'stream': True}, path='v1/completions', stream=True)
+
+        assert [c['choices'][0]['text'] for c in response.stream_json()] == ['Hel', 'lo']
+
+    def test_stream_json_ndjson(self):
+        body = b''.join(json.dumps({'i': i}).encode() + b'\n' for i in range(3))
+        responses.add(
+            responses.POST, ENDPOINT_BASE_URL + '/', body=body, content_type='application/x-ndjson'
+        )
+        client = InferenceClient('key', ENDPOINT_BASE_URL)
+
+        response = client.run_sync({}, stream=True)
+
+        assert list(response.stream_json()) == [{'i': 0}, {'i': 1}, {'i': 2}]
+
+    def test_events(self):
+        responses.add(
+            responses.POST,
+            ENDPOINT_BASE_URL + '/',
+            body=b'event: ping\ndata: 1\n\n',
+            content_type='text/event-stream',
+        )
+        client = InferenceClient('key', ENDPOINT_BASE_URL)
+
+        events = list(client.run_sync({}, stream=True).events())
+
+        assert events == [ServerSentEvent(data='1', event='ping')]
@@ -0,0 +1,117 @@
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+np = pytest.importorskip('numpy')
+
+from verda.inference_client import (  # noqa: E402
+    InferenceClient,
+    InferenceClientError,
+    decode_tensor,
+    encode_tensor,
+    tensor_from_json,
+    tensor_to_json,
+)
+
+ENDPOINT_BASE_URL = 'https://containers.datacrunch.io/test-deployment'
+PREDICT_URL = f'{ENDPOINT_BASE_URL}/predict'
+
+
+@pytest.fixture
+def inference_client():
+    return InferenceClient('test-inference-key', ENDPOINT_BASE_URL)
+
+
+def tensor_response(array):
+    body = encode_tensor(array)
+    responses.post(
+        PREDICT_URL,
+        body=bytes(body.content),
+        headers=dict(body.headers),
+        content_type='application/octet-stream',
+    )
+
+
+class TestTensorEncoding:
+    def test_encode_tensor_is_zero_copy(self):
+        array = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+        body = encode_tensor(array)
+
+        assert body.content_type == 'application/octet-stream'
+        assert body.headers == {'X-Tensor-Dtype': '<f4', 'X-Tensor-Shape': '3,4'}
+        assert np.shares_memory(np.frombuffer(body.content, dtype=np.float32), array)
+
+    def test_big_endian_and_non_contiguous_arrays(self):
+        array = np.arange(6, dtype='>i4').reshape(2, 3).T
+
+        body = encode_tensor(array)
+
+        assert body.headers['X-Tensor-Dtype'] == '<i4'
+        decoded = decode_tensor(body.content, '<i4', body.headers['X-Tensor-Shape'])
+        np.testing.assert_array_equal(decoded, array)
+
+    def test_decode_tensor_size_mismatch(self):
+        with pytest.raises(InferenceClientError, match='has 8 bytes, expected 16'):
+            decode_tensor(b'\x00' * 8, '<f4', (2, 2))
+
+    def test_object_arrays_are_rejected(self):
+        with pytest.raises(InferenceClientError, match='Python objects'):
+            encode_tensor(np.array([{}, None], dtype=object))
+
+    def test_json_round_trip(self):
+        array = np.random.default_rng(0).standard_normal((2, 3, 4))
+
+        encoded = tensor_to_json(array)
+
+        assert encoded['dtype'] == '<f8'
+        assert encoded['shape'] == [2, 3, 4]
+        np.testing.assert_array_equal(tensor_from_json(encoded), array)
+
+
+class TestTensorRoundTrip:
+    def test_run_sync_sends_raw_tensor(self, inference_client):
+        array = np.arange(6, dtype=np.int16).reshape(2, 3)
+        tensor_response(array)
+
+        inference_client.run_sync(encode_tensor(array), path='predict')
+
+        request = responses.calls[0].request
+        assert request.headers['Content-Type'] == 'application/octet-stream'
+        assert request.headers['X-Tensor-Dtype'] == '<i2'
+        assert request.headers['X-Tensor-Shape'] == '2,3'
+        assert bytes(request.body) == array.tobytes()
+
+    def test_response_tensor_from_headers(self, inference_client):
+        array = np.linspace(0, 1, 10, dtype=np.float32).reshape(2, 5)
+        tensor_response(array)
+
+        result = inference_client.run_sync({}, path='predict').tensor()
+
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, array)
+
+    def test_response_tensor_into_preallocated_array(self, inference_client):
+        array = np.arange(1000, dtype=np.float64).reshape(10, 100)
+        tensor_response(array)
+        out = np.empty_like(array)
+
+        result = inference_client.run_sync({}, path='predict', stream=True).tensor(out=out)
+
+        assert result is out
+        np.testing.assert_array_equal(out, array)
+
+    def test_response_tensor_out_mismatch(self, inference_client):
+        tensor_response(np.zeros((2, 2), dtype=np.float32))
+
+        with pytest.raises(InferenceClientError, match='shape'):
+            inference_client.run_sync({}, path='predict', stream=True).tensor(
+                out=np.empty((4,), dtype=np.float32)
+            )
+
+    def test_response_tensor_without_headers(self, inference_client):
+        responses.post(PREDICT_URL, body=np.arange(4, dtype='<u1').tobytes())
+        response = inference_client.run_sync({}, path='predict')
+
+        with pytest.raises(InferenceClientError, match='pass dtype and shape'):
+            response.tensor()
+        np.testing.assert_array_equal(response.tensor(dtype='<u1', shape=(2, 2)), [[0, 1], [2, 3]])
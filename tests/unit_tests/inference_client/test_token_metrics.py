@@ -0,0 +1,189 @@
+import asyncio
+import json
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.inference_client import Histogram, InferenceClient, StreamMetrics, TokenMetrics
+
+INFERENCE_KEY = 'test-inference-key'
+ENDPOINT_BASE_URL = 'https://containers.datacrunch.io/test-deployment'
+COMPLETIONS_URL = f'{ENDPOINT_BASE_URL}/v1/chat/completions'
+
+
+def sse(*values, usage=None):
+    chunks = [{'choices': [{'index': 0, 'delta': {'role': 'assistant'}}]}]
+    chunks += [{'choices': [{'index': 0, 'delta': {'content': value}}]} for value in values]
+    if usage is not None:
+        chunks.append({'choices': [], 'usage': usage})
+    body = ''.join(f'data: {json.dumps(chunk)}\n\n' for chunk in chunks)
+    return (body + 'data: [DONE]\n\n').encode()
+
+
+@pytest.fixture
+def metrics():
+    return TokenMetrics()
+
+
+@pytest.fixture
+def inference_client(metrics):
+    client = InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+    client.token_metrics = metrics
+    return client
+
+
+class TestHistogram:
+    def test_percentiles_are_estimated_within_buckets(self):
+        histogram = Histogram(range(10, 101, 10))
+        for value in range(1, 101):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot.count == 100
+        assert snapshot.mean == 50.5
+        assert snapshot.min == 1
+        assert snapshot.max == 100
+        assert snapshot.percentile(50) == pytest.approx(50, abs=1)
+        assert snapshot.percentile(99) == pytest.approx(99, abs=1)
+        assert snapshot.percentile(100) == 100
+
+    def test_values_above_the_last_bound(self):
+        histogram = Histogram([1.0])
+        histogram.observe(5.0)
+
+        assert histogram.snapshot().counts == [0, 1]
+        assert histogram.snapshot().percentile(50) == 5.0
+
+
+class TestStreamMetrics:
+    def test_stream_json_records_tokens(self, inference_client, metrics):
+        responses.post(
+            COMPLETIONS_URL, body=sse('Hel', 'lo', '!'), content_type='text/event-stream'
+        )
+
+        response = inference_client.run_sync({}, path='v1/chat/completions', stream=True)
+        chunks = list(response.stream_json())
+
+        assert len(chunks) == 4
+        stream_metrics = response.stream_metrics
+        assert stream_metrics.chunks == 4
+        assert stream_metrics.completion_tokens == 3
+        assert 0 < stream_metrics.first_chunk_seconds <= stream_metrics.ttft_seconds
+        assert stream_metrics.inter_token_latency.count == 2
+        snapshot = metrics.snapshot()['test-deployment']
+        assert snapshot.streams == 1
+        assert snapshot.completion_tokens == 3
+        assert snapshot.ttft.count == 1
+        assert snapshot.inter_token_latency.count == 2
+
+    def test_stream_lines_use_reported_usage(self, inference_client):
+        responses.post(
+            COMPLETIONS_URL,
+            body=sse('a', 'b', usage={'prompt_tokens': 7, 'completion_tokens': 5}),
+            content_type='text/event-stream',
+        )
+
+        response = inference_client.run_sync({}, path='v1/chat/completions', stream=True)
+        lines = list(response.stream())
+
+        assert lines[-1] == b'data: [DONE]'
+        assert response.stream_metrics.completion_tokens == 5
+        assert response.stream_metrics.prompt_tokens == 7
+
+    def test_early_stop_records_partial_stream(self, inference_client, metrics):
+        responses.post(COMPLETIONS_URL, body=sse('a', 'b', 'c'), content_type='text/event-stream')
+
+        response = inference_client.run_sync({}, path='v1/chat/completions', stream=True)
+        for event in response.events():
+            if 'content' in event.data:
+                break
+
+        assert response.stream_metrics.completion_tokens == 1
+        assert metrics.snapshot()['test-deployment'].streams == 1
+
+    def test_downloaded_responses_are_not_aggregated(self, inference_client, metrics):
+        responses.post(COMPLETIONS_URL, body=sse('a'), content_type='text/event-stream')
+
+        response = inference_client.run_sync({}, path='v1/chat/completions')
+        list(response.stream_json())
+
+        assert response.stream_metrics.completion_tokens == 1
+        assert metrics.snapshot() == {}
+
+    def test_events_reuse_decoded_data(self, inference_client):
+        responses.post(COMPLETIONS_URL, body=sse('a', 'b'), content_type='text/event-stream')
+
+        response = inference_client.run_sync({}, path='v1/chat/completions', stream=True)
+        events = list(response.events())
+
+        assert response.stream_metrics.completion_tokens == 2
+        assert events[1].json() is events[1].json()
+        assert events[1].json()['choices'][0]['delta']['content'] == 'a'
+
+    def test_metrics_are_off_by_default(self):
+        client = InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+        responses.post(COMPLETIONS_URL, body=sse('a', 'b'), content_type='text/event-stream')
+
+        assert client.token_metrics is None
+        response = client.run_sync({}, path='v1/chat/completions', stream=True)
+        lines = list(response.stream())
+
+        assert lines[-1] == b'data: [DONE]'
+        assert response.stream_metrics is None
+
+    def test_snapshot_reset(self, metrics):
+        metrics.record('a', StreamMetrics(ttft_seconds=0.1, chunks=3, completion_tokens=3))
+
+        assert metrics.snapshot(reset=True)['a'].ttft.count == 1
+        assert metrics.snapshot() == {}
+
+    def test_tokens_per_second(self):
+        stream_metrics = StreamMetrics(ttft_seconds=1.0, duration_seconds=3.0, completion_tokens=9)
+
+        assert stream_metrics.tokens_per_second == 4.0
+
+    def test_async_stream_json(self, metrics):
+        httpx = pytest.importorskip('httpx')
+        from verda.inference_client import AsyncInferenceClient
+
+        def handler(_request):
+            return httpx.Response(
+                200, content=sse('x', 'y'), headers={'Content-Type': 'text/event-stream'}
+            )
+
+        async def main():
+            client = AsyncInferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+            client.token_metrics = metrics
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                response = await client.run_sync({}, stream=True)
+                return [chunk async for chunk in response.stream_json()], response
+
+        chunks, response = asyncio.run(main())
+
+        assert len(chunks) == 3
+        assert response.stream_metrics.completion_tokens == 2
+        assert metrics.snapshot()['test-deployment'].completion_tokens == 2
+
+    def test_async_events_with_disabled_metrics(self):
+        httpx = pytest.importorskip('httpx')
+        from verda.inference_client import AsyncInferenceClient
+
+        def handler(_request):
+            return httpx.Response(
+                200, content=sse('x'), headers={'Content-Type': 'text/event-stream'}
+            )
+
+        async def main():
+            client = AsyncInferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+            client.token_metrics = None
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                response = await client.run_sync({}, stream=True)
+                return [event async for event in response.events()], response
+
+        events, response = asyncio.run(main())
+
+        assert events[1].json()['choices'][0]['delta']['content'] == 'x'
+        assert response.stream_metrics is None
@@ -0,0 +1,123 @@
+import asyncio
+import mmap
+
+import pytest
+import responses  # https://github.com/getsentry/responses
+
+from verda.inference_client import (
+    InferenceClient,
+    MultipartBody,
+    MultipartFile,
+    StreamingBody,
+)
+
+INFERENCE_KEY = 'test-inference-key'
+ENDPOINT_BASE_URL = 'https://containers.datacrunch.io/test-deployment'
+UPLOAD_URL = f'{ENDPOINT_BASE_URL}/upload'
+PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
+
+
+@pytest.fixture
+def echo_client(local_endpoint):
+    return InferenceClient(INFERENCE_KEY, local_endpoint)
+
+
+@pytest.fixture
+def payload_file(tmp_path):
+    path = tmp_path / 'audio.wav'
+    path.write_bytes(PAYLOAD)
+    return path
+
+
+class TestStreamingBody:
+    def test_path(self, echo_client, payload_file):
+        body = StreamingBody(payload_file, 'audio/wav', chunk_size=64 * 1024)
+
+        response = echo_client.post('upload', data=body)
+
+        assert body.length == len(PAYLOAD)
+        assert response.headers['X-Request-Length'] == str(len(PAYLOAD))
+        assert response.headers['Content-Type'] == 'audio/wav'
+        assert response.content == PAYLOAD
+
+    def test_mmap(self, echo_client, payload_file):
+        with open(payload_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            response = echo_client.put('upload', data=StreamingBody(m))
+
+        assert response.content == PAYLOAD
+
+    def test_seekable_file_can_be_sent_again(self, echo_client, payload_file):
+        with open(payload_file, 'rb') as f:
+            f.seek(10)
+            body = StreamingBody(f)
+            first = echo_client.run_sync(body, path='upload')
+            second = echo_client.run_sync(body, path='upload')
+
+        assert body.length == len(PAYLOAD) - 10
+        assert first._original_response.content == second._original_response.content
+        assert second._original_response.content == PAYLOAD[10:]
+
+    def test_iterator_uses_chunked_transfer_encoding(self):
+        responses.patch(UPLOAD_URL, body=b'ok')
+        client = InferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+
+        client.patch('upload', data=StreamingBody(iter([b'ab', b'', b'cd'])))
+
+        request = responses.calls[0].request
+        assert request.headers['Transfer-Encoding'] == 'chunked'
+        assert 'Content-Length' not in request.headers
+        assert b''.join(request.body) == b'abcd'
+
+
+class TestMultipartBody:
+    def test_multipart_upload(self, echo_client, payload_file):
+        body = MultipartBody(
+            {
+                'model': 'whisper-1',
+                'file': MultipartFile(payload_file, content_type='audio/wav'),
+            },
+            boundary='b0undary',
+        )
+
+        response = echo_client.post('upload', data=body)
+
+        assert response.headers['Content-Type'] == 'multipart/form-data; boundary=b0undary'
+        assert response.headers['X-Request-Length'] == str(body.length)
+        assert response.content == (
+            b'--b0undary\r\nContent-Disposition: form-data; name="model"\r\n\r\n'
+            b'whisper-1\r\n'
+            b'--b0undary\r\nContent-Disposition: form-data; name="file"; filename="audio.wav"\r\n'
+            b'Content-Type: audio/wav\r\n\r\n' + PAYLOAD + b'\r\n--b0undary--\r\n'
+        )
+
+    def test_unknown_part_length(self):
+        body = MultipartBody({'file': MultipartFile(iter([b'data']), filename='x.bin')})
+
+        assert body.length is None
+        assert b'filename="x.bin"' in b''.join(bytes(chunk) for chunk in body)
+
+
+class TestAsyncStreamingUploads:
+    def test_async_streaming_body(self, payload_file):
+        httpx = pytest.importorskip('httpx')
+        from verda.inference_client import AsyncInferenceClient
+
+        seen = {}
+
+        async def handler(request):
+            seen['headers'] = request.headers
+            seen['content'] = await request.aread()
+            return httpx.Response(200, json={})
+
+        async def main():
+            client = AsyncInferenceClient(INFERENCE_KEY, ENDPOINT_BASE_URL)
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                await client.post('upload', data=StreamingBody(payload_file, 'audio/wav'))
+
+        asyncio.run(main())
+
+        assert seen['headers']['Content-Type'] == 'audio/wav'
+        assert seen['headers']['Content-Length'] == str(len(PAYLOAD))
+        assert 'Transfer-Encoding' not in seen['headers']
+        assert seen['content'] == PAYLOAD
@@ -3,7 +3,7 @@ from verda.authentication import AuthenticationService
 from verda.balance import BalanceService
 from verda.constants import Constants
 from verda.containers import ContainersService
-from verda.http_client import HTTPClient
+from verda.http_client import CircuitBreakerPolicy, HTTPClient
 from verda.images import ImagesService
 from verda.instance_types import InstanceTypesService
 from verda.instances import InstancesService
@@ -23,6 +23,7 @@ class VerdaClient:
         client_secret: str,
         base_url: str = 'https://api.verda.com/v1',
         inference_key: str | None = None,
+        circuit_breaker_policy: CircuitBreakerPolicy | None = None,
     ) -> None:
         """Verda client.
 
@@ -34,6 +35,8 @@ class VerdaClient:
         :type base_url: str, optional
         :param inference_key: inference key, optional
         :type inference_key: str, optional
+        :param circuit_breaker_policy: if set, API requests fail fast per route while the route keeps failing, optional
+        :type circuit_breaker_policy: CircuitBreakerPolicy, optional
         """
         # Validate that client_id and client_secret are not empty
         if not client_id or not client_secret:
@@ -47,7 +50,9 @@ class VerdaClient:
         self._authentication: AuthenticationService = AuthenticationService(
             client_id, client_secret, self.constants.base_url
         )
-        self._http_client: HTTPClient = HTTPClient(self._authentication, self.constants.base_url)
+        self._http_client: HTTPClient = HTTPClient(
+            self._authentication, self.constants.base_url, circuit_breaker_policy
+        )
 
         self.balance: BalanceService = BalanceService(self._http_client)
         """Balance service. Get client balance"""
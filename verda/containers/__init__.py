@@ -1,3 +1,11 @@
+from ._cold_start import (
+    ColdStartMeter,
+    ColdStartReport,
+    ColdStartTrial,
+    DeploymentTransition,
+    TimelineEvent,
+    TimelineEventType,
+)
 from ._containers import (
     AWSECRCredentials,
     BaseRegistryCredentials,
@@ -31,3 +39,9 @@ from ._containers import (
     VolumeMount,
     VolumeMountType,
 )
+from ._warm_keeper import (
+    DeploymentWarmKeeper,
+    TrafficForecast,
+    WarmKeeperStats,
+    WarmWindow,
+)
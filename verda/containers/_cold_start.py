@@ -0,0 +1,302 @@
+"""Measuring how long container deployments take to become ready."""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+from verda.inference_client import LatencySummary
+
+from ._containers import (
+    ContainerDeploymentStatus,
+    ContainersService,
+    Deployment,
+    _check_health,
+)
+
+
+class DeploymentTransition(str, Enum):
+    """Transitions a ColdStartMeter can trigger and time."""
+
+    RESUME = 'resume'
+    RESTART = 'restart'
+    SCALE_FROM_ZERO = 'scale_from_zero'
+
+
+class TimelineEventType(str, Enum):
+    """Kinds of events on a cold start timeline."""
+
+    TRIGGERED = 'triggered'
+    STATUS = 'status'
+    REPLICAS = 'replicas'
+    READY = 'ready'
+
+
+@dataclass_json
+@dataclass
+class TimelineEvent:
+    """Something observed while a deployment started.
+
+    Attributes:
+        seconds: Seconds since the transition was triggered.
+        type: Kind of event.
+        value: The new deployment status, the new number of replicas, or the
+            transition name for `triggered` events.
+    """
+
+    seconds: float
+    type: TimelineEventType
+    value: str
+
+
+@dataclass_json
+@dataclass
+class ColdStartTrial:
+    """Timeline of one triggered transition.
+
+    Attributes:
+        transition: The transition that was triggered.
+        started_at: ISO timestamp of the trigger.
+        events: Observed events in order.
+        first_status_change_seconds: Seconds until the status first changed, if it did.
+        first_replica_seconds: Seconds until the first replica was listed, if one was.
+        ready_seconds: Seconds until the first successful probe, None if timed out.
+    """
+
+    transition: DeploymentTransition
+    started_at: str
+    events: list[TimelineEvent] = field(default_factory=list)
+    first_status_change_seconds: float | None = None
+    first_replica_seconds: float | None = None
+    ready_seconds: float | None = None
+
+    @property
+    def timed_out(self) -> bool:
+        """Whether the deployment didn't become ready in time."""
+        return self.ready_seconds is None
+
+
+@dataclass_json
+@dataclass
+class ColdStartReport:
+    """Summary of repeated trials of one transition.
+
+    Attributes:
+        transition: The transition that was triggered.
+        trials: The individual trials.
+        first_status_change: Seconds until the status first changed.
+        first_replica: Seconds until the first replica was listed.
+        ready: Seconds until the first successful probe, over trials that didn't time out.
+        timeouts: Number of trials that didn't become ready in time.
+    """
+
+    transition: DeploymentTransition
+    trials: list[ColdStartTrial]
+    first_status_change: LatencySummary
+    first_replica: LatencySummary
+    ready: LatencySummary
+    timeouts: int
+
+    @classmethod
+    def from_trials(
+        cls, transition: DeploymentTransition, trials: list[ColdStartTrial]
+    ) -> 'ColdStartReport':
+        """Summarize trials of a transition.
+
+        Args:
+            transition: The transition that was triggered
+            trials: Trials of the transition
+
+        Returns:
+            ColdStartReport: The report
+        """
+
+        def summary(attribute: str) -> LatencySummary:
+            samples = [getattr(t, attribute) for t in trials]
+            return LatencySummary.from_samples(s for s in samples if s is not None)
+
+        return cls(
+            transition=transition,
+            trials=trials,
+            first_status_change=summary('first_status_change_seconds'),
+            first_replica=summary('first_replica_seconds'),
+            ready=summary('ready_seconds'),
+            timeouts=sum(trial.timed_out for trial in trials),
+        )
+
+
+class ColdStartMeter:
+    """Triggers deployment transitions and times them until the first successful request.
+
+    After triggering a transition the meter polls every `poll_interval_seconds`,
+    recording status changes from `get_deployment_status`, replica count changes from
+    `get_deployment_replicas`, and the first probe that succeeds, by default
+    `Deployment.health()`.
+
+    - `resume` pauses the deployment first and waits until it is paused.
+    - `restart` restarts the running deployment. Probing starts once the status
+      changes or one of the old replicas is gone, since the old replicas keep serving
+      until then.
+    - `scale_from_zero` waits until no replicas are listed, which takes the scale-down
+      delay of a deployment with `min_replica_count=0`, and then lets the probe trigger
+      the scale-up. Use a probe sending an inference request, health checks may not
+      count as load.
+
+    Example:
+        ```
+        meter = ColdStartMeter(verda.containers, 'my-deployment')
+        report = meter.run(DeploymentTransition.RESUME, trials=3)
+        print(report.ready.p50)
+        ```
+    """
+
+    def __init__(
+        self,
+        containers_service: ContainersService,
+        deployment_name: str,
+        probe: Callable[[Deployment], Any] | None = None,
+        poll_interval_seconds: float = 2.0,
+        timeout_seconds: float = 60 * 30,
+    ) -> None:
+        """Initialize the meter.
+
+        Args:
+            containers_service: Service used to control the deployment; needs an
+                inference key unless `probe` doesn't use the deployment's inference client
+            deployment_name: Name of the deployment
+            probe: Called with the deployment, succeeds once it serves requests. Defaults
+                to `Deployment.health()`
+            poll_interval_seconds: Seconds between polls
+            timeout_seconds: Maximum seconds to wait for a transition or its preparation
+        """
+        self._containers_service = containers_service
+        self.deployment_name = deployment_name
+        self.probe = probe or _check_health
+        self.poll_interval_seconds = poll_interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self._deployment: Deployment | None = None
+
+    @property
+    def deployment(self) -> Deployment:
+        """The measured deployment, looked up on first use."""
+        if self._deployment is None:
+            self._deployment = self._containers_service.get_deployment_by_name(self.deployment_name)
+        return self._deployment
+
+    def run(
+        self, transition: DeploymentTransition, trials: int = 3, cooldown_seconds: float = 0.0
+    ) -> ColdStartReport:
+        """Measure a transition several times.
+
+        Args:
+            transition: The transition to trigger
+            trials: Number of trials
+            cooldown_seconds: Seconds to wait between trials
+
+        Returns:
+            ColdStartReport: Timelines and summary of all trials
+        """
+        transition = DeploymentTransition(transition)
+        results = []
+        for trial in range(trials):
+            if trial and cooldown_seconds:
+                time.sleep(cooldown_seconds)
+            results.append(self.measure(transition))
+        return ColdStartReport.from_trials(transition, results)
+
+    def measure(self, transition: DeploymentTransition) -> ColdStartTrial:
+        """Prepare, trigger and time one transition.
+
+        Args:
+            transition: The transition to trigger
+
+        Returns:
+            ColdStartTrial: Timeline of the transition
+
+        Raises:
+            TimeoutError: If the deployment couldn't be prepared within the timeout
+        """
+        transition = DeploymentTransition(transition)
+        self._prepare(transition)
+        name = self.deployment_name
+        service = self._containers_service
+        status = service.get_deployment_status(name)
+        replica_ids = {replica.id for replica in service.get_deployment_replicas(name)}
+        replicas = len(replica_ids)
+        # a restarted deployment keeps serving from its old replicas at first, so it
+        # only counts as ready once it has left the state it was in
+        left_prior_state = transition != DeploymentTransition.RESTART
+        trial_status = status
+
+        trial = ColdStartTrial(
+            transition=transition, started_at=datetime.now(timezone.utc).isoformat()
+        )
+        start = time.monotonic()
+
+        def record(event_type: TimelineEventType, value: Any) -> float:
+            seconds = time.monotonic() - start
+            trial.events.append(TimelineEvent(seconds, event_type, str(value)))
+            return seconds
+
+        if transition == DeploymentTransition.RESUME:
+            service.resume_deployment(name)
+        elif transition == DeploymentTransition.RESTART:
+            service.restart_deployment(name)
+        record(TimelineEventType.TRIGGERED, transition.value)
+
+        while True:
+            new_status = service.get_deployment_status(name)
+            if new_status != status:
+                seconds = record(TimelineEventType.STATUS, new_status.value)
+                if trial.first_status_change_seconds is None:
+                    trial.first_status_change_seconds = seconds
+                status = new_status
+            new_replica_ids = {replica.id for replica in service.get_deployment_replicas(name)}
+            new_replicas = len(new_replica_ids)
+            if new_replicas != replicas:
+                seconds = record(TimelineEventType.REPLICAS, new_replicas)
+                if new_replicas and trial.first_replica_seconds is None:
+                    trial.first_replica_seconds = seconds
+                replicas = new_replicas
+            if status != trial_status or not replica_ids <= new_replica_ids:
+                left_prior_state = True
+            if left_prior_state and self._probe_succeeds():
+                trial.ready_seconds = record(TimelineEventType.READY, status.value)
+                return trial
+            if time.monotonic() - start >= self.timeout_seconds:
+                return trial
+            time.sleep(self.poll_interval_seconds)
+
+    def _probe_succeeds(self) -> bool:
+        try:
+            self.probe(self.deployment)
+        except Exception:
+            return False
+        return True
+
+    def _prepare(self, transition: DeploymentTransition) -> None:
+        """Bring the deployment into the state the transition starts from."""
+        name = self.deployment_name
+        service = self._containers_service
+        if transition == DeploymentTransition.RESUME:
+            service.pause_deployment(name)
+            self._wait_for(
+                lambda: service.get_deployment_status(name) == ContainerDeploymentStatus.PAUSED,
+                'paused',
+            )
+        elif transition == DeploymentTransition.SCALE_FROM_ZERO:
+            self._wait_for(lambda: not service.get_deployment_replicas(name), 'scaled to zero')
+
+    def _wait_for(self, condition: Callable[[], bool], description: str) -> None:
+        deadline = time.monotonic() + self.timeout_seconds
+        while not condition():
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f'Deployment {self.deployment_name} not {description} '
+                    f'after {self.timeout_seconds} seconds'
+                )
+            time.sleep(self.poll_interval_seconds)
@@ -13,7 +13,12 @@ from typing import Any
 from dataclasses_json import Undefined, dataclass_json  # type: ignore
 
 from verda.http_client import HTTPClient
-from verda.inference_client import InferenceClient, InferenceResponse
+from verda.inference_client import (
+    AsyncInferenceClient,
+    InferenceClient,
+    InferenceResponse,
+    default_client_registry,
+)
 
 # API endpoints
 CONTAINER_DEPLOYMENTS_ENDPOINT = '/container-deployments'
@@ -407,30 +412,70 @@ class Deployment:
             data: Dictionary containing deployment data.
             inference_key: Inference key to set on the deployment.
 
+        Deployments with the same endpoint and inference key share one inference client
+        and its connection pool.
+
         Returns:
             Deployment: A new Deployment instance with the inference client initialized.
         """
         deployment = Deployment.from_dict(data, infer_missing=True)
         if inference_key and deployment.endpoint_base_url:
-            deployment._inference_client = InferenceClient(
-                inference_key=inference_key,
-                endpoint_base_url=deployment.endpoint_base_url,
+            deployment._inference_client = default_client_registry.get(
+                inference_key, deployment.endpoint_base_url
             )
         return deployment
 
-    def set_inference_client(self, inference_key: str) -> None:
+    def set_inference_client(self, inference_key: str, **client_options) -> None:
         """Sets the inference client for this deployment.
 
+        The client is shared with other deployments using the same endpoint and inference
+        key. Passing client options replaces the shared client with a newly configured one.
+
         Args:
             inference_key: The inference key to use for authentication.
+            **client_options: Additional options passed to InferenceClient,
+                e.g. pool_maxsize or pool_block.
 
         Raises:
             ValueError: If endpoint_base_url is not set.
         """
         if self.endpoint_base_url is None:
             raise ValueError('Endpoint base URL must be set to use inference client')
-        self._inference_client = InferenceClient(
-            inference_key=inference_key, endpoint_base_url=self.endpoint_base_url
+        self._inference_client = default_client_registry.get(
+            inference_key, self.endpoint_base_url, **client_options
+        )
+
+    @property
+    def inference_client(self) -> InferenceClient:
+        """The inference client for this deployment.
+
+        Raises:
+            ValueError: If inference client is not initialized.
+        """
+        self._validate_inference_client()
+        return self._inference_client
+
+    def create_async_inference_client(self, **client_options) -> AsyncInferenceClient:
+        """Creates an asyncio inference client for this deployment.
+
+        The returned client owns its own connection pool and should be closed with
+        ``await client.aclose()`` or used as an ``async with`` context manager.
+
+        Args:
+            **client_options: Additional options passed to AsyncInferenceClient,
+                e.g. max_connections, max_keepalive_connections or keepalive_expiry.
+
+        Returns:
+            AsyncInferenceClient: A new async client bound to this deployment's endpoint.
+
+        Raises:
+            ValueError: If inference client is not initialized.
+        """
+        self._validate_inference_client()
+        return AsyncInferenceClient(
+            inference_key=self._inference_client.inference_key,
+            endpoint_base_url=self.endpoint_base_url,
+            **client_options,
         )
 
     def _validate_inference_client(self) -> None:
@@ -527,6 +572,11 @@ class Deployment:
     healthcheck = health
 
 
+def _check_health(deployment: Deployment) -> Any:
+    """Run a deployment's health check, the default probe of the deployment utilities."""
+    return deployment.health()
+
+
 @dataclass_json
 @dataclass
 class ReplicaInfo:
@@ -0,0 +1,324 @@
+"""Keeping container deployments warm to avoid cold starts."""
+
+import dataclasses
+import threading
+import warnings
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, tzinfo
+from time import sleep
+from typing import Any
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+from ._containers import ContainersService, Deployment, _check_health
+
+# attempts and pause between them when restoring the scaling options on close()
+_RESTORE_ATTEMPTS = 3
+_RESTORE_RETRY_SECONDS = 2.0
+
+
+@dataclass
+class WarmWindow:
+    """A recurring time of day during which a deployment is kept warm.
+
+    Attributes:
+        start: Time of day the window starts.
+        end: Time of day the window ends. A window ending before it starts runs past
+            midnight.
+        weekdays: Days the window starts on, 0 for Monday to 6 for Sunday. Every day if
+            None.
+    """
+
+    start: time
+    end: time
+    weekdays: tuple[int, ...] | None = None
+
+    def contains(self, moment: datetime) -> bool:
+        """Whether a moment falls inside the window.
+
+        Args:
+            moment: The moment to check
+
+        Returns:
+            bool: True if the moment is inside the window
+        """
+        now = moment.timetz() if self.start.tzinfo is not None else moment.time()
+        if self.start <= self.end:
+            return self.start <= now < self.end and self._starts_on(moment)
+        if now >= self.start:
+            return self._starts_on(moment)
+        if now < self.end:
+            return self._starts_on(moment - timedelta(days=1))
+        return False
+
+    def _starts_on(self, moment: datetime) -> bool:
+        return self.weekdays is None or moment.weekday() in self.weekdays
+
+
+@dataclass
+class TrafficForecast:
+    """A forecast traffic spike the deployment is scaled up for ahead of time.
+
+    Attributes:
+        start: When the spike is expected to start.
+        end: When the spike is expected to be over.
+        min_replica_count: Replicas to keep running during the spike.
+        lead_seconds: How long before the start to scale up, at least the cold start
+            time of a replica.
+    """
+
+    start: datetime
+    end: datetime
+    min_replica_count: int
+    lead_seconds: float = 600.0
+
+    def is_active(self, moment: datetime) -> bool:
+        """Whether the deployment should be scaled up for the forecast at a moment."""
+        return self.start - timedelta(seconds=self.lead_seconds) <= moment < self.end
+
+
+@dataclass_json
+@dataclass
+class WarmKeeperStats:
+    """Counters describing what a warm-keeper did.
+
+    Attributes:
+        pings: Number of pings sent.
+        failed_pings: Number of pings that raised an exception.
+        last_ping_at: ISO timestamp of the most recent ping, if any.
+        last_error: Message of the most recent failed ping or scaling update, if any.
+        scaling_updates: Number of times the scaling options were updated.
+        scale_errors: Number of times looking up or updating the scaling options failed.
+        prescaled_min_replica_count: Minimum replica count currently set for a forecast,
+            None while the deployment's own setting applies.
+    """
+
+    pings: int = 0
+    failed_pings: int = 0
+    last_ping_at: str | None = None
+    last_error: str | None = None
+    scaling_updates: int = 0
+    scale_errors: int = 0
+    prescaled_min_replica_count: int | None = None
+
+
+class DeploymentWarmKeeper:
+    """Keeps a deployment warm during configured hours, and pre-scales it for spikes.
+
+    A deployment scaling to zero replicas has to download its model again on the next
+    request. During its warm windows the keeper pings the deployment every
+    `ping_interval_seconds`, by default with `Deployment.health()`. Health checks may
+    not count as load for the autoscaler; pass a `ping` sending a lightweight inference
+    request to keep replicas from being scaled down. With `keep_connections` above 1,
+    that many pings are sent concurrently so the inference client's pool keeps as many
+    connections open; size its `pool_maxsize` accordingly.
+
+    While a traffic forecast is active, the deployment's `min_replica_count` is raised
+    to the forecast's, and restored once no forecast is active anymore.
+
+    Example:
+        ```
+        keeper = DeploymentWarmKeeper(
+            verda.containers,
+            'my-deployment',
+            windows=[WarmWindow(time(8), time(20), weekdays=(0, 1, 2, 3, 4))],
+            forecasts=[TrafficForecast(launch_time, launch_time + timedelta(hours=2), 4)],
+        )
+        keeper.start()
+        ```
+    """
+
+    def __init__(
+        self,
+        containers_service: ContainersService,
+        deployment_name: str,
+        windows: Iterable[WarmWindow] | None = None,
+        forecasts: Iterable[TrafficForecast] = (),
+        ping_interval_seconds: float = 60.0,
+        ping: Callable[[Deployment], Any] | None = None,
+        keep_connections: int = 1,
+        tz: tzinfo | None = None,
+    ) -> None:
+        """Initialize the warm-keeper.
+
+        Args:
+            containers_service: Service used to look up and scale the deployment; needs an
+                inference key unless `ping` doesn't use the deployment's inference client
+            deployment_name: Name of the deployment
+            windows: Times to keep the deployment warm, always if None
+            forecasts: Traffic spikes to scale up for ahead of time
+            ping_interval_seconds: Seconds between pings
+            ping: Called with the deployment to ping it, defaults to `Deployment.health()`
+            keep_connections: Number of pings sent concurrently
+            tz: Timezone of the windows and forecasts, local time if None
+
+        Raises:
+            ValueError: If keep_connections is less than 1
+        """
+        if keep_connections < 1:
+            raise ValueError('keep_connections must be at least 1')
+        self._containers_service = containers_service
+        self.deployment_name = deployment_name
+        self.windows = list(windows) if windows is not None else None
+        self.forecasts = list(forecasts)
+        self.ping_interval_seconds = ping_interval_seconds
+        self.ping = ping or _check_health
+        self.keep_connections = keep_connections
+        self.tz = tz
+        self._deployment: Deployment | None = None
+        self._original_min_replica_count: int | None = None
+        self._lock = threading.Lock()
+        self._stats = WarmKeeperStats()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._executor = (
+            ThreadPoolExecutor(max_workers=keep_connections) if keep_connections > 1 else None
+        )
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def start(self) -> None:
+        """Run the keeper in a background thread, checking once now and then every interval."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='verda-warm-keeper', daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the background thread and restore the deployment's minimum replica count.
+
+        Restoring is retried a few times; if it still fails, a RuntimeWarning is emitted
+        and the failures are counted in `stats.scale_errors`.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        for attempt in range(_RESTORE_ATTEMPTS):
+            if attempt:
+                sleep(_RESTORE_RETRY_SECONDS)
+            if self._scale(None):
+                return
+        warnings.warn(
+            f'Could not restore the minimum replica count of {self.deployment_name}: '
+            f'{self.stats.last_error}',
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+    @property
+    def stats(self) -> WarmKeeperStats:
+        """Snapshot of the warm-keeper counters."""
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    @property
+    def deployment(self) -> Deployment:
+        """The kept deployment, looked up on first use."""
+        if self._deployment is None:
+            self._deployment = self._containers_service.get_deployment_by_name(self.deployment_name)
+        return self._deployment
+
+    def is_warm_time(self, moment: datetime | None = None) -> bool:
+        """Whether the deployment should be kept warm at a moment.
+
+        Args:
+            moment: The moment to check, now if None
+
+        Returns:
+            bool: True if the moment is inside a warm window
+        """
+        moment = moment or datetime.now(self.tz)
+        return self.windows is None or any(window.contains(moment) for window in self.windows)
+
+    def run_once(self, moment: datetime | None = None) -> None:
+        """Pre-scale or restore the deployment for the forecasts, and ping it if warm time.
+
+        Called every interval by the background thread; can also be called from a
+        scheduler of your own instead of using `start()`. A failed scaling update doesn't
+        keep the deployment from being pinged; both failures are counted in `stats`.
+
+        Args:
+            moment: The current time, now if None
+        """
+        moment = moment or datetime.now(self.tz)
+        active = [forecast for forecast in self.forecasts if forecast.is_active(moment)]
+        self._scale(max((f.min_replica_count for f in active), default=None))
+        if self.is_warm_time(moment):
+            self._ping_all()
+
+    def _run(self) -> None:
+        while True:
+            self.run_once()
+            if self._stop.wait(self.ping_interval_seconds):
+                return
+
+    def _ping_all(self) -> None:
+        if self._executor is None:
+            self._ping()
+            return
+        futures = [self._executor.submit(self._ping) for _ in range(self.keep_connections)]
+        for future in futures:
+            future.result()
+
+    def _ping(self) -> None:
+        error = None
+        try:
+            self.ping(self.deployment)
+        except Exception as e:
+            error = e
+        with self._lock:
+            self._stats.pings += 1
+            self._stats.last_ping_at = datetime.now(self.tz).isoformat()
+            if error is not None:
+                self._stats.failed_pings += 1
+                self._stats.last_error = str(error)
+
+    def _scale(self, min_replica_count: int | None) -> bool:
+        """Apply a forecast's replica count, recording failures instead of raising."""
+        try:
+            self._apply_forecast(min_replica_count)
+        except Exception as e:
+            # the control-plane API may be briefly unavailable, try again next time
+            with self._lock:
+                self._stats.scale_errors += 1
+                self._stats.last_error = str(e)
+            return False
+        return True
+
+    def _apply_forecast(self, min_replica_count: int | None) -> None:
+        """Set the minimum replica count for a forecast, or restore it for None."""
+        if min_replica_count is None and self._original_min_replica_count is None:
+            return
+        if min_replica_count == self._stats.prescaled_min_replica_count:
+            return
+        scaling = self._containers_service.get_deployment_scaling_options(self.deployment_name)
+        if min_replica_count is None:
+            target = self._original_min_replica_count
+        else:
+            if self._original_min_replica_count is None:
+                self._original_min_replica_count = scaling.min_replica_count
+            target = max(
+                min(min_replica_count, scaling.max_replica_count),
+                self._original_min_replica_count,
+            )
+        if target != scaling.min_replica_count:
+            self._containers_service.update_deployment_scaling_options(
+                self.deployment_name, dataclasses.replace(scaling, min_replica_count=target)
+            )
+            with self._lock:
+                self._stats.scaling_updates += 1
+        with self._lock:
+            self._stats.prescaled_min_replica_count = min_replica_count
+        if min_replica_count is None:
+            self._original_min_replica_count = None
@@ -1 +1,7 @@
+from ._circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitBreakerStats,
+    CircuitState,
+)
 from ._http_client import HTTPClient, handle_error
@@ -0,0 +1,217 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+@dataclass
+class CircuitBreakerPolicy:
+    """When a circuit breaker opens and how it recovers.
+
+    :param failure_rate_threshold: fraction of failed calls in the window that opens the circuit
+    :type failure_rate_threshold: float
+    :param minimum_calls: calls needed in the window before the failure rate is evaluated
+    :type minimum_calls: int
+    :param window_size: number of most recent calls the failure rate is computed over
+    :type window_size: int
+    :param open_seconds: how long calls fail fast before the circuit is probed
+    :type open_seconds: float
+    :param half_open_calls: trial calls let through while half-open, if there is no probe
+    :type half_open_calls: int
+    """
+
+    failure_rate_threshold: float = 0.5
+    minimum_calls: int = 10
+    window_size: int = 50
+    open_seconds: float = 30.0
+    half_open_calls: int = 1
+
+
+@dataclass_json
+@dataclass
+class CircuitBreakerStats:
+    """Snapshot of a circuit breaker.
+
+    :param state: current state
+    :type state: CircuitState
+    :param calls: number of calls in the failure rate window
+    :type calls: int
+    :param failure_rate: fraction of failed calls in the window
+    :type failure_rate: float
+    :param rejected: number of calls failed fast
+    :type rejected: int
+    :param times_opened: number of times the circuit opened
+    :type times_opened: int
+    """
+
+    state: CircuitState
+    calls: int
+    failure_rate: float
+    rejected: int
+    times_opened: int
+
+
+class CircuitBreaker:
+    """Fails calls fast while the service behind them is failing.
+
+    The breaker is closed while the failure rate over the last `window_size` calls stays
+    below `failure_rate_threshold`. Once it is reached the breaker opens and `allow()`
+    returns False for `open_seconds`, so callers fail immediately instead of waiting for
+    timeouts. Then the breaker is half-open: if it has a probe, e.g. a health check, one
+    caller runs it and the breaker closes if it passes; without a probe,
+    `half_open_calls` calls are let through and the first outcome decides. Anything
+    else reopens the breaker.
+
+    A breaker can be shared between threads.
+    """
+
+    def __init__(
+        self,
+        policy: CircuitBreakerPolicy | None = None,
+        probe: Callable[[], Any] | None = None,
+    ) -> None:
+        """Initialize a closed circuit breaker.
+
+        :param policy: circuit breaker policy, defaults to CircuitBreakerPolicy()
+        :type policy: CircuitBreakerPolicy, optional
+        :param probe: called while half-open, raising means the service is still failing;
+            takes precedence over the probe passed to `allow()`
+        :type probe: Callable, optional
+        """
+        self.policy = policy or CircuitBreakerPolicy()
+        self.probe = probe
+        self._lock = threading.Lock()
+        self._outcomes: deque[bool] = deque(maxlen=self.policy.window_size)
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        self._probing = False
+        self._rejected = 0
+        self._times_opened = 0
+
+    def _current_state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.policy.open_seconds
+        ):
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the breaker."""
+        with self._lock:
+            return self._current_state()
+
+    def stats(self) -> CircuitBreakerStats:
+        """Snapshot of the breaker's state and counters."""
+        with self._lock:
+            calls = len(self._outcomes)
+            return CircuitBreakerStats(
+                state=self._current_state(),
+                calls=calls,
+                failure_rate=self._failures / calls if calls else 0.0,
+                rejected=self._rejected,
+                times_opened=self._times_opened,
+            )
+
+    def allow(self, probe: Callable[[], Any] | None = None) -> bool:
+        """Whether a call may go ahead. Every allowed call must report its outcome.
+
+        :param probe: health check to run while half-open, if the breaker has none
+        :type probe: Callable, optional
+        :return: False if the call should fail fast
+        :rtype: bool
+        """
+        probe = self.probe or probe
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state != self._state:
+                self._state = state
+                self._trials = 0
+            if state == CircuitState.OPEN or (probe is not None and self._probing):
+                self._rejected += 1
+                return False
+            if probe is None:
+                if self._trials >= self.policy.half_open_calls:
+                    self._rejected += 1
+                    return False
+                self._trials += 1
+                return True
+            self._probing = True
+
+        try:
+            probe()
+            healthy = True
+        except Exception:
+            healthy = False
+        with self._lock:
+            self._probing = False
+            if healthy:
+                self._close()
+                return True
+            self._open()
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Report a call that reached a working service."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._close()
+            elif self._state == CircuitState.CLOSED:
+                self._add(failed=False)
+
+    def record_failure(self) -> None:
+        """Report a call that failed because of the service."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._open()
+            elif self._state == CircuitState.CLOSED:
+                self._add(failed=True)
+                calls = len(self._outcomes)
+                if (
+                    calls >= self.policy.minimum_calls
+                    and self._failures / calls >= self.policy.failure_rate_threshold
+                ):
+                    self._open()
+
+    def reset(self) -> None:
+        """Close the breaker and forget all recorded calls."""
+        with self._lock:
+            self._close()
+
+    def _add(self, failed: bool) -> None:
+        if len(self._outcomes) == self._outcomes.maxlen:
+            self._failures -= self._outcomes[0]
+        self._outcomes.append(failed)
+        self._failures += failed
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+        self._outcomes.clear()
+        self._failures = 0
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._failures = 0
+        self._trials = 0
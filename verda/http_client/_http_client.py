@@ -1,10 +1,14 @@
 import json
+import threading
 
 import requests
 
 from verda._version import __version__
+from verda.constants import ErrorCodes
 from verda.exceptions import APIException
 
+from ._circuit_breaker import CircuitBreaker, CircuitBreakerPolicy
+
 
 def handle_error(response: requests.Response) -> None:
     """Checks for the response status code and raises an exception if it's 400 or higher.
@@ -25,14 +29,36 @@ class HTTPClient:
     For each request, it adds the authentication header with an access token.
     If the access token is expired it refreshes it before calling the specified API endpoint.
     Also checks the response status code and raises an exception if needed.
+
+    With a circuit breaker policy, every API route gets its own circuit breaker: once
+    a route keeps failing with connection errors, timeouts or 5xx responses, its
+    requests fail fast with a `service_unavailable` APIException until it recovers.
     """
 
-    def __init__(self, auth_service, base_url: str) -> None:
+    def __init__(
+        self,
+        auth_service,
+        base_url: str,
+        circuit_breaker_policy: CircuitBreakerPolicy | None = None,
+    ) -> None:
         self._version = __version__
         self._base_url = base_url
         self._auth_service = auth_service
+        self._circuit_breaker_policy = circuit_breaker_policy
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self._circuit_breakers_lock = threading.Lock()
         self._auth_service.authenticate()
 
+    @property
+    def circuit_breakers(self) -> dict[str, CircuitBreaker]:
+        """The circuit breakers created so far, by route, e.g. "GET /instances".
+
+        :return: circuit breakers by route
+        :rtype: dict[str, CircuitBreaker]
+        """
+        with self._circuit_breakers_lock:
+            return dict(self._circuit_breakers)
+
     def post(
         self, url: str, json: dict | None = None, params: dict | None = None, **kwargs
     ) -> requests.Response:
@@ -56,13 +82,11 @@ class HTTPClient:
         """
         self._refresh_token_if_expired()
 
-        url = self._add_base_url(url)
         headers = self._generate_headers()
 
-        response = requests.post(url, json=json, headers=headers, params=params, **kwargs)
-        handle_error(response)
-
-        return response
+        return self._send(
+            requests.post, 'POST', url, json=json, headers=headers, params=params, **kwargs
+        )
 
     def put(
         self, url: str, json: dict | None = None, params: dict | None = None, **kwargs
@@ -87,13 +111,11 @@ class HTTPClient:
         """
         self._refresh_token_if_expired()
 
-        url = self._add_base_url(url)
         headers = self._generate_headers()
 
-        response = requests.put(url, json=json, headers=headers, params=params, **kwargs)
-        handle_error(response)
-
-        return response
+        return self._send(
+            requests.put, 'PUT', url, json=json, headers=headers, params=params, **kwargs
+        )
 
     def get(self, url: str, params: dict | None = None, **kwargs) -> requests.Response:
         """Sends a GET request.
@@ -114,13 +136,9 @@ class HTTPClient:
         """
         self._refresh_token_if_expired()
 
-        url = self._add_base_url(url)
         headers = self._generate_headers()
 
-        response = requests.get(url, params=params, headers=headers, **kwargs)
-        handle_error(response)
-
-        return response
+        return self._send(requests.get, 'GET', url, params=params, headers=headers, **kwargs)
 
     def patch(
         self, url: str, json: dict | None = None, params: dict | None = None, **kwargs
@@ -145,13 +163,11 @@ class HTTPClient:
         """
         self._refresh_token_if_expired()
 
-        url = self._add_base_url(url)
         headers = self._generate_headers()
 
-        response = requests.patch(url, json=json, headers=headers, params=params, **kwargs)
-        handle_error(response)
-
-        return response
+        return self._send(
+            requests.patch, 'PATCH', url, json=json, headers=headers, params=params, **kwargs
+        )
 
     def delete(
         self, url: str, json: dict | None = None, params: dict | None = None, **kwargs
@@ -176,10 +192,66 @@ class HTTPClient:
         """
         self._refresh_token_if_expired()
 
-        url = self._add_base_url(url)
         headers = self._generate_headers()
 
-        response = requests.delete(url, headers=headers, json=json, params=params, **kwargs)
+        return self._send(
+            requests.delete, 'DELETE', url, headers=headers, json=json, params=params, **kwargs
+        )
+
+    def _route_circuit_breaker(self, method: str, url: str) -> CircuitBreaker | None:
+        """Get the circuit breaker of an API route, creating it on first use.
+
+        Routes are keyed by method and first path segment, so requests for different
+        resources of the same kind share a breaker.
+
+        :param method: HTTP method
+        :type method: str
+        :param url: relative url of the API endpoint
+        :type url: str
+        :return: the route's circuit breaker, or None without a circuit breaker policy
+        :rtype: CircuitBreaker, optional
+        """
+        if self._circuit_breaker_policy is None:
+            return None
+        route = f'{method} /{url.lstrip("/").split("/")[0].split("?")[0]}'
+        with self._circuit_breakers_lock:
+            breaker = self._circuit_breakers.get(route)
+            if breaker is None:
+                breaker = CircuitBreaker(self._circuit_breaker_policy)
+                self._circuit_breakers[route] = breaker
+            return breaker
+
+    def _send(self, send, method: str, url: str, **kwargs) -> requests.Response:
+        """Sends a request through the route's circuit breaker and checks the response.
+
+        :param send: requests function sending the request
+        :type send: Callable
+        :param method: HTTP method
+        :type method: str
+        :param url: relative url of the API endpoint
+        :type url: str
+
+        :raises APIException: an api exception with message and error type code
+
+        :return: Response object
+        :rtype: requests.Response
+        """
+        breaker = self._route_circuit_breaker(method, url)
+        if breaker is not None and not breaker.allow():
+            raise APIException(
+                ErrorCodes.SERVICE_UNAVAILABLE,
+                f'{method} {url} failed fast, its circuit breaker is open after repeated failures',
+            )
+        failed = True
+        try:
+            response = send(self._add_base_url(url), **kwargs)
+            failed = response.status_code >= 500
+        finally:
+            if breaker is not None:
+                if failed:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
         handle_error(response)
 
         return response
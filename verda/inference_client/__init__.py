@@ -1,7 +1,66 @@
+from ._async_inference_client import (
+    AsyncClientInferenceExecution,
+    AsyncInferenceClient,
+    AsyncInferenceResponse,
+)
+from ._batch import BatchInferenceRunner, BatchReport, RetryPolicy, read_jsonl
+from ._bench import (
+    BenchmarkReport,
+    BenchmarkSample,
+    InferenceBenchmark,
+    RequestTemplate,
+    write_reports_csv,
+)
+from ._cache import CachedInferenceClient, CacheStats, InferenceCache, cache_key
+from ._concurrency import (
+    AdaptiveConcurrencyInferenceClient,
+    AdaptiveConcurrencyLimit,
+    ConcurrencyStats,
+)
+from ._embeddings import EmbeddingBatcher
+from ._hedging import HedgedInferenceClient, HedgingPolicy, HedgingStats
 from ._inference_client import (
     AsyncInferenceExecution,
     AsyncStatus,
+    ConnectionPoolStats,
     InferenceClient,
     InferenceClientError,
     InferenceResponse,
 )
+from ._journal import ExecutionJournal, JournalEntry
+from ._load_balancer import EndpointStats, LoadBalancedInferenceClient, LoadBalancingStrategy
+from ._micro_batching import MicroBatchingInferenceClient, MicroBatchStats
+from ._openai import (
+    AsyncCompletionStream,
+    AsyncOpenAICompatibleClient,
+    ChatCompletion,
+    ChatCompletionChoice,
+    ChatMessage,
+    Completion,
+    CompletionChoice,
+    CompletionStream,
+    Embedding,
+    EmbeddingsResponse,
+    OpenAICompatibleClient,
+    Usage,
+)
+from ._payload import RawBody
+from ._polling import AsyncExecutionScheduler, PollingPolicy, default_execution_scheduler
+from ._registry import InferenceClientRegistry, default_client_registry
+from ._sse import (
+    NDJSONParser,
+    ServerSentEvent,
+    SSEParser,
+    iter_ndjson,
+    iter_sse_events,
+    iter_sse_json,
+)
+from ._stats import Histogram, HistogramSnapshot, LatencySummary
+from ._tensors import decode_tensor, encode_tensor, tensor_from_json, tensor_to_json
+from ._token_metrics import (
+    DeploymentTokenMetrics,
+    StreamMetrics,
+    TokenMetrics,
+    default_token_metrics,
+)
+from ._upload import MultipartBody, MultipartFile, StreamingBody
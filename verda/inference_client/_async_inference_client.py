@@ -0,0 +1,676 @@
+import os
+import time
+import warnings
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    httpx = None
+
+from ._body_reader import MIN_CHUNK_SIZE, _is_buffer_destination, _next_chunk_size
+from ._inference_client import (
+    AsyncStatus,
+    InferenceClientError,
+    _BaseInferenceClient,
+    _is_stream_headers,
+)
+from ._payload import (
+    BytesLike,
+    RawBody,
+    _body_headers,
+    _with_content_type,
+    is_msgpack,
+    unpack_msgpack,
+)
+from ._sse import (
+    SSE_DONE_MARKER,
+    ServerSentEvent,
+    aiter_ndjson,
+    aiter_sse_events,
+    aiter_sse_json,
+    is_event_stream,
+)
+from ._token_metrics import StreamMetrics, _StreamRecorder
+from ._upload import DEFAULT_UPLOAD_CHUNK_SIZE, MultipartBody, StreamingBody, _body_kwargs
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 5.0
+
+
+def _require_httpx() -> None:
+    """Raise a helpful error if the optional httpx dependency is not installed.
+
+    Raises:
+        InferenceClientError: If httpx cannot be imported
+    """
+    if httpx is None:
+        raise InferenceClientError(
+            'AsyncInferenceClient requires the httpx package, '
+            'install it with: pip install "verda[async]"'
+        )
+
+
+async def _aiter_slices(view: memoryview) -> AsyncIterator[memoryview]:
+    """Yield a flat buffer in upload-sized slices that share its memory."""
+    for start in range(0, len(view), DEFAULT_UPLOAD_CHUNK_SIZE):
+        yield view[start : start + DEFAULT_UPLOAD_CHUNK_SIZE]
+
+
+@dataclass
+class AsyncInferenceResponse:
+    """Inference response returned by AsyncInferenceClient.
+
+    A streamed response holds a pooled connection until its body has been read to the
+    end or it is closed, see `InferenceResponse`. Use it with `async with` or call
+    `aclose()` when the body may be left unread. Iterating a streamed response records
+    its `stream_metrics`, as for `InferenceResponse`.
+    """
+
+    headers: 'httpx.Headers'
+    status_code: int
+    status_text: str
+    _original_response: 'httpx.Response'
+    _stream: bool = False
+    _on_leak: Callable[[], Any] | None = field(default=None, repr=False, compare=False)
+    _sent_at: float | None = field(default=None, repr=False, compare=False)
+    _on_stream_end: Callable[[StreamMetrics, list[float]], Any] | None = field(
+        default=None, repr=False, compare=False
+    )
+    _stream_metrics: StreamMetrics | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def __del__(self):
+        if not self._stream or self._original_response.is_closed:
+            return
+        # the connection can only be released from the event loop, so just report it
+        warnings.warn(
+            f'Streamed AsyncInferenceResponse from {self._original_response.url} was not '
+            'read to the end or closed, its connection was not returned to the pool. Use '
+            'it with async with or call aclose().',
+            ResourceWarning,
+            source=self,
+            stacklevel=2,
+        )
+        if self._on_leak is not None:
+            self._on_leak()
+
+    @property
+    def stream_metrics(self) -> StreamMetrics | None:
+        """Timing and token counts of the response stream, once it has been iterated.
+
+        None if the client's `token_metrics` is None.
+        """
+        return self._stream_metrics
+
+    def _recorder(self) -> _StreamRecorder | None:
+        """Recorder for iterating the body, None if the client doesn't record metrics."""
+        return _StreamRecorder(self._sent_at) if self._on_stream_end is not None else None
+
+    def _finish_stream(self, recorder: _StreamRecorder | None) -> None:
+        if recorder is None:
+            return
+        self._stream_metrics = recorder.finish()
+        if self._stream:
+            self._on_stream_end(self._stream_metrics, recorder.intervals)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the response body was consumed or closed."""
+        return self._original_response.is_closed
+
+    async def output(self, is_text: bool = False) -> Any:
+        """Get response output as a string or object."""
+        try:
+            await self._original_response.aread()
+            if is_text:
+                return self._original_response.text
+            if is_msgpack(self._original_response.headers.get('Content-Type')):
+                return unpack_msgpack(self._original_response.content)
+            return self._original_response.json()
+        except Exception as e:
+            if self._stream or _is_stream_headers(self._original_response.headers):
+                raise InferenceClientError(
+                    'Response might be a stream, use the stream method instead'
+                ) from e
+            raise InferenceClientError(f'Failed to parse response as JSON: {e!s}') from e
+
+    async def stream(
+        self, chunk_size: int = 512, as_text: bool = True
+    ) -> AsyncGenerator[Any, None]:
+        """Stream the response content.
+
+        Args:
+            chunk_size: Size of chunks to stream, in bytes. Only used for binary streaming.
+            as_text: If True, stream decoded text lines. If False, stream binary chunks.
+
+        Returns:
+            Async generator yielding chunks of the response
+        """
+        recorder = self._recorder()
+        try:
+            if as_text:
+                async for line in self._original_response.aiter_lines():
+                    if line:
+                        if recorder is not None:
+                            recorder.line(line)
+                        yield line
+            else:
+                async for chunk in self._original_response.aiter_bytes(chunk_size=chunk_size):
+                    if chunk:
+                        if recorder is not None:
+                            recorder.chunk()
+                        yield chunk
+        finally:
+            self._finish_stream(recorder)
+            await self._original_response.aclose()
+
+    async def events(self) -> AsyncGenerator[ServerSentEvent, None]:
+        """Parse the response body as a stream of Server-Sent Events.
+
+        Returns:
+            Async generator yielding parsed events
+        """
+        recorder = self._recorder()
+        try:
+            async for event in aiter_sse_events(self._original_response.aiter_bytes()):
+                if recorder is not None:
+                    recorder.event(event)
+                yield event
+        finally:
+            self._finish_stream(recorder)
+            await self._original_response.aclose()
+
+    async def stream_json(
+        self, done_marker: str | None = SSE_DONE_MARKER
+    ) -> AsyncGenerator[Any, None]:
+        """Stream decoded JSON chunks from a Server-Sent Events or NDJSON response.
+
+        Args:
+            done_marker: Event data that ends an event stream, as sent by
+                OpenAI-compatible servers
+
+        Returns:
+            Async generator yielding decoded JSON values
+        """
+        chunks = self._original_response.aiter_bytes()
+        if is_event_stream(self.headers.get('Content-Type')):
+            values = aiter_sse_json(chunks, done_marker)
+        else:
+            values = aiter_ndjson(chunks)
+        recorder = self._recorder()
+        try:
+            async for value in values:
+                if recorder is not None:
+                    recorder.value(value)
+                yield value
+        finally:
+            self._finish_stream(recorder)
+            await self._original_response.aclose()
+
+    async def stream_to(self, destination: Any) -> int:
+        """Write the whole response body to a file or a preallocated buffer.
+
+        Args:
+            destination: A file path, a binary file object with a `write` method, or a
+                writable buffer such as a bytearray, memoryview or mmap
+
+        Returns:
+            int: Number of bytes written
+
+        Raises:
+            InferenceClientError: If the body doesn't fit in the destination buffer
+        """
+        try:
+            if isinstance(destination, str | os.PathLike):
+                with open(destination, 'wb') as f:
+                    return await self._write_chunks(f.write)
+            if not _is_buffer_destination(destination):
+                return await self._write_chunks(destination.write)
+
+            view = memoryview(destination).cast('B')
+            written = 0
+            async for chunk in self._original_response.aiter_bytes():
+                if written + len(chunk) > len(view):
+                    raise InferenceClientError(
+                        f'Response body is larger than the destination buffer of {len(view)} bytes'
+                    )
+                view[written : written + len(chunk)] = chunk
+                written += len(chunk)
+            return written
+        finally:
+            await self._original_response.aclose()
+
+    async def _write_chunks(self, write: Callable[[memoryview], Any]) -> int:
+        """Copy the body through a reused buffer, sized like the sync `stream_to`."""
+        written = 0
+        chunk_size = MIN_CHUNK_SIZE
+        buffer = memoryview(bytearray(chunk_size))
+        filled = 0
+        async for chunk in self._original_response.aiter_bytes():
+            data = memoryview(chunk)
+            while data:
+                n = min(len(data), chunk_size - filled)
+                buffer[filled : filled + n] = data[:n]
+                data = data[n:]
+                filled += n
+                if filled < chunk_size:
+                    break
+                write(buffer)
+                written += filled
+                next_size = _next_chunk_size(chunk_size, filled)
+                if next_size != chunk_size:
+                    chunk_size = next_size
+                    buffer = memoryview(bytearray(chunk_size))
+                filled = 0
+        if filled:
+            write(buffer[:filled])
+            written += filled
+        return written
+
+    async def aclose(self) -> None:
+        """Release the underlying connection back to the pool."""
+        await self._original_response.aclose()
+
+
+class AsyncInferenceClient(_BaseInferenceClient):
+    """Asyncio inference client backed by a pooled httpx.AsyncClient."""
+
+    def __init__(
+        self,
+        inference_key: str,
+        endpoint_base_url: str,
+        timeout_seconds: int = 60 * 5,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+    ) -> None:
+        """Initialize the AsyncInferenceClient.
+
+        Args:
+            inference_key: The authentication key for the API
+            endpoint_base_url: The base URL for the API
+            timeout_seconds: Request timeout in seconds
+            max_connections: Maximum number of concurrent connections in the pool
+            max_keepalive_connections: Maximum number of idle connections kept alive
+            keepalive_expiry: Seconds an idle keep-alive connection is kept open
+
+        Raises:
+            InferenceClientError: If the parameters are invalid or httpx is not installed
+        """
+        _require_httpx()
+        super().__init__(inference_key, endpoint_base_url, timeout_seconds)
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=timeout_seconds,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self._client.aclose()
+
+    async def _make_request(
+        self, method: str, path: str, stream: bool = False, **kwargs
+    ) -> 'httpx.Response':
+        """Make an HTTP request with error handling.
+
+        Args:
+            method: HTTP method to use
+            path: API endpoint path
+            stream: If True, return before the response body is read
+            **kwargs: Additional arguments to pass to the request
+
+        Returns:
+            Response object from the request
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        timeout = kwargs.pop('timeout_seconds', None)
+        if timeout is None:
+            timeout = self.timeout_seconds
+        headers = kwargs.pop('headers', None)
+        body = kwargs.get('data')
+        if isinstance(body, RawBody):
+            headers = _body_headers(headers, body)
+            body = kwargs['data'] = body.content
+        # httpx takes raw bodies as `content`, form fields as `data`
+        if isinstance(body, str | bytes):
+            kwargs['content'] = kwargs.pop('data')
+        elif isinstance(body, bytearray | memoryview):
+            # httpx would iterate these item by item, send slices instead of a copy
+            kwargs.pop('data')
+            view = memoryview(body).cast('B')
+            kwargs['content'] = _aiter_slices(view)
+            headers = dict(headers or {})
+            headers['Content-Length'] = str(len(view))
+        elif isinstance(body, StreamingBody | MultipartBody):
+            kwargs.pop('data')
+            kwargs['content'] = body.__aiter__()
+            headers = _with_content_type(headers, body.content_type)
+            if body.length is not None:
+                # httpx only sends chunked transfer encoding without a Content-Length
+                headers['Content-Length'] = str(body.length)
+
+        request = self._client.build_request(
+            method=method,
+            url=self._build_url(path),
+            headers=self._build_request_headers(headers),
+            timeout=timeout,
+            **kwargs,
+        )
+        response = None
+        try:
+            response = await self._client.send(request, stream=stream)
+            response.raise_for_status()
+            return response
+        except httpx.TimeoutException as e:
+            raise InferenceClientError(
+                f'Request to {path} timed out after {timeout} seconds'
+            ) from e
+        except httpx.HTTPError as e:
+            status_code = None
+            if response is not None:
+                status_code = response.status_code
+                await response.aclose()
+            raise InferenceClientError(
+                f'Request to {path} failed: {e!s}', status_code=status_code
+            ) from e
+
+    async def run_sync(
+        self,
+        data: dict[str, Any] | RawBody | BytesLike,
+        path: str = '',
+        timeout_seconds: int = 60 * 5,
+        headers: dict[str, str] | None = None,
+        http_method: str = 'POST',
+        stream: bool = False,
+    ) -> AsyncInferenceResponse:
+        """Make a synchronous request to the inference endpoint without blocking the event loop.
+
+        Args:
+            data: The data payload to send with the request, as a JSON-serializable
+                object, a pre-encoded RawBody or raw bytes
+            path: API endpoint path. Defaults to empty string.
+            timeout_seconds: Request timeout in seconds. Defaults to 5 minutes.
+            headers: Optional headers to include in the request
+            http_method: HTTP method to use. Defaults to "POST".
+            stream: Whether to stream the response. Defaults to False.
+
+        Returns:
+            AsyncInferenceResponse: Object containing the response data.
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        sent_at = time.perf_counter()
+        response = await self._make_request(
+            http_method,
+            path,
+            stream=stream,
+            **_body_kwargs(data),
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+        )
+
+        return AsyncInferenceResponse(
+            headers=response.headers,
+            status_code=response.status_code,
+            status_text=response.reason_phrase,
+            _original_response=response,
+            _stream=stream,
+            _on_leak=self._record_leaked_response,
+            _sent_at=sent_at,
+            _on_stream_end=self._record_stream if self.token_metrics is not None else None,
+        )
+
+    async def run(
+        self,
+        data: dict[str, Any] | RawBody | BytesLike,
+        path: str = '',
+        timeout_seconds: int = 60 * 5,
+        headers: dict[str, str] | None = None,
+        http_method: str = 'POST',
+        no_response: bool = False,
+    ) -> 'AsyncClientInferenceExecution | None':
+        """Make an asynchronous request to the inference endpoint.
+
+        Args:
+            data: The data payload to send with the request, as a JSON-serializable
+                object, a pre-encoded RawBody or raw bytes
+            path: API endpoint path. Defaults to empty string.
+            timeout_seconds: Request timeout in seconds. Defaults to 5 minutes.
+            headers: Optional headers to include in the request
+            http_method: HTTP method to use. Defaults to "POST".
+            no_response: If True, don't wait for response. Defaults to False.
+
+        Returns:
+            AsyncClientInferenceExecution: Object to track the async execution status.
+            If no_response is True, returns None.
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        headers = dict(headers or {})
+        if no_response:
+            headers['Prefer'] = 'respond-async-proxy'
+            await self._make_request(
+                http_method,
+                path,
+                **_body_kwargs(data),
+                timeout_seconds=timeout_seconds,
+                headers=headers,
+            )
+            return None
+        headers['Prefer'] = 'respond-async'
+
+        response = await self._make_request(
+            http_method,
+            path,
+            **_body_kwargs(data),
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+        )
+
+        execution_id = response.json()['Id']
+
+        return AsyncClientInferenceExecution(self, execution_id, AsyncStatus.Initialized)
+
+    async def get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: int | None = None,
+    ) -> 'httpx.Response':
+        """Make GET request."""
+        return await self._make_request(
+            'GET', path, params=params, headers=headers, timeout_seconds=timeout_seconds
+        )
+
+    async def post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        data: str | dict[str, Any] | RawBody | BytesLike | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: int | None = None,
+    ) -> 'httpx.Response':
+        """Make POST request."""
+        return await self._make_request(
+            'POST',
+            path,
+            json=json,
+            data=data,
+            params=params,
+            headers=headers,
+            timeout_seconds=timeout_seconds,
+        )
+
+    async def put(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        data: str | dict[str, Any] | RawBody | BytesLike | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: int | None = None,
+    ) -> 'httpx.Response':
+        """Make PUT request."""
+        return await self._make_request(
+            'PUT',
+            path,
+            json=json,
+            data=data,
+            params=params,
+            headers=headers,
+            timeout_seconds=timeout_seconds,
+        )
+
+    async def delete(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: int | None = None,
+    ) -> 'httpx.Response':
+        """Make DELETE request."""
+        return await self._make_request(
+            'DELETE', path, params=params, headers=headers, timeout_seconds=timeout_seconds
+        )
+
+    async def patch(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        data: str | dict[str, Any] | RawBody | BytesLike | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: int | None = None,
+    ) -> 'httpx.Response':
+        """Make PATCH request."""
+        return await self._make_request(
+            'PATCH',
+            path,
+            json=json,
+            data=data,
+            params=params,
+            headers=headers,
+            timeout_seconds=timeout_seconds,
+        )
+
+    async def head(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: int | None = None,
+    ) -> 'httpx.Response':
+        """Make HEAD request."""
+        return await self._make_request(
+            'HEAD', path, params=params, headers=headers, timeout_seconds=timeout_seconds
+        )
+
+    async def options(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: int | None = None,
+    ) -> 'httpx.Response':
+        """Make OPTIONS request."""
+        return await self._make_request(
+            'OPTIONS', path, params=params, headers=headers, timeout_seconds=timeout_seconds
+        )
+
+    async def health(self, healthcheck_path: str = '/health') -> 'httpx.Response':
+        """Check the health status of the API.
+
+        Returns:
+            httpx.Response: The response from the health check
+
+        Raises:
+            InferenceClientError: If the health check fails
+        """
+        try:
+            return await self.get(healthcheck_path)
+        except InferenceClientError as e:
+            raise InferenceClientError(f'Health check failed: {e!s}') from e
+
+
+@dataclass
+class AsyncClientInferenceExecution:
+    """Async inference execution tracked through an AsyncInferenceClient."""
+
+    _inference_client: AsyncInferenceClient
+    id: str
+    _status: AsyncStatus
+    INFERENCE_ID_HEADER = 'X-Inference-Id'
+
+    def status(self) -> AsyncStatus:
+        """Get the current stored status of the async inference execution. Only the status value type.
+
+        Returns:
+            AsyncStatus: The status object
+        """
+        return self._status
+
+    async def status_json(self) -> dict[str, Any]:
+        """Get the current status of the async inference execution. Return the status json.
+
+        Returns:
+            dict[str, Any]: The status response containing the execution status and other metadata
+        """
+        response = await self._inference_client._client.get(
+            self._inference_client._status_url(),
+            headers=self._inference_client._build_request_headers(
+                {self.INFERENCE_ID_HEADER: self.id}
+            ),
+        )
+
+        response_json = response.json()
+        self._status = AsyncStatus(response_json['Status'])
+
+        return response_json
+
+    async def result(self) -> dict[str, Any]:
+        """Get the results of the async inference execution.
+
+        Returns:
+            dict[str, Any]: The results of the inference execution
+        """
+        response = await self._inference_client._client.get(
+            self._inference_client._result_url(),
+            headers=self._inference_client._build_request_headers(
+                {self.INFERENCE_ID_HEADER: self.id}
+            ),
+        )
+
+        if response.headers['Content-Type'] == 'application/json':
+            return response.json()
+        else:
+            return {'result': response.text}
+
+    # alias for get_results
+    output = result
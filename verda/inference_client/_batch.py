@@ -0,0 +1,292 @@
+import json
+import os
+import random
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import IO, Any, NamedTuple
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+from ._inference_client import InferenceClient, InferenceClientError
+from ._stats import LatencySummary
+
+DEFAULT_RETRY_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
+
+@dataclass
+class RetryPolicy:
+    """Retry policy for failed inference requests.
+
+    Requests failing without an HTTP response (timeouts, connection errors) are always
+    retried; requests failing with an HTTP status are retried only for `retry_on_status`.
+
+    Attributes:
+        max_attempts: Maximum number of attempts per request, including the first one.
+        backoff_seconds: Delay before the first retry.
+        backoff_multiplier: Factor the delay grows by after each retry.
+        max_backoff_seconds: Upper bound for the delay between retries.
+        jitter: Whether to randomize the delay to avoid synchronized retries.
+        retry_on_status: HTTP status codes that are worth retrying.
+    """
+
+    max_attempts: int = 3
+    backoff_seconds: float = 1.0
+    backoff_multiplier: float = 2.0
+    max_backoff_seconds: float = 30.0
+    jitter: bool = True
+    retry_on_status: tuple[int, ...] = DEFAULT_RETRY_STATUS_CODES
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Whether a failed attempt should be retried.
+
+        Args:
+            error: The exception raised by the attempt
+
+        Returns:
+            bool: True if the request should be retried
+        """
+        if not isinstance(error, InferenceClientError):
+            return False
+        return error.status_code is None or error.status_code in self.retry_on_status
+
+    def delay(self, attempt: int) -> float:
+        """Delay before the given retry.
+
+        Args:
+            attempt: Number of the attempt that just failed, starting at 1
+
+        Returns:
+            float: Seconds to wait before the next attempt
+        """
+        delay = min(
+            self.backoff_seconds * self.backoff_multiplier ** (attempt - 1),
+            self.max_backoff_seconds,
+        )
+        if self.jitter:
+            delay *= random.uniform(0.5, 1.0)
+        return delay
+
+
+@dataclass_json
+@dataclass
+class BatchReport:
+    """Summary of a batch inference run.
+
+    Attributes:
+        total: Number of items read from the input.
+        succeeded: Number of items that completed successfully in this run.
+        failed: Number of items that failed after all retries.
+        skipped: Number of items skipped because the checkpoint marked them complete.
+        retries: Number of retried attempts.
+        elapsed_seconds: Wall-clock duration of the run.
+        latency: Per-item latency of successful items, including retries.
+    """
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    retries: int = 0
+    elapsed_seconds: float = 0.0
+    latency: LatencySummary = field(default_factory=LatencySummary)
+
+    @property
+    def throughput(self) -> float:
+        """Completed items (successful or failed) per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return (self.succeeded + self.failed) / self.elapsed_seconds
+
+
+class _ItemResult(NamedTuple):
+    """Outcome of a single batch item."""
+
+    output: Any
+    error: Exception | None
+    retries: int
+    latency_seconds: float
+
+
+def read_jsonl(path: str | os.PathLike) -> Iterator[dict[str, Any]]:
+    """Lazily read JSON objects from a JSONL file, skipping blank lines.
+
+    Args:
+        path: Path to the JSONL file
+
+    Returns:
+        Iterator over the decoded objects
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class BatchInferenceRunner:
+    """Runs many inference requests against a deployment with bounded concurrency.
+
+    Results are written as JSON lines ``{"index": ..., "output": ..., "error": ...}`` as
+    soon as they are available, either in input order or as they complete. When a
+    checkpoint file is given, the indices of successful items are appended to it after
+    their output is written, and a later run with the same checkpoint skips them.
+    Failed items are not checkpointed, so a resumed run retries them. Delivery is
+    at-least-once: a crash between writing an output and its checkpoint entry can
+    repeat that output line on resume.
+    """
+
+    def __init__(
+        self,
+        inference_client: InferenceClient,
+        path: str = '',
+        concurrency: int = 8,
+        retry_policy: RetryPolicy | None = None,
+        ordered: bool = True,
+        timeout_seconds: int = 60 * 5,
+        headers: dict[str, str] | None = None,
+        request_fn: Callable[[dict[str, Any]], Any] | None = None,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            inference_client: Client used to send the requests
+            path: API endpoint path the inputs are sent to
+            concurrency: Maximum number of requests in flight
+            retry_policy: Retry policy, defaults to RetryPolicy()
+            ordered: If True, write outputs in input order, otherwise as they complete
+            timeout_seconds: Timeout of a single request attempt
+            headers: Optional headers to include in every request
+            request_fn: Optional callable sending one input and returning its output,
+                replaces the default `run_sync(...).output()` call
+        """
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        self._inference_client = inference_client
+        self.path = path
+        self.concurrency = concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.ordered = ordered
+        self.timeout_seconds = timeout_seconds
+        self.headers = headers
+        self._request_fn = request_fn or self._default_request
+
+    def _default_request(self, data: dict[str, Any]) -> Any:
+        """Send one input with run_sync and return the decoded output."""
+        response = self._inference_client.run_sync(
+            data, path=self.path, timeout_seconds=self.timeout_seconds, headers=self.headers
+        )
+        try:
+            return response.output()
+        except InferenceClientError:
+            return response.output(is_text=True)
+
+    def _process(self, data: dict[str, Any]) -> _ItemResult:
+        """Send one input, retrying according to the retry policy."""
+        policy = self.retry_policy
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                output = self._request_fn(data)
+                return _ItemResult(output, None, attempt - 1, time.monotonic() - start)
+            except Exception as e:
+                if attempt >= policy.max_attempts or not policy.is_retryable(e):
+                    return _ItemResult(None, e, attempt - 1, time.monotonic() - start)
+                time.sleep(policy.delay(attempt))
+                attempt += 1
+
+    def run(
+        self,
+        inputs: str | os.PathLike | Iterable[dict[str, Any]],
+        output: str | os.PathLike | IO[str],
+        checkpoint_path: str | os.PathLike | None = None,
+    ) -> BatchReport:
+        """Run all inputs and stream their outputs.
+
+        Args:
+            inputs: Path to a JSONL file or an iterable of request payloads
+            output: Path of the JSONL output file (appended to) or a writable text stream
+            checkpoint_path: Optional path of the checkpoint file used to resume runs
+
+        Returns:
+            BatchReport: Counts, throughput and latency percentiles of the run
+        """
+        if isinstance(inputs, str | os.PathLike):
+            inputs = read_jsonl(inputs)
+        completed = _load_checkpoint(checkpoint_path)
+
+        owns_output = isinstance(output, str | os.PathLike)
+        out = open(output, 'a', encoding='utf-8') if owns_output else output
+        checkpoint = open(checkpoint_path, 'a', encoding='utf-8') if checkpoint_path else None
+
+        report = BatchReport()
+        latencies: list[float] = []
+        start = time.monotonic()
+
+        def emit(index: int, future: Future) -> None:
+            item = future.result()
+            report.retries += item.retries
+            if item.error is not None:
+                report.failed += 1
+                record = {'index': index, 'output': None, 'error': str(item.error)}
+            else:
+                report.succeeded += 1
+                latencies.append(item.latency_seconds)
+                record = {'index': index, 'output': item.output, 'error': None}
+            out.write(json.dumps(record) + '\n')
+            out.flush()
+            if checkpoint is not None and item.error is None:
+                checkpoint.write(f'{index}\n')
+                checkpoint.flush()
+
+        running: dict[Future, int] = {}
+        # in ordered mode, finished results wait behind slower earlier ones; bound that buffer
+        unemitted: deque[int] = deque()
+        finished: dict[int, Future] = {}
+        max_unemitted = self.concurrency * 4
+
+        def drain() -> None:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                if self.ordered:
+                    finished[index] = future
+                else:
+                    emit(index, future)
+            while unemitted and unemitted[0] in finished:
+                index = unemitted.popleft()
+                emit(index, finished.pop(index))
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                for index, data in enumerate(inputs):
+                    report.total += 1
+                    if index in completed:
+                        report.skipped += 1
+                        continue
+                    while len(running) >= self.concurrency or len(unemitted) >= max_unemitted:
+                        drain()
+                    running[executor.submit(self._process, data)] = index
+                    if self.ordered:
+                        unemitted.append(index)
+                while running:
+                    drain()
+        finally:
+            if owns_output:
+                out.close()
+            if checkpoint is not None:
+                checkpoint.close()
+
+        report.elapsed_seconds = time.monotonic() - start
+        report.latency = LatencySummary.from_samples(latencies)
+        return report
+
+
+def _load_checkpoint(checkpoint_path: str | os.PathLike | None) -> set[int]:
+    """Read the indices of completed items from a checkpoint file, if it exists."""
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return set()
+    with open(checkpoint_path, encoding='utf-8') as f:
+        return {int(line) for line in f if line.strip()}
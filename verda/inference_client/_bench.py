@@ -0,0 +1,458 @@
+import csv
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import IO, Any
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+from ._inference_client import InferenceClient, InferenceClientError
+from ._polling import AsyncExecutionScheduler, PollingPolicy
+from ._stats import LatencySummary
+
+INDEX_PLACEHOLDER = '{{index}}'
+
+# poll async executions often, so polling adds little to the measured latency
+BENCHMARK_POLLING_POLICY = PollingPolicy(
+    initial_interval_seconds=0.05, max_interval_seconds=0.5, backoff_multiplier=1.2, jitter=False
+)
+
+
+@dataclass
+class RequestTemplate:
+    """Requests sent by a benchmark.
+
+    Payloads are used in turn, and the placeholder `{{index}}` in any string of a
+    payload is replaced by the request's index, e.g. to defeat response caches.
+
+    Attributes:
+        payloads: JSON-serializable request payloads.
+        path: API endpoint path.
+        http_method: HTTP method.
+        headers: Optional headers sent with every request.
+    """
+
+    payloads: Sequence[Any] = field(default_factory=lambda: [{}])
+    path: str = ''
+    http_method: str = 'POST'
+    headers: dict[str, str] | None = None
+
+    @classmethod
+    def from_file(cls, filename: str | os.PathLike, **kwargs) -> 'RequestTemplate':
+        """Load payloads from a JSON file, or one payload per line from a JSONL file.
+
+        Args:
+            filename: Path of a .json or .jsonl file
+            **kwargs: Additional arguments passed to RequestTemplate
+
+        Returns:
+            RequestTemplate: The template
+        """
+        with open(filename, encoding='utf-8') as f:
+            if os.fspath(filename).endswith('.jsonl'):
+                payloads = [json.loads(line) for line in f if line.strip()]
+            else:
+                payloads = [json.load(f)]
+        return cls(payloads, **kwargs)
+
+    def render(self, index: int) -> Any:
+        """The payload of the request with the given index."""
+        return _substitute(self.payloads[index % len(self.payloads)], str(index))
+
+
+def _substitute(value: Any, index: str) -> Any:
+    if isinstance(value, str):
+        return value.replace(INDEX_PLACEHOLDER, index)
+    if isinstance(value, dict):
+        return {key: _substitute(item, index) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_substitute(item, index) for item in value]
+    return value
+
+
+@dataclass_json
+@dataclass
+class BenchmarkSample:
+    """Outcome of one benchmark request.
+
+    Attributes:
+        index: Index of the request.
+        started_at: Seconds since the start of the run the request was due.
+        latency: Seconds from when the request was due until it completed.
+        ttfb: Seconds from when the request was due until the first byte of a streamed
+            response body arrived.
+        status_code: HTTP status of a failed request, if one was received.
+        error: Error of a failed request.
+    """
+
+    index: int
+    started_at: float
+    latency: float
+    ttfb: float | None = None
+    status_code: int | None = None
+    error: str | None = None
+
+
+@dataclass_json
+@dataclass
+class BenchmarkReport:
+    """Results of one benchmark run.
+
+    Attributes:
+        mode: 'closed' for fixed concurrency, 'open' for a fixed arrival rate.
+        concurrency: Number of concurrent requests of a closed-loop run.
+        rate: Target requests per second of an open-loop run.
+        requests: Number of requests sent, excluding warm-up requests.
+        succeeded: Number of successful requests.
+        failed: Number of failed requests.
+        duration_seconds: Wall-clock time of the run.
+        rps: Completed requests per second.
+        error_rate: Fraction of requests that failed.
+        errors: Failed requests by HTTP status, or 'no_response' for timeouts and
+            connection errors.
+        latency: Latency of the successful requests.
+        ttfb: Time to the first response byte of successful streamed requests.
+    """
+
+    mode: str
+    concurrency: int | None
+    rate: float | None
+    requests: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    duration_seconds: float = 0.0
+    rps: float = 0.0
+    error_rate: float = 0.0
+    errors: dict[str, int] = field(default_factory=dict)
+    latency: LatencySummary = field(default_factory=LatencySummary)
+    ttfb: LatencySummary | None = None
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: list[BenchmarkSample],
+        duration_seconds: float,
+        mode: str,
+        concurrency: int | None = None,
+        rate: float | None = None,
+    ) -> 'BenchmarkReport':
+        """Summarize the samples of a run.
+
+        Args:
+            samples: Samples of the measured requests
+            duration_seconds: Wall-clock time of the run
+            mode: 'closed' or 'open'
+            concurrency: Concurrency of a closed-loop run
+            rate: Arrival rate of an open-loop run
+
+        Returns:
+            BenchmarkReport: The report
+        """
+        succeeded = [s for s in samples if s.error is None]
+        errors = Counter(
+            str(s.status_code) if s.status_code is not None else 'no_response'
+            for s in samples
+            if s.error is not None
+        )
+        ttfbs = [s.ttfb for s in succeeded if s.ttfb is not None]
+        return cls(
+            mode=mode,
+            concurrency=concurrency,
+            rate=rate,
+            requests=len(samples),
+            succeeded=len(succeeded),
+            failed=len(samples) - len(succeeded),
+            duration_seconds=duration_seconds,
+            rps=len(samples) / duration_seconds if duration_seconds > 0 else 0.0,
+            error_rate=(len(samples) - len(succeeded)) / len(samples) if samples else 0.0,
+            errors=dict(errors),
+            latency=LatencySummary.from_samples(s.latency for s in succeeded),
+            ttfb=LatencySummary.from_samples(ttfbs) if ttfbs else None,
+        )
+
+
+_CSV_FIELDS = (
+    'mode',
+    'concurrency',
+    'rate',
+    'requests',
+    'succeeded',
+    'failed',
+    'duration_seconds',
+    'rps',
+    'error_rate',
+)
+_CSV_SUMMARY_FIELDS = ('mean', 'p50', 'p90', 'p99', 'max')
+
+
+def write_reports_csv(reports: Sequence[BenchmarkReport], file: IO[str]) -> None:
+    """Write benchmark reports as CSV, one row per run, e.g. for a latency curve.
+
+    Args:
+        reports: Reports to write
+        file: Text file to write to, opened with newline=''
+    """
+    writer = csv.writer(file)
+    writer.writerow(
+        [
+            *_CSV_FIELDS,
+            *(f'latency_{name}' for name in _CSV_SUMMARY_FIELDS),
+            *(f'ttfb_{name}' for name in _CSV_SUMMARY_FIELDS),
+            'errors',
+        ]
+    )
+    for report in reports:
+        writer.writerow(
+            [
+                *(getattr(report, name) for name in _CSV_FIELDS),
+                *(getattr(report.latency, name) for name in _CSV_SUMMARY_FIELDS),
+                *(
+                    getattr(report.ttfb, name) if report.ttfb is not None else ''
+                    for name in _CSV_SUMMARY_FIELDS
+                ),
+                json.dumps(report.errors),
+            ]
+        )
+
+
+class InferenceBenchmark:
+    """Load generator measuring the latency and throughput of an inference endpoint.
+
+    Closed-loop runs keep a fixed number of requests in flight, the way a fixed pool
+    of workers would. Open-loop runs send requests at Poisson-distributed arrival
+    times regardless of how fast earlier ones complete, the way independent users
+    would; their latency is measured from when a request was due, so queueing caused
+    by a saturated endpoint is included rather than hidden.
+
+    Requests are sent with `run_sync`, or with `run` and polled to completion when
+    `async_requests` is set. Streamed requests also measure the time to the first byte
+    of the response body.
+
+    Example:
+        ```
+        benchmark = InferenceBenchmark(client, RequestTemplate([{'prompt': 'hi'}]))
+        curve = [benchmark.closed_loop(concurrency, requests=200) for concurrency in (1, 4, 16)]
+        ```
+    """
+
+    def __init__(
+        self,
+        inference_client: InferenceClient,
+        template: RequestTemplate | None = None,
+        async_requests: bool = False,
+        stream: bool = False,
+        timeout_seconds: int = 60 * 5,
+        polling_policy: PollingPolicy | None = None,
+    ) -> None:
+        """Initialize the benchmark.
+
+        Args:
+            inference_client: Client of the endpoint under test
+            template: Requests to send, defaults to an empty JSON object
+            async_requests: If True, send requests with `run` and poll for the result
+            stream: If True, stream responses and measure the time to first byte
+            timeout_seconds: Timeout of each request
+            polling_policy: Polling policy of async requests, polls every 50 to 500
+                milliseconds by default
+
+        Raises:
+            InferenceClientError: If both async_requests and stream are set
+        """
+        if async_requests and stream:
+            raise InferenceClientError('Async requests cannot be streamed')
+        self.inference_client = inference_client
+        self.template = template or RequestTemplate()
+        self.async_requests = async_requests
+        self.stream = stream
+        self.timeout_seconds = timeout_seconds
+        self.polling_policy = polling_policy or BENCHMARK_POLLING_POLICY
+
+    def _send(self, index: int, scheduler: AsyncExecutionScheduler | None) -> float | None:
+        """Send one request and wait for it to complete.
+
+        Returns:
+            float | None: perf_counter time the first body byte of a streamed response
+            arrived at
+        """
+        template = self.template
+        data = template.render(index)
+        if scheduler is not None:
+            execution = self.inference_client.run(
+                data, template.path, self.timeout_seconds, template.headers, template.http_method
+            )
+            scheduler.add(execution).result(timeout=self.timeout_seconds)
+            return None
+        with self.inference_client.run_sync(
+            data,
+            template.path,
+            self.timeout_seconds,
+            template.headers,
+            template.http_method,
+            stream=self.stream,
+        ) as response:
+            if not self.stream:
+                return None
+            first_byte_at = None
+            for _chunk in response.stream(as_text=False):
+                if first_byte_at is None:
+                    first_byte_at = time.perf_counter()
+            return first_byte_at
+
+    def _measure(
+        self,
+        index: int,
+        due: float,
+        start: float,
+        scheduler: AsyncExecutionScheduler | None,
+    ) -> BenchmarkSample:
+        try:
+            first_byte_at = self._send(index, scheduler)
+        except Exception as e:
+            return BenchmarkSample(
+                index,
+                due - start,
+                time.perf_counter() - due,
+                status_code=getattr(e, 'status_code', None),
+                error=str(e) or type(e).__name__,
+            )
+        return BenchmarkSample(
+            index,
+            due - start,
+            time.perf_counter() - due,
+            ttfb=first_byte_at - due if first_byte_at is not None else None,
+        )
+
+    def _scheduler(self) -> AsyncExecutionScheduler | None:
+        if not self.async_requests:
+            return None
+        return AsyncExecutionScheduler(self.polling_policy, max_concurrent_polls=32)
+
+    def closed_loop(
+        self,
+        concurrency: int,
+        requests: int | None = None,
+        duration_seconds: float | None = None,
+        warmup_requests: int = 0,
+    ) -> BenchmarkReport:
+        """Run with a fixed number of requests in flight.
+
+        Args:
+            concurrency: Number of concurrent requests
+            requests: Number of requests to send
+            duration_seconds: Stop sending requests after this many seconds
+            warmup_requests: Requests sent before measuring, e.g. to open connections
+
+        Returns:
+            BenchmarkReport: The results
+
+        Raises:
+            InferenceClientError: If neither requests nor duration_seconds is given
+        """
+        _check_limits(requests, duration_seconds)
+        scheduler = self._scheduler()
+        try:
+            self._warm_up(warmup_requests, concurrency, scheduler)
+            samples: list[BenchmarkSample] = []
+            indices = itertools.count(warmup_requests)
+            lock = threading.Lock()
+            start = time.perf_counter()
+            deadline = start + duration_seconds if duration_seconds is not None else None
+
+            def worker() -> None:
+                while True:
+                    with lock:
+                        index = next(indices)
+                    if requests is not None and index - warmup_requests >= requests:
+                        return
+                    due = time.perf_counter()
+                    if deadline is not None and due >= deadline:
+                        return
+                    sample = self._measure(index, due, start, scheduler)
+                    with lock:
+                        samples.append(sample)
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for _ in range(concurrency):
+                    executor.submit(worker)
+            duration = time.perf_counter() - start
+        finally:
+            if scheduler is not None:
+                scheduler.close()
+        samples.sort(key=lambda s: s.index)
+        return BenchmarkReport.from_samples(samples, duration, 'closed', concurrency=concurrency)
+
+    def open_loop(
+        self,
+        rate: float,
+        requests: int | None = None,
+        duration_seconds: float | None = None,
+        warmup_requests: int = 0,
+        max_in_flight: int = 256,
+        seed: int | None = None,
+    ) -> BenchmarkReport:
+        """Run with Poisson-distributed arrivals at a fixed average rate.
+
+        Args:
+            rate: Average number of requests per second
+            requests: Number of requests to send
+            duration_seconds: Stop sending requests after this many seconds
+            warmup_requests: Requests sent before measuring, e.g. to open connections
+            max_in_flight: Maximum number of requests in flight; later arrivals wait
+                and their waiting time counts towards their latency
+            seed: Optional seed of the arrival times, for repeatable runs
+
+        Returns:
+            BenchmarkReport: The results
+
+        Raises:
+            InferenceClientError: If neither requests nor duration_seconds is given
+        """
+        _check_limits(requests, duration_seconds)
+        if rate <= 0:
+            raise InferenceClientError('rate must be positive')
+        arrivals = random.Random(seed)
+        scheduler = self._scheduler()
+        try:
+            self._warm_up(warmup_requests, min(max_in_flight, 8), scheduler)
+            with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+                futures = []
+                start = time.perf_counter()
+                due = start
+                for index in itertools.count(warmup_requests):
+                    if requests is not None and index - warmup_requests >= requests:
+                        break
+                    due += arrivals.expovariate(rate)
+                    if duration_seconds is not None and due - start >= duration_seconds:
+                        break
+                    delay = due - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    futures.append(executor.submit(self._measure, index, due, start, scheduler))
+                wait(futures)
+                duration = time.perf_counter() - start
+        finally:
+            if scheduler is not None:
+                scheduler.close()
+        samples = [future.result() for future in futures]
+        return BenchmarkReport.from_samples(samples, duration, 'open', rate=rate)
+
+    def _warm_up(
+        self, requests: int, concurrency: int, scheduler: AsyncExecutionScheduler | None
+    ) -> None:
+        if requests <= 0:
+            return
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            now = time.perf_counter()
+            list(executor.map(lambda i: self._measure(i, now, now, scheduler), range(requests)))
+
+
+def _check_limits(requests: int | None, duration_seconds: float | None) -> None:
+    if requests is None and duration_seconds is None:
+        raise InferenceClientError('Pass requests, duration_seconds or both')
@@ -0,0 +1,91 @@
+import mmap
+import os
+from collections.abc import Iterator
+from typing import Any
+
+import requests
+
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class _BodyReader:
+    """Reads a response body into caller-provided buffers.
+
+    Identity-encoded streamed bodies are read with the raw stream's `readinto`, in reads
+    as large as the destination allows, instead of going through requests' small
+    per-chunk bytes objects. Compressed bodies are decoded by requests and copied out of
+    its chunks, and bodies that were already downloaded are copied from memory.
+    """
+
+    def __init__(self, response: requests.Response) -> None:
+        self._response = response
+        self._pending = memoryview(b'')
+        self._raw = None
+        self._chunks: Iterator[bytes] = iter(())
+        if response._content_consumed or response.raw is None:
+            self._pending = memoryview(response.content or b'')
+        elif response.headers.get('Content-Encoding', 'identity').lower() in ('', 'identity'):
+            self._raw = response.raw
+        else:
+            self._chunks = response.iter_content(chunk_size=MIN_CHUNK_SIZE)
+
+    def readinto(self, view: memoryview) -> int:
+        """Read up to len(view) bytes into view, returning 0 at the end of the body."""
+        while not self._pending and self._raw is None:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        if self._pending:
+            n = min(len(view), len(self._pending))
+            view[:n] = self._pending[:n]
+            self._pending = self._pending[n:]
+            return n
+        if self._raw is not None:
+            return self._raw.readinto(view) or 0
+        return 0
+
+    def readinto_full(self, view: memoryview) -> int:
+        """Fill view as far as the body allows, returning the number of bytes written."""
+        total = 0
+        while total < len(view):
+            n = self.readinto(view[total:])
+            if not n:
+                break
+            total += n
+        return total
+
+    def write_to(self, file: Any) -> int:
+        """Copy the rest of the body to a binary file object through a reused buffer."""
+        total = 0
+        chunk_size = MIN_CHUNK_SIZE
+        buffer = memoryview(bytearray(chunk_size))
+        while True:
+            n = self.readinto_full(buffer)
+            if not n:
+                return total
+            file.write(buffer[:n])
+            total += n
+            next_size = _next_chunk_size(chunk_size, n)
+            if next_size != chunk_size:
+                chunk_size = next_size
+                buffer = memoryview(bytearray(chunk_size))
+
+
+def _next_chunk_size(chunk_size: int, filled: int) -> int:
+    """Size of the next chunk after one of chunk_size bytes received filled bytes.
+
+    The chunk doubles while reads keep filling it, up to MAX_CHUNK_SIZE, so large bodies
+    take few syscalls and writes.
+    """
+    if filled == chunk_size and chunk_size < MAX_CHUNK_SIZE:
+        return chunk_size * 2
+    return chunk_size
+
+
+def _is_buffer_destination(destination: Any) -> bool:
+    """Whether the destination should be filled through the buffer protocol."""
+    if isinstance(destination, mmap.mmap):
+        return True
+    return not hasattr(destination, 'write') and not isinstance(destination, str | os.PathLike)
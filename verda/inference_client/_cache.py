@@ -0,0 +1,446 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from typing import Any, NamedTuple
+from urllib.parse import urlencode
+
+import requests
+from dataclasses_json import dataclass_json  # type: ignore
+from requests.structures import CaseInsensitiveDict
+
+from ._inference_client import InferenceClient, InferenceResponse
+from ._payload import BytesLike, RawBody
+
+# names of the files the disk tier writes, sha256 hex digests from cache_key()
+_DISK_KEY = re.compile(r'[0-9a-f]{64}')
+
+
+@dataclass_json
+@dataclass
+class CacheStats:
+    """Inference cache counters.
+
+    Attributes:
+        hits: Lookups answered from memory.
+        disk_hits: Lookups answered from the disk tier.
+        misses: Lookups that had to reach the endpoint.
+        evictions: Entries dropped from memory, moved to disk if it is enabled.
+        expirations: Entries found expired on lookup.
+    """
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+class _CacheEntry(NamedTuple):
+    expires_at: float | None
+    status_code: int
+    reason: str
+    headers: dict[str, str]
+    body: bytes
+
+    def is_expired(self, now: float) -> bool:
+        return self.expires_at is not None and self.expires_at <= now
+
+
+def cache_key(
+    method: str,
+    path: str,
+    body: Any = None,
+    headers: dict[str, str] | None = None,
+    key_headers: Iterable[str] = (),
+    endpoint_base_url: str | None = None,
+) -> str:
+    """Canonical cache key of an inference request.
+
+    JSON bodies are serialized with sorted keys, so dicts that differ only in key order
+    map to the same key. Only the headers named in `key_headers` are part of the key.
+
+    Args:
+        method: HTTP method
+        path: API endpoint path
+        body: JSON-serializable payload, RawBody, or raw str/bytes body
+        headers: Request headers
+        key_headers: Names of the headers that affect the response
+        endpoint_base_url: Base URL of the deployment, so deployments sharing a cache
+            don't answer each other's requests
+
+    Returns:
+        str: Hex SHA-256 digest identifying the request
+
+    Raises:
+        TypeError: If the body is neither raw nor JSON-serializable
+    """
+    digest = hashlib.sha256()
+    if endpoint_base_url is not None:
+        digest.update(b'u' + endpoint_base_url.rstrip('/').encode() + b'\0')
+    digest.update(method.upper().encode())
+    digest.update(b'\0' + path.strip('/').encode() + b'\0')
+    lowered = {k.lower(): v for k, v in (headers or {}).items()}
+    for name in sorted({h.lower() for h in key_headers}):
+        digest.update(f'{name}={lowered.get(name, "")}\0'.encode())
+    if isinstance(body, RawBody):
+        digest.update(f'r{body.content_type}\0'.encode())
+        for name, value in sorted((body.headers or {}).items()):
+            digest.update(f'{name.lower()}={value}\0'.encode())
+        digest.update(body.view())
+    elif isinstance(body, bytes | bytearray | memoryview):
+        digest.update(b'b')
+        digest.update(memoryview(body).cast('B'))
+    elif isinstance(body, str):
+        digest.update(b's' + body.encode())
+    else:
+        digest.update(b'j' + json.dumps(body, sort_keys=True, separators=(',', ':')).encode())
+    return digest.hexdigest()
+
+
+class InferenceCache:
+    """Bounded in-memory LRU cache of inference responses with an optional disk tier.
+
+    Entries evicted from memory are written to `disk_path` when it is set and looked up
+    there on memory misses, so the disk tier also survives process restarts. Each disk
+    entry is a file holding a JSON metadata line followed by the raw response body,
+    named after its key. Only keys made by `cache_key()` go to disk, and other files in
+    the directory are left alone. Entries that can't be written, e.g. because the disk
+    is full, are dropped.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+        disk_path: str | os.PathLike | None = None,
+        disk_max_bytes: int | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept in memory
+            max_bytes: Optional limit on the total body size kept in memory
+            ttl_seconds: Optional lifetime of an entry
+            disk_path: Optional directory for the on-disk overflow tier
+            disk_max_bytes: Optional limit on the total body size kept on disk
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.disk_path = disk_path
+        self.disk_max_bytes = disk_max_bytes
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._disk_index: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        if disk_path is not None:
+            os.makedirs(disk_path, exist_ok=True)
+            self._load_disk_index()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> _CacheEntry | None:
+        """Look up an entry, promoting disk hits to memory."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.is_expired(now):
+                    self._stats.expirations += 1
+                    self._remove(key)
+                else:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return entry
+            if key in self._disk_index:
+                entry = self._read_disk(key)
+                if entry is not None and entry.is_expired(now):
+                    self._stats.expirations += 1
+                    entry = None
+                if entry is None:
+                    self._remove_disk(key)
+                else:
+                    self._stats.disk_hits += 1
+                    self._remove_disk(key)
+                    self._store(key, entry)
+                    return entry
+            self._stats.misses += 1
+            return None
+
+    def put(self, key: str, status_code: int, reason: str, headers: Any, body: bytes) -> None:
+        """Store a response."""
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds is not None else None
+        entry = _CacheEntry(expires_at, status_code, reason or '', dict(headers), bytes(body))
+        with self._lock:
+            self._remove(key)
+            self._store(key, entry)
+
+    def clear(self) -> None:
+        """Drop all entries from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for key in list(self._disk_index):
+                self._remove_disk(key)
+
+    def _store(self, key: str, entry: _CacheEntry) -> None:
+        self._entries[key] = entry
+        self._bytes += len(entry.body)
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes and len(self._entries) > 1
+        ):
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted.body)
+            self._stats.evictions += 1
+            if (
+                self.disk_path is not None
+                and _DISK_KEY.fullmatch(evicted_key)
+                and not evicted.is_expired(time.time())
+            ):
+                self._write_disk(evicted_key, evicted)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.body)
+
+    def _disk_file(self, key: str) -> str:
+        return os.path.join(self.disk_path, key)
+
+    def _load_disk_index(self) -> None:
+        files = []
+        for name in os.listdir(self.disk_path):
+            full_path = self._disk_file(name)
+            # only files the cache wrote, not interrupted writes or unrelated files
+            if not _DISK_KEY.fullmatch(name):
+                continue
+            if os.path.isfile(full_path):
+                stat = os.stat(full_path)
+                files.append((stat.st_mtime, name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._disk_index[name] = size
+            self._disk_bytes += size
+
+    def _write_disk(self, key: str, entry: _CacheEntry) -> None:
+        metadata = {
+            'expires_at': entry.expires_at,
+            'status_code': entry.status_code,
+            'reason': entry.reason,
+            'headers': entry.headers,
+        }
+        tmp_path = self._disk_file(key) + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(json.dumps(metadata).encode() + b'\n')
+                f.write(entry.body)
+                size = f.tell()
+            os.replace(tmp_path, self._disk_file(key))
+        except OSError:
+            # a full or read-only disk only loses this entry, not the response
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self._remove_disk_index(key)
+        self._disk_index[key] = size
+        self._disk_bytes += size
+        while self.disk_max_bytes is not None and self._disk_bytes > self.disk_max_bytes:
+            self._remove_disk(next(iter(self._disk_index)))
+
+    def _read_disk(self, key: str) -> _CacheEntry | None:
+        try:
+            with open(self._disk_file(key), 'rb') as f:
+                metadata = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return _CacheEntry(
+            metadata['expires_at'],
+            metadata['status_code'],
+            metadata['reason'],
+            metadata['headers'],
+            body,
+        )
+
+    def _remove_disk_index(self, key: str) -> None:
+        size = self._disk_index.pop(key, None)
+        if size is not None:
+            self._disk_bytes -= size
+
+    def _remove_disk(self, key: str) -> None:
+        self._remove_disk_index(key)
+        try:
+            os.remove(self._disk_file(key))
+        except FileNotFoundError:
+            pass
+
+
+def _to_response(entry: _CacheEntry, url: str) -> requests.Response:
+    """Rebuild a fully read requests.Response from a cache entry."""
+    response = requests.Response()
+    response.status_code = entry.status_code
+    response.reason = entry.reason
+    response.headers = CaseInsensitiveDict(entry.headers)
+    response.url = url
+    response._content = entry.body
+    response._content_consumed = True
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+class CachedInferenceClient:
+    """Wraps an InferenceClient to answer repeated deterministic requests from a cache.
+
+    Only use it for endpoints whose output depends solely on the request, such as
+    embeddings or sampling with temperature 0. Streamed requests bypass the cache.
+    """
+
+    def __init__(
+        self,
+        inference_client: InferenceClient,
+        cache: InferenceCache | None = None,
+        key_headers: Iterable[str] = (),
+    ) -> None:
+        """Initialize the cached client.
+
+        Args:
+            inference_client: Client used on cache misses
+            cache: Cache to use, defaults to InferenceCache()
+            key_headers: Names of request headers that affect the response and must be
+                part of the cache key
+        """
+        self._inference_client = inference_client
+        self.cache = cache if cache is not None else InferenceCache()
+        self.key_headers = tuple(key_headers)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        return self.cache.stats
+
+    def _cached(
+        self,
+        method: str,
+        path: str,
+        body: Any,
+        headers: dict[str, str] | None,
+        send,
+        url_path: str | None = None,
+    ):
+        try:
+            key = cache_key(
+                method,
+                path,
+                body,
+                headers,
+                self.key_headers,
+                self._inference_client.endpoint_base_url,
+            )
+        except TypeError:
+            # streaming and other bodies that can't be hashed are never cached
+            return send()
+        entry = self.cache.get(key)
+        if entry is not None:
+            return _to_response(entry, self._inference_client._build_url(url_path or path))
+        response = send()
+        self.cache.put(
+            key, response.status_code, response.reason, response.headers, response.content
+        )
+        return response
+
+    def run_sync(
+        self,
+        data: dict[str, Any] | RawBody | bytes,
+        path: str = '',
+        timeout_seconds: int = 60 * 5,
+        headers: dict[str, str] | None = None,
+        http_method: str = 'POST',
+        stream: bool = False,
+    ) -> InferenceResponse:
+        """Make a synchronous inference request, answering from the cache when possible.
+
+        Args:
+            data: The data payload to send with the request
+            path: API endpoint path. Defaults to empty string.
+            timeout_seconds: Request timeout in seconds. Defaults to 5 minutes.
+            headers: Optional headers to include in the request
+            http_method: HTTP method to use. Defaults to "POST".
+            stream: Whether to stream the response. Streamed requests are not cached.
+
+        Returns:
+            InferenceResponse: The cached or fresh response.
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        if stream:
+            return self._inference_client.run_sync(
+                data, path, timeout_seconds, headers, http_method, stream
+            )
+
+        def send() -> requests.Response:
+            return self._inference_client.run_sync(
+                data, path, timeout_seconds, headers, http_method
+            )._original_response
+
+        response = self._cached(http_method, path, data, headers, send)
+        return InferenceResponse(
+            headers=response.headers,
+            status_code=response.status_code,
+            status_text=response.reason,
+            _original_response=response,
+        )
+
+    def post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        data: str | dict[str, Any] | RawBody | BytesLike | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: int | None = None,
+    ) -> requests.Response:
+        """Make a POST request, answering from the cache when possible."""
+        key_path = path
+        if isinstance(data, RawBody | bytes | bytearray | memoryview):
+            # hash raw bodies as they are, with the query string in the key's path
+            if params:
+                key_path = f'{path}?{urlencode(sorted(params.items()), doseq=True)}'
+            body = data
+        else:
+            body = {'json': json, 'data': data, 'params': params}
+
+        def send() -> requests.Response:
+            return self._inference_client.post(
+                path,
+                json=json,
+                data=data,
+                params=params,
+                headers=headers,
+                timeout_seconds=timeout_seconds,
+            )
+
+        return self._cached('POST', key_path, body, headers, send, path)
@@ -0,0 +1,355 @@
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+from ._inference_client import InferenceClient, InferenceClientError, InferenceResponse
+
+if TYPE_CHECKING:
+    from verda.containers import ContainersService
+
+DEFAULT_OVERLOAD_STATUS_CODES = (429, 503)
+
+
+@dataclass_json
+@dataclass
+class ConcurrencyStats:
+    """Snapshot of an adaptive concurrency limit.
+
+    Attributes:
+        limit: Current number of requests allowed in flight.
+        capacity: Upper bound of the limit, replicas times requests per replica.
+        replicas: Number of replicas the capacity is based on.
+        concurrent_requests_per_replica: Requests each replica handles concurrently.
+        in_flight: Number of requests in flight.
+        requests: Number of requests started.
+        overloads: Number of requests rejected with an overload status code.
+        decreases: Number of times the limit was decreased.
+    """
+
+    limit: int
+    capacity: int
+    replicas: int
+    concurrent_requests_per_replica: int
+    in_flight: int
+    requests: int
+    overloads: int
+    decreases: int
+
+
+class AdaptiveConcurrencyLimit:
+    """Limit on requests in flight, sized by replica capacity and adjusted with AIMD.
+
+    The limit starts at the capacity of the deployment, replicas times concurrent
+    requests per replica. Every request rejected with an overload status code (429 or
+    503) multiplies the limit by `decrease_factor`, at most once per window of requests
+    so a burst of rejections counts as one, and every successful request adds
+    `additive_increase / limit` back until the capacity is reached again. Added replicas
+    raise the limit by their capacity right away, removed replicas cap it at what is
+    left. A deployment scaled to zero still allows `min_limit` requests, so requests can
+    wake it up.
+    """
+
+    def __init__(
+        self,
+        replicas: int = 1,
+        concurrent_requests_per_replica: int = 1,
+        min_limit: int = 1,
+        additive_increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        overload_status_codes: tuple[int, ...] = DEFAULT_OVERLOAD_STATUS_CODES,
+    ) -> None:
+        """Initialize the limit at full capacity.
+
+        Args:
+            replicas: Number of replicas serving requests
+            concurrent_requests_per_replica: Requests each replica handles concurrently
+            min_limit: Lowest limit, also used while there are no replicas
+            additive_increase: Limit added back per limit's worth of successful requests
+            decrease_factor: Factor the limit is multiplied by on overload
+            overload_status_codes: Status codes signalling that the deployment is saturated
+
+        Raises:
+            ValueError: If min_limit, additive_increase or decrease_factor is out of range
+        """
+        if min_limit < 1:
+            raise ValueError('min_limit must be at least 1')
+        if additive_increase <= 0:
+            raise ValueError('additive_increase must be positive')
+        if not 0 < decrease_factor < 1:
+            raise ValueError('decrease_factor must be between 0 and 1')
+        self.min_limit = min_limit
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self.overload_status_codes = overload_status_codes
+        self._condition = threading.Condition()
+        self._replicas = replicas
+        self._per_replica = concurrent_requests_per_replica
+        self._window = float(self._capacity())
+        self._in_flight = 0
+        # requests started before the last decrease don't decrease the limit again
+        self._epoch = 0
+        self._requests = 0
+        self._overloads = 0
+        self._decreases = 0
+
+    def _capacity(self) -> int:
+        return max(self._replicas * self._per_replica, self.min_limit)
+
+    def _limit(self) -> int:
+        return max(int(self._window), self.min_limit)
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        with self._condition:
+            return self._limit()
+
+    def set_capacity(
+        self, replicas: int, concurrent_requests_per_replica: int | None = None
+    ) -> None:
+        """Update the replica count and, optionally, the requests each replica handles.
+
+        Args:
+            replicas: Number of replicas serving requests
+            concurrent_requests_per_replica: Requests each replica handles concurrently,
+                unchanged if None
+        """
+        with self._condition:
+            old_capacity = self._capacity()
+            self._replicas = replicas
+            if concurrent_requests_per_replica is not None:
+                self._per_replica = concurrent_requests_per_replica
+            capacity = self._capacity()
+            # new replicas are idle, so the limit gains their whole capacity at once
+            self._window = min(self._window + max(capacity - old_capacity, 0), capacity)
+            self._condition.notify_all()
+
+    def is_overload(self, error: Exception | None) -> bool:
+        """Whether an error says the deployment has more requests than it can take."""
+        return (
+            isinstance(error, InferenceClientError)
+            and error.status_code in self.overload_status_codes
+        )
+
+    def acquire(self, timeout: float | None = None) -> int:
+        """Wait until a request may be sent and count it as in flight.
+
+        Args:
+            timeout: Maximum number of seconds to wait, None to wait indefinitely
+
+        Returns:
+            int: Token to pass to `release()`
+
+        Raises:
+            InferenceClientError: If no request finished within the timeout
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._in_flight < self._limit(), timeout):
+                raise InferenceClientError(
+                    f'Concurrency limit of {self._limit()} requests still reached '
+                    f'after {timeout} seconds'
+                )
+            self._in_flight += 1
+            self._requests += 1
+            return self._epoch
+
+    def release(self, token: int, error: Exception | None = None) -> None:
+        """Count a request as finished and adjust the limit to its outcome.
+
+        Args:
+            token: Value returned by `acquire()` for the request
+            error: The error the request failed with, if any. Errors other than
+                overloads leave the limit unchanged.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if self.is_overload(error):
+                self._overloads += 1
+                if token == self._epoch:
+                    self._window = max(self._window * self.decrease_factor, self.min_limit)
+                    self._epoch += 1
+                    self._decreases += 1
+            elif error is None:
+                self._window = min(
+                    self._window + self.additive_increase / self._window, self._capacity()
+                )
+            self._condition.notify()
+
+    def stats(self) -> ConcurrencyStats:
+        """Snapshot of the limit and its counters."""
+        with self._condition:
+            return ConcurrencyStats(
+                limit=self._limit(),
+                capacity=self._capacity(),
+                replicas=self._replicas,
+                concurrent_requests_per_replica=self._per_replica,
+                in_flight=self._in_flight,
+                requests=self._requests,
+                overloads=self._overloads,
+                decreases=self._decreases,
+            )
+
+
+class AdaptiveConcurrencyInferenceClient:
+    """Wraps an InferenceClient to keep a deployment's replicas busy without overflowing it.
+
+    `run_sync` calls wait while the adaptive limit is reached. The capacity is refreshed
+    from `capacity_source` in a background thread, so the limit follows the deployment
+    as it scales. A streamed response counts as in flight until it is closed, which
+    happens once it has been iterated to the end.
+
+    Example:
+        ```
+        client = AdaptiveConcurrencyInferenceClient.from_deployment(
+            verda.containers, 'my-deployment'
+        )
+        with ThreadPoolExecutor(max_workers=256) as executor:
+            results = list(executor.map(lambda p: client.run_sync(p).output(), payloads))
+        ```
+    """
+
+    def __init__(
+        self,
+        inference_client: InferenceClient,
+        limit: AdaptiveConcurrencyLimit | None = None,
+        capacity_source: Callable[[], tuple[int, int]] | None = None,
+        refresh_interval_seconds: float | None = 30.0,
+        acquire_timeout_seconds: float | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            inference_client: Client used to send the requests
+            limit: Concurrency limit, defaults to AdaptiveConcurrencyLimit()
+            capacity_source: Callable returning the number of replicas and the concurrent
+                requests per replica. Called once now and then at every refresh.
+            refresh_interval_seconds: If set, refresh the capacity in a background thread
+                at this interval
+            acquire_timeout_seconds: Maximum number of seconds a request waits for the
+                limit, None to wait indefinitely
+        """
+        self._inference_client = inference_client
+        self.limit = limit or AdaptiveConcurrencyLimit()
+        self.capacity_source = capacity_source
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+        self._stop = threading.Event()
+        self._refresh_thread = None
+        if capacity_source is not None:
+            self.refresh()
+            if refresh_interval_seconds:
+                self._refresh_thread = threading.Thread(
+                    target=self._refresh_loop,
+                    args=(refresh_interval_seconds,),
+                    name='verda-concurrency-refresh',
+                    daemon=True,
+                )
+                self._refresh_thread.start()
+
+    @classmethod
+    def from_deployment(
+        cls,
+        containers_service: 'ContainersService',
+        deployment_name: str,
+        inference_client: InferenceClient | None = None,
+        **kwargs,
+    ) -> 'AdaptiveConcurrencyInferenceClient':
+        """Create a client whose capacity follows a container deployment.
+
+        The capacity is the number of running replicas of the deployment times the
+        `concurrent_requests_per_replica` of its scaling options. Replicas that are
+        still starting or already terminating don't count.
+
+        Args:
+            containers_service: Service used to look up the deployment
+            deployment_name: Name of the deployment
+            inference_client: Client used to send the requests, defaults to the
+                deployment's inference client
+            **kwargs: Additional arguments passed to AdaptiveConcurrencyInferenceClient
+
+        Returns:
+            AdaptiveConcurrencyInferenceClient: The client
+        """
+        if inference_client is None:
+            inference_client = containers_service.get_deployment_by_name(
+                deployment_name
+            ).inference_client
+
+        def capacity() -> tuple[int, int]:
+            scaling = containers_service.get_deployment_scaling_options(deployment_name)
+            replicas = containers_service.get_deployment_replicas(deployment_name)
+            running = sum(replica.status == 'running' for replica in replicas)
+            return running, scaling.concurrent_requests_per_replica
+
+        return cls(inference_client, capacity_source=capacity, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Stop refreshing the capacity."""
+        self._stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+
+    @property
+    def stats(self) -> ConcurrencyStats:
+        """Snapshot of the concurrency limit."""
+        return self.limit.stats()
+
+    def refresh(self) -> None:
+        """Update the limit's capacity from the capacity source."""
+        if self.capacity_source is not None:
+            self.limit.set_capacity(*self.capacity_source())
+
+    def _refresh_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception:
+                # keep the last known capacity until the API answers again
+                continue
+
+    def run_sync(
+        self,
+        data: dict[str, Any],
+        path: str = '',
+        timeout_seconds: int = 60 * 5,
+        headers: dict[str, str] | None = None,
+        http_method: str = 'POST',
+        stream: bool = False,
+    ) -> InferenceResponse:
+        """Make a synchronous inference request once the concurrency limit allows it.
+
+        Args:
+            data: The data payload to send with the request
+            path: API endpoint path. Defaults to empty string.
+            timeout_seconds: Request timeout in seconds. Defaults to 5 minutes.
+            headers: Optional headers to include in the request
+            http_method: HTTP method to use. Defaults to "POST".
+            stream: Whether to stream the response. Defaults to False.
+
+        Returns:
+            InferenceResponse: Object containing the response data.
+
+        Raises:
+            InferenceClientError: If the request fails or waiting for the limit timed out
+        """
+        token = self.limit.acquire(self.acquire_timeout_seconds)
+        try:
+            response = self._inference_client.run_sync(
+                data, path, timeout_seconds, headers, http_method, stream
+            )
+        except Exception as e:
+            self.limit.release(token, e)
+            raise
+        if stream:
+            response._on_close = lambda: self.limit.release(token)
+        else:
+            self.limit.release(token)
+        return response
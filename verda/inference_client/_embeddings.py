@@ -0,0 +1,203 @@
+import base64
+import itertools
+import os
+import time
+from collections.abc import Iterable, Iterator, Sized
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from ._batch import RetryPolicy
+from ._inference_client import InferenceClient, InferenceClientError
+from ._tensors import _require_numpy, np
+
+
+class EmbeddingBatcher:
+    """Embeds a corpus through an OpenAI-compatible embeddings endpoint into one matrix.
+
+    Texts are sent in batches with bounded concurrency, and every embedding is written
+    straight into its row of a preallocated float32 array, in input order, instead of
+    collecting lists of lists first. For corpora larger than RAM the array can be a
+    memory-mapped .npy file. With `encoding_format='base64'`, supported by vLLM and
+    others, rows are copied from the decoded bytes without parsing any JSON numbers.
+
+    Requires the numpy package.
+
+    Example:
+        ```
+        batcher = EmbeddingBatcher(deployment.inference_client, model='e5', concurrency=8)
+        matrix = batcher.embed(texts, npy_path='corpus.npy')
+        ```
+    """
+
+    def __init__(
+        self,
+        inference_client: InferenceClient,
+        model: str | None = None,
+        path: str = 'v1/embeddings',
+        batch_size: int = 64,
+        concurrency: int = 4,
+        encoding_format: str = 'float',
+        retry_policy: RetryPolicy | None = None,
+        timeout_seconds: int = 60 * 5,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            inference_client: Client of the deployment serving the embeddings API
+            model: Model name, omitted from requests if None
+            path: API endpoint path of the embeddings API
+            batch_size: Number of texts per request
+            concurrency: Maximum number of requests in flight
+            encoding_format: 'float' for JSON numbers, 'base64' for raw float32 bytes
+            retry_policy: Retry policy, defaults to RetryPolicy()
+            timeout_seconds: Timeout of a single request attempt
+            headers: Optional headers to include in every request
+
+        Raises:
+            InferenceClientError: If numpy is not installed
+        """
+        _require_numpy()
+        if batch_size < 1 or concurrency < 1:
+            raise ValueError('batch_size and concurrency must be at least 1')
+        if encoding_format not in ('float', 'base64'):
+            raise ValueError("encoding_format must be 'float' or 'base64'")
+        self._inference_client = inference_client
+        self.model = model
+        self.path = path
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.encoding_format = encoding_format
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeout_seconds = timeout_seconds
+        self.headers = headers
+
+    def _request(self, texts: list[str]) -> list[dict[str, Any]]:
+        """Send one batch, retrying according to the retry policy."""
+        payload: dict[str, Any] = {'input': texts}
+        if self.model is not None:
+            payload['model'] = self.model
+        if self.encoding_format != 'float':
+            payload['encoding_format'] = self.encoding_format
+        policy = self.retry_policy
+        attempt = 1
+        while True:
+            try:
+                response = self._inference_client.run_sync(
+                    payload, self.path, self.timeout_seconds, self.headers
+                )
+                data = response.output()['data']
+            except Exception as e:
+                if attempt >= policy.max_attempts or not policy.is_retryable(e):
+                    raise
+                time.sleep(policy.delay(attempt))
+                attempt += 1
+                continue
+            return data
+
+    def _vector(self, item: dict[str, Any]) -> Any:
+        embedding = item['embedding']
+        if isinstance(embedding, str):
+            return np.frombuffer(base64.b64decode(embedding), dtype='<f4')
+        return embedding
+
+    def embed(
+        self,
+        texts: Iterable[str],
+        out: Any = None,
+        count: int | None = None,
+        npy_path: str | os.PathLike | None = None,
+    ) -> 'np.ndarray':
+        """Embed texts into a matrix with one row per text, in input order.
+
+        The matrix is allocated once the first response reveals the embedding size,
+        unless `out` is given. Texts are read lazily, so they can come from a generator.
+
+        Args:
+            texts: Texts to embed
+            out: Optional preallocated writable array of shape (number of texts, size)
+            count: Number of texts, if `texts` has no length and `out` isn't given
+            npy_path: Write the matrix to this memory-mapped .npy file instead of RAM
+
+        Returns:
+            np.ndarray: The float32 matrix, `out`, or a np.memmap of the .npy file
+
+        Raises:
+            InferenceClientError: If a request fails after retries, a response doesn't
+                match its batch, or the number of texts doesn't match the matrix
+        """
+        if out is not None:
+            count = len(out)
+        elif count is None:
+            if not isinstance(texts, Sized):
+                raise InferenceClientError('Pass count, or out, for texts without a length')
+            count = len(texts)
+        matrix = out
+
+        def write(start: int, size: int, data: list[dict[str, Any]]) -> None:
+            nonlocal matrix
+            if len(data) != size:
+                raise InferenceClientError(
+                    f'Embeddings response has {len(data)} items for {size} inputs'
+                )
+            seen = set()
+            for position, item in enumerate(data):
+                # servers omitting the index return embeddings in input order
+                index = item.get('index', position)
+                if not isinstance(index, int) or not 0 <= index < size:
+                    raise InferenceClientError(
+                        f'Embeddings response has index {index!r} for {size} inputs'
+                    )
+                if index in seen:
+                    raise InferenceClientError(f'Embeddings response repeats index {index}')
+                seen.add(index)
+                vector = self._vector(item)
+                if matrix is None:
+                    matrix = _allocate(count, len(vector), npy_path)
+                row = start + index
+                if row >= count:
+                    raise InferenceClientError(f'Got more than the expected {count} texts')
+                try:
+                    matrix[row] = vector
+                except ValueError as e:
+                    raise InferenceClientError(f'Embedding {row} does not fit: {e}') from e
+
+        written = 0
+        in_flight: dict[Future, tuple[int, int]] = {}
+
+        def drain(limit: int) -> None:
+            while len(in_flight) > limit:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    write(*in_flight.pop(future), future.result())
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            try:
+                for batch in _batches(texts, self.batch_size):
+                    drain(self.concurrency - 1)
+                    in_flight[executor.submit(self._request, batch)] = (written, len(batch))
+                    written += len(batch)
+                drain(0)
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+        if written != count:
+            raise InferenceClientError(f'Embedded {written} texts, expected {count}')
+        if matrix is None:
+            matrix = _allocate(count, 0, npy_path)
+        if hasattr(matrix, 'flush'):
+            matrix.flush()
+        return matrix
+
+
+def _batches(texts: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(texts)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _allocate(count: int, size: int, npy_path: str | os.PathLike | None) -> 'np.ndarray':
+    if npy_path is not None:
+        return np.lib.format.open_memmap(npy_path, mode='w+', dtype=np.float32, shape=(count, size))
+    return np.empty((count, size), dtype=np.float32)
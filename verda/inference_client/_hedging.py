@@ -0,0 +1,220 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import Any
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+from ._inference_client import InferenceClient, InferenceResponse
+from ._stats import percentile
+
+
+@dataclass
+class HedgingPolicy:
+    """When and how often to send hedged duplicates of slow requests.
+
+    Attributes:
+        percentile: Recent-latency percentile after which a duplicate request is sent.
+        initial_delay_seconds: Hedge delay used until `min_samples` latencies are known.
+        min_delay_seconds: Lower bound for the hedge delay.
+        min_samples: Number of latency samples needed before the percentile is used.
+        window_size: Number of recent latencies the percentile is computed over.
+        budget_ratio: Hedges earned per request, e.g. 0.05 allows hedging 5% of requests.
+        budget_burst: Maximum number of unused hedges that can be saved up.
+    """
+
+    percentile: float = 95.0
+    initial_delay_seconds: float = 1.0
+    min_delay_seconds: float = 0.01
+    min_samples: int = 20
+    window_size: int = 1000
+    budget_ratio: float = 0.05
+    budget_burst: float = 10.0
+
+
+@dataclass_json
+@dataclass
+class HedgingStats:
+    """Counters describing how hedging behaved.
+
+    Attributes:
+        requests: Number of hedged-client requests.
+        hedges_sent: Number of duplicate requests sent.
+        hedge_wins: Number of requests answered first by the duplicate.
+        budget_denied: Number of hedges skipped because the budget was exhausted.
+    """
+
+    requests: int = 0
+    hedges_sent: int = 0
+    hedge_wins: int = 0
+    budget_denied: int = 0
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of requests that sent a duplicate."""
+        return self.hedges_sent / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of duplicates that answered first."""
+        return self.hedge_wins / self.hedges_sent if self.hedges_sent else 0.0
+
+
+class HedgedInferenceClient:
+    """Wraps an InferenceClient to hedge slow `run_sync` calls.
+
+    When a request hasn't completed within a percentile of recent latency, an identical
+    request is sent and whichever answers first successfully is returned. Only use it
+    for idempotent inference calls, the endpoint may process both requests. A request
+    already sent with requests can't be aborted: the losing request is left to finish
+    in the background and its response is closed as soon as it arrives.
+    """
+
+    def __init__(
+        self,
+        inference_client: InferenceClient,
+        policy: HedgingPolicy | None = None,
+        max_workers: int = 32,
+    ) -> None:
+        """Initialize the hedged client.
+
+        Args:
+            inference_client: Client used to send the requests
+            policy: Hedging policy, defaults to HedgingPolicy()
+            max_workers: Maximum number of requests in flight, and separately of hedges
+        """
+        self._inference_client = inference_client
+        self.policy = policy or HedgingPolicy()
+        # hedges get their own workers, so they never hold up original requests
+        self._primary_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='verda-hedged-request'
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='verda-hedge'
+        )
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=self.policy.window_size)
+        self._sorted_latencies: list[float] = []
+        self._samples_since_sort = 0
+        self._budget = 0.0
+        self._stats = HedgingStats()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker threads once the requests in flight have finished."""
+        self._primary_executor.shutdown(wait=False)
+        self._executor.shutdown(wait=False)
+
+    @property
+    def stats(self) -> HedgingStats:
+        """Snapshot of the hedging counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for the original request before sending a duplicate."""
+        with self._lock:
+            if len(self._latencies) < self.policy.min_samples:
+                return self.policy.initial_delay_seconds
+            # re-sorting on every request would dominate for large windows
+            if not self._sorted_latencies or self._samples_since_sort >= len(self._latencies) // 20:
+                self._sorted_latencies = sorted(self._latencies)
+                self._samples_since_sort = 0
+            delay = percentile(self._sorted_latencies, self.policy.percentile)
+        return max(delay, self.policy.min_delay_seconds)
+
+    def _record(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+            self._samples_since_sort += 1
+
+    def _start_request(self) -> None:
+        with self._lock:
+            self._stats.requests += 1
+            self._budget = min(self._budget + self.policy.budget_ratio, self.policy.budget_burst)
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                self._stats.budget_denied += 1
+                return False
+            self._budget -= 1
+            self._stats.hedges_sent += 1
+            return True
+
+    def run_sync(
+        self,
+        data: dict[str, Any],
+        path: str = '',
+        timeout_seconds: int = 60 * 5,
+        headers: dict[str, str] | None = None,
+        http_method: str = 'POST',
+        stream: bool = False,
+    ) -> InferenceResponse:
+        """Make a synchronous inference request, hedging it if it is slow.
+
+        Args:
+            data: The data payload to send with the request
+            path: API endpoint path. Defaults to empty string.
+            timeout_seconds: Request timeout in seconds. Defaults to 5 minutes.
+            headers: Optional headers to include in the request
+            http_method: HTTP method to use. Defaults to "POST".
+            stream: Whether to stream the response. Defaults to False.
+
+        Returns:
+            InferenceResponse: The first successful response.
+
+        Raises:
+            InferenceClientError: If every request sent failed
+        """
+        args = (data, path, timeout_seconds, headers, http_method, stream)
+        self._start_request()
+        # the hedge delay counts from when the original request is sent, not queued
+        sent = threading.Event()
+        primary = self._primary_executor.submit(self._send, args, sent)
+        sent.wait()
+
+        done, _ = wait([primary], timeout=self.hedge_delay())
+        if done or not self._take_budget():
+            return primary.result()
+
+        hedge = self._executor.submit(self._send, args)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((f for f in done if f.exception() is None), None)
+            if winner is not None:
+                break
+        else:
+            # both failed, report the original request's error
+            return primary.result()
+
+        if winner is hedge:
+            with self._lock:
+                self._stats.hedge_wins += 1
+        # both may have succeeded in the same wait, so close whichever didn't win
+        loser = hedge if winner is primary else primary
+        loser.add_done_callback(_close_response)
+        return winner.result()
+
+    def _send(self, args: tuple, sent: threading.Event | None = None) -> InferenceResponse:
+        """Send one request and record its latency, measured from when it is sent."""
+        if sent is not None:
+            sent.set()
+        start = time.monotonic()
+        response = self._inference_client.run_sync(*args)
+        self._record(time.monotonic() - start)
+        return response
+
+
+def _close_response(future: Future) -> None:
+    """Release the connection of a request whose response is no longer needed."""
+    if future.exception() is None:
+        future.result()._original_response.close()
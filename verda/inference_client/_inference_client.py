@@ -1,18 +1,55 @@
-from collections.abc import Generator
-from dataclasses import dataclass
+import asyncio
+import os
+import threading
+import time
+import warnings
+from collections.abc import Callable, Generator, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 from urllib.parse import urlparse
 
 import requests
 from dataclasses_json import Undefined, dataclass_json  # type: ignore
+from requests.adapters import HTTPAdapter
 from requests.structures import CaseInsensitiveDict
 
+from verda.http_client import CircuitBreaker
+
+from ._body_reader import _BodyReader, _is_buffer_destination
+from ._payload import (
+    BytesLike,
+    RawBody,
+    _body_headers,
+    _with_content_type,
+    is_msgpack,
+    unpack_msgpack,
+)
+from ._sse import (
+    SSE_DONE_MARKER,
+    ServerSentEvent,
+    is_event_stream,
+    iter_ndjson,
+    iter_sse_events,
+    iter_sse_json,
+)
+from ._token_metrics import StreamMetrics, TokenMetrics, _StreamRecorder
+from ._upload import MultipartBody, StreamingBody, _body_kwargs, _streaming_data
+
 
 class InferenceClientError(Exception):
     """Base exception for InferenceClient errors."""
 
-    pass
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        """Inference client error.
+
+        Args:
+            message: Error message
+            status_code: HTTP status code of the failed response, if one was received
+        """
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class AsyncStatus(str, Enum):
@@ -24,16 +61,139 @@ class AsyncStatus(str, Enum):
     Completed = 'Completed'
 
 
+def _is_stream_headers(headers: Mapping[str, str]) -> bool:
+    """Check if the response headers indicate a streaming response.
+
+    Args:
+        headers: The case-insensitive response headers to check
+
+    Returns:
+        bool: True if the response is likely a stream, False otherwise
+    """
+    # Standard chunked transfer encoding
+    is_chunked_transfer = headers.get('Transfer-Encoding', '').lower() == 'chunked'
+    # Server-Sent Events content type
+    is_event_stream = headers.get('Content-Type', '').lower() == 'text/event-stream'
+    # NDJSON
+    is_ndjson = headers.get('Content-Type', '').lower() == 'application/x-ndjson'
+    # Stream JSON
+    is_stream_json = headers.get('Content-Type', '').lower() == 'application/stream+json'
+    # Keep-alive
+    is_keep_alive = headers.get('Connection', '').lower() == 'keep-alive'
+    # No content length
+    has_no_content_length = 'Content-Length' not in headers
+
+    # No Content-Length with keep-alive often suggests streaming (though not definitive)
+    is_keep_alive_and_no_content_length = is_keep_alive and has_no_content_length
+
+    return (
+        is_chunked_transfer
+        or is_event_stream
+        or is_ndjson
+        or is_stream_json
+        or is_keep_alive_and_no_content_length
+    )
+
+
 @dataclass_json(undefined=Undefined.EXCLUDE)
 @dataclass
 class InferenceResponse:
-    """Inference response."""
+    """Inference response.
+
+    A streamed response (`stream=True`) holds a pooled connection until its body has
+    been read to the end or it is closed. `stream()`, `events()`, `stream_json()`,
+    `readinto()` and `stream_to()` release it once the body is exhausted or iteration
+    stops early; otherwise use the response as a context manager or call `close()`.
+    Streamed responses garbage collected while still holding their connection emit a
+    ResourceWarning and are counted by the client's `leaked_responses`.
+
+    Iterating a streamed response records its time to first token, inter-token latency
+    and token counts in `stream_metrics`, and adds them to the client's `token_metrics`.
+    Nothing is recorded if the client's `token_metrics` is None.
+    """
 
     headers: CaseInsensitiveDict[str]
     status_code: int
     status_text: str
     _original_response: requests.Response
     _stream: bool = False
+    _body_reader: _BodyReader | None = field(default=None, repr=False)
+    _on_leak: Callable[[], Any] | None = field(default=None, repr=False, compare=False)
+    _sent_at: float | None = field(default=None, repr=False, compare=False)
+    _on_stream_end: Callable[[StreamMetrics, list[float]], Any] | None = field(
+        default=None, repr=False, compare=False
+    )
+    _on_close: Callable[[], Any] | None = field(default=None, repr=False, compare=False)
+    _closed: bool = field(default=False, init=False, repr=False, compare=False)
+    _stream_metrics: StreamMetrics | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        if self._closed:
+            return
+        if not self._stream or not self._holds_connection():
+            if self._on_close is not None:
+                self.close()
+            return
+        warnings.warn(
+            f'Streamed InferenceResponse from {self._original_response.url} was not read to '
+            'the end or closed, its connection is released only now. Use it as a context '
+            'manager or call close().',
+            ResourceWarning,
+            source=self,
+            stacklevel=2,
+        )
+        if self._on_leak is not None:
+            self._on_leak()
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether `close()` was called, explicitly or after the body was consumed."""
+        return self._closed
+
+    def close(self) -> None:
+        """Release the connection back to the pool, discarding any unread body.
+
+        Safe to call more than once.
+        """
+        already_closed = self._closed
+        self._closed = True
+        self._original_response.close()
+        if not already_closed and self._on_close is not None:
+            self._on_close()
+
+    @property
+    def stream_metrics(self) -> StreamMetrics | None:
+        """Timing and token counts of the response stream, once it has been iterated.
+
+        Set when `stream()`, `events()` or `stream_json()` finishes or is stopped early,
+        unless the client's `token_metrics` is None.
+        """
+        return self._stream_metrics
+
+    def _recorder(self) -> _StreamRecorder | None:
+        """Recorder for iterating the body, None if the client doesn't record metrics."""
+        return _StreamRecorder(self._sent_at) if self._on_stream_end is not None else None
+
+    def _finish_stream(self, recorder: _StreamRecorder | None) -> None:
+        if recorder is None:
+            return
+        self._stream_metrics = recorder.finish()
+        # bodies that were downloaded before iterating tell nothing about token timing
+        if self._stream:
+            self._on_stream_end(self._stream_metrics, recorder.intervals)
+
+    def _holds_connection(self) -> bool:
+        """Whether the body is still unread and its connection checked out of the pool."""
+        return getattr(self._original_response.raw, 'connection', None) is not None
 
     def _is_stream_response(self, headers: CaseInsensitiveDict[str]) -> bool:
         """Check if the response headers indicate a streaming response.
@@ -44,36 +204,15 @@ class InferenceResponse:
         Returns:
             bool: True if the response is likely a stream, False otherwise
         """
-        # Standard chunked transfer encoding
-        is_chunked_transfer = headers.get('Transfer-Encoding', '').lower() == 'chunked'
-        # Server-Sent Events content type
-        is_event_stream = headers.get('Content-Type', '').lower() == 'text/event-stream'
-        # NDJSON
-        is_ndjson = headers.get('Content-Type', '').lower() == 'application/x-ndjson'
-        # Stream JSON
-        is_stream_json = headers.get('Content-Type', '').lower() == 'application/stream+json'
-        # Keep-alive
-        is_keep_alive = headers.get('Connection', '').lower() == 'keep-alive'
-        # No content length
-        has_no_content_length = 'Content-Length' not in headers
-
-        # No Content-Length with keep-alive often suggests streaming (though not definitive)
-        is_keep_alive_and_no_content_length = is_keep_alive and has_no_content_length
-
-        return (
-            self._stream
-            or is_chunked_transfer
-            or is_event_stream
-            or is_ndjson
-            or is_stream_json
-            or is_keep_alive_and_no_content_length
-        )
+        return self._stream or _is_stream_headers(headers)
 
     def output(self, is_text: bool = False) -> Any:
         """Get response output as a string or object."""
         try:
             if is_text:
                 return self._original_response.text
+            if is_msgpack(self._original_response.headers.get('Content-Type')):
+                return unpack_msgpack(self._original_response.content)
             return self._original_response.json()
         except Exception as e:
             # if the response is a stream (check headers), raise relevant error
@@ -93,23 +232,165 @@ class InferenceResponse:
         Returns:
             Generator yielding chunks of the response
         """
-        if as_text:
-            for chunk in self._original_response.iter_lines(chunk_size=chunk_size):
-                if chunk:
-                    yield chunk
+        recorder = self._recorder()
+        try:
+            if as_text:
+                for chunk in self._original_response.iter_lines(chunk_size=chunk_size):
+                    if chunk:
+                        if recorder is not None:
+                            recorder.line(chunk)
+                        yield chunk
+            else:
+                for chunk in self._original_response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        if recorder is not None:
+                            recorder.chunk()
+                        yield chunk
+        finally:
+            self._finish_stream(recorder)
+            self.close()
+
+    def _reader(self) -> _BodyReader:
+        if self._body_reader is None:
+            self._body_reader = _BodyReader(self._original_response)
+        return self._body_reader
+
+    def readinto(self, buffer: Any) -> int:
+        """Read the next part of the response body into a preallocated buffer.
+
+        Like `io.RawIOBase.readinto`, call it repeatedly to consume the body piece by piece.
+
+        Args:
+            buffer: Writable buffer, e.g. a bytearray, memoryview or mmap
+
+        Returns:
+            int: Number of bytes written to the buffer, 0 once the body is exhausted
+        """
+        view = memoryview(buffer).cast('B')
+        n = self._reader().readinto(view)
+        if not n and len(view):
+            self.close()
+        return n
+
+    def tensor(self, out: Any = None, dtype: str | None = None, shape: Any = None) -> Any:
+        """Decode a raw tensor response body into a NumPy array without intermediate lists.
+
+        The dtype and shape are taken from the X-Tensor-Dtype and X-Tensor-Shape
+        response headers unless given. With `out`, the body is read straight into the
+        preallocated array, which works best with `run_sync(..., stream=True)`.
+        Otherwise the returned array is a read-only view of the downloaded body.
+
+        Requires the numpy package.
+
+        Args:
+            out: Optional writable C-contiguous array to fill
+            dtype: NumPy dtype string, e.g. '<f4', if the response has no dtype header
+            shape: Array shape, if the response has no shape header
+
+        Returns:
+            np.ndarray: The decoded array
+
+        Raises:
+            InferenceClientError: If numpy is missing, or dtype, shape or size don't match
+        """
+        from ._tensors import response_tensor
+
+        return response_tensor(self, out=out, dtype=dtype, shape=shape)
+
+    def stream_to(self, destination: Any) -> int:
+        """Write the whole response body to a file or a preallocated buffer.
+
+        Files are written through one reusable chunk buffer that grows from 64 KiB up to
+        8 MiB while reads keep filling it, so large bodies don't allocate per chunk.
+        Buffers are filled in place.
+
+        Args:
+            destination: A file path, a binary file object with a `write` method, or a
+                writable buffer such as a bytearray, memoryview or mmap
+
+        Returns:
+            int: Number of bytes written
+
+        Raises:
+            InferenceClientError: If the body doesn't fit in the destination buffer
+        """
+        reader = self._reader()
+        try:
+            if isinstance(destination, str | os.PathLike):
+                with open(destination, 'wb') as f:
+                    return reader.write_to(f)
+            if not _is_buffer_destination(destination):
+                return reader.write_to(destination)
+            view = memoryview(destination).cast('B')
+            written = reader.readinto_full(view)
+            if written == len(view) and reader.readinto(memoryview(bytearray(1))):
+                raise InferenceClientError(
+                    f'Response body is larger than the destination buffer of {len(view)} bytes'
+                )
+            return written
+        finally:
+            self.close()
+
+    def events(self, chunk_size: int | None = None) -> Generator[ServerSentEvent, None, None]:
+        """Parse the response body as a stream of Server-Sent Events.
+
+        Args:
+            chunk_size: Size of body reads, in bytes. None yields data as it arrives.
+
+        Returns:
+            Generator yielding parsed events
+        """
+        recorder = self._recorder()
+        try:
+            for event in iter_sse_events(
+                self._original_response.iter_content(chunk_size=chunk_size)
+            ):
+                if recorder is not None:
+                    recorder.event(event)
+                yield event
+        finally:
+            self._finish_stream(recorder)
+            self.close()
+
+    def stream_json(
+        self, chunk_size: int | None = None, done_marker: str | None = SSE_DONE_MARKER
+    ) -> Generator[Any, None, None]:
+        """Stream decoded JSON chunks from a Server-Sent Events or NDJSON response.
+
+        The body is parsed as Server-Sent Events if the response has a `text/event-stream`
+        Content-Type and as newline-delimited JSON otherwise.
+
+        Args:
+            chunk_size: Size of body reads, in bytes. None yields data as it arrives.
+            done_marker: Event data that ends an event stream, as sent by
+                OpenAI-compatible servers
+
+        Returns:
+            Generator yielding decoded JSON values
+        """
+        chunks = self._original_response.iter_content(chunk_size=chunk_size)
+        if is_event_stream(self.headers.get('Content-Type')):
+            values = iter_sse_json(chunks, done_marker)
         else:
-            for chunk in self._original_response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    yield chunk
+            values = iter_ndjson(chunks)
+        recorder = self._recorder()
+        try:
+            for value in values:
+                if recorder is not None:
+                    recorder.value(value)
+                yield value
+        finally:
+            self._finish_stream(recorder)
+            self.close()
 
 
-class InferenceClient:
-    """Inference client."""
+class _BaseInferenceClient:
+    """Endpoint, authentication and header handling shared by the inference clients."""
 
     def __init__(
         self, inference_key: str, endpoint_base_url: str, timeout_seconds: int = 60 * 5
     ) -> None:
-        """Initialize the InferenceClient.
+        """Initialize the shared client state.
 
         Args:
             inference_key: The authentication key for the API
@@ -131,18 +412,18 @@ class InferenceClient:
         self.base_domain = self.endpoint_base_url[: self.endpoint_base_url.rindex('/')]
         self.deployment_name = self.endpoint_base_url[self.endpoint_base_url.rindex('/') + 1 :]
         self.timeout_seconds = timeout_seconds
-        self._session = requests.Session()
+        # writers replace the dict under the lock, so readers always see a complete copy
+        self._headers_lock = threading.Lock()
+        # reentrant, since responses report leaks from __del__ at any point in any thread
+        self._leak_lock = threading.RLock()
+        self._leaked_responses = 0
+        # set to a TokenMetrics, e.g. default_token_metrics, to record streamed responses
+        self.token_metrics: TokenMetrics | None = None
         self._global_headers = {
             'Authorization': f'Bearer {inference_key}',
             'Content-Type': 'application/json',
         }
 
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self._session.close()
-
     @property
     def global_headers(self) -> dict[str, str]:
         """Get the current global headers that will be used for all requests.
@@ -159,7 +440,8 @@ class InferenceClient:
             key: Header name
             value: Header value
         """
-        self._global_headers[key] = value
+        with self._headers_lock:
+            self._global_headers = {**self._global_headers, key: value}
 
     def set_global_headers(self, headers: dict[str, str]) -> None:
         """Set multiple global headers at once that will be used for all requests.
@@ -167,7 +449,8 @@ class InferenceClient:
         Args:
             headers: Dictionary of headers to set globally
         """
-        self._global_headers.update(headers)
+        with self._headers_lock:
+            self._global_headers = {**self._global_headers, **headers}
 
     def remove_global_header(self, key: str) -> None:
         """Remove a global header.
@@ -175,8 +458,28 @@ class InferenceClient:
         Args:
             key: Header name to remove from global headers
         """
-        if key in self._global_headers:
-            del self._global_headers[key]
+        with self._headers_lock:
+            if key in self._global_headers:
+                headers = self._global_headers.copy()
+                del headers[key]
+                self._global_headers = headers
+
+    @property
+    def leaked_responses(self) -> int:
+        """Number of streamed responses garbage collected while holding a connection.
+
+        A growing count means responses are neither read to the end nor closed, which
+        starves the connection pool under load.
+        """
+        return self._leaked_responses
+
+    def _record_leaked_response(self) -> None:
+        with self._leak_lock:
+            self._leaked_responses += 1
+
+    def _record_stream(self, metrics: StreamMetrics, intervals: list[float]) -> None:
+        if self.token_metrics is not None:
+            self.token_metrics.record(self.deployment_name, metrics, intervals)
 
     def _build_url(self, path: str) -> str:
         """Construct the full URL by joining the base URL with the path."""
@@ -198,7 +501,154 @@ class InferenceClient:
             headers.update(request_headers)
         return headers
 
+    def _status_url(self) -> str:
+        """URL of the async execution status endpoint for this deployment."""
+        return f'{self.base_domain}/status/{self.deployment_name}'
+
+    def _result_url(self) -> str:
+        """URL of the async execution result endpoint for this deployment."""
+        return f'{self.base_domain}/result/{self.deployment_name}'
+
+
+@dataclass_json
+@dataclass
+class ConnectionPoolStats:
+    """Utilization of the connection pool of one host.
+
+    Attributes:
+        host: Host the pool connects to.
+        maxsize: Number of connections the pool keeps open for reuse.
+        in_use: Connections currently checked out by requests.
+        idle: Open connections waiting to be reused.
+        connections_created: Connections opened over the pool's lifetime. Growing much
+            faster than `maxsize` means the pool overflows and connections are discarded.
+        requests: Requests sent through the pool.
+    """
+
+    host: str
+    maxsize: int
+    in_use: int
+    idle: int
+    connections_created: int
+    requests: int
+
+
+class InferenceClient(_BaseInferenceClient):
+    """Inference client.
+
+    A single client can be shared between threads. Size the connection pool with
+    `pool_maxsize` to at least the number of threads sending requests concurrently,
+    otherwise connections are discarded after use instead of being kept alive.
+    """
+
+    def __init__(
+        self,
+        inference_key: str,
+        endpoint_base_url: str,
+        timeout_seconds: int = 60 * 5,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Initialize the InferenceClient.
+
+        Args:
+            inference_key: The authentication key for the API
+            endpoint_base_url: The base URL for the API
+            timeout_seconds: Request timeout in seconds
+            pool_connections: Number of hosts to keep connection pools for
+            pool_maxsize: Number of connections per host kept open for reuse
+            pool_block: If True, pool_maxsize is also the maximum number of connections
+                per host and further requests wait for a free connection
+            keep_alive: Whether to reuse connections between requests
+            circuit_breaker: If set, requests fail fast while the endpoint keeps failing
+                with connection errors, timeouts or 5xx responses. While half-open the
+                breaker probes the endpoint with `health()`, unless it has its own probe.
+
+        Raises:
+            InferenceClientError: If the parameters are invalid
+        """
+        super().__init__(inference_key, endpoint_base_url, timeout_seconds)
+        self.circuit_breaker = circuit_breaker
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        if not keep_alive:
+            self._session.headers['Connection'] = 'close'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._session.close()
+
+    def pool_stats(self) -> list[ConnectionPoolStats]:
+        """Utilization of the connection pools of this client, one entry per host.
+
+        Returns:
+            list[ConnectionPoolStats]: Pool statistics
+        """
+        stats = []
+        pools = self._session.get_adapter(self.endpoint_base_url).poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            queued = list(pool.pool.queue)
+            stats.append(
+                ConnectionPoolStats(
+                    host=pool.host,
+                    maxsize=pool.pool.maxsize,
+                    in_use=pool.pool.maxsize - len(queued),
+                    idle=sum(conn is not None for conn in queued),
+                    connections_created=pool.num_connections,
+                    requests=pool.num_requests,
+                )
+            )
+        return stats
+
     def _make_request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Make an HTTP request through the circuit breaker, if there is one.
+
+        Args:
+            method: HTTP method to use
+            path: API endpoint path
+            **kwargs: Additional arguments to pass to the request
+
+        Returns:
+            Response object from the request
+
+        Raises:
+            InferenceClientError: If the request fails or the circuit breaker is open
+        """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return self._send_request(method, path, **kwargs)
+        if not breaker.allow(self.health):
+            raise InferenceClientError(
+                f'Request to {path} failed fast, the circuit breaker of '
+                f'{self.endpoint_base_url} is open after repeated failures'
+            )
+        failed = True
+        try:
+            response = self._send_request(method, path, **kwargs)
+            failed = False
+            return response
+        except InferenceClientError as e:
+            failed = _is_endpoint_failure(e)
+            raise
+        finally:
+            if failed:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+    def _send_request(self, method: str, path: str, **kwargs) -> requests.Response:
         """Make an HTTP request with error handling.
 
         Args:
@@ -213,11 +663,22 @@ class InferenceClient:
             InferenceClientError: If the request fails
         """
         timeout = kwargs.pop('timeout_seconds', self.timeout_seconds)
+        headers = kwargs.pop('headers', None)
+        body = kwargs.get('data')
+        if isinstance(body, RawBody):
+            kwargs['data'] = body.view()
+            headers = _body_headers(headers, body)
+        elif isinstance(body, bytearray | memoryview):
+            # requests would iterate these item by item, send them as one flat buffer
+            kwargs['data'] = memoryview(body).cast('B')
+        elif isinstance(body, StreamingBody | MultipartBody):
+            kwargs['data'] = _streaming_data(body)
+            headers = _with_content_type(headers, body.content_type)
         try:
             response = self._session.request(
                 method=method,
                 url=self._build_url(path),
-                headers=self._build_request_headers(kwargs.pop('headers', None)),
+                headers=self._build_request_headers(headers),
                 timeout=timeout,
                 **kwargs,
             )
@@ -228,11 +689,14 @@ class InferenceClient:
                 f'Request to {path} timed out after {timeout} seconds'
             ) from e
         except requests.exceptions.RequestException as e:
-            raise InferenceClientError(f'Request to {path} failed: {e!s}') from e
+            status_code = e.response.status_code if e.response is not None else None
+            raise InferenceClientError(
+                f'Request to {path} failed: {e!s}', status_code=status_code
+            ) from e
 
     def run_sync(
         self,
-        data: dict[str, Any],
+        data: dict[str, Any] | RawBody | BytesLike,
         path: str = '',
         timeout_seconds: int = 60 * 5,
         headers: dict[str, str] | None = None,
@@ -242,7 +706,8 @@ class InferenceClient:
         """Make a synchronous request to the inference endpoint.
 
         Args:
-            data: The data payload to send with the request
+            data: The data payload to send with the request, as a JSON-serializable
+                object, a pre-encoded RawBody or raw bytes
             path: API endpoint path. Defaults to empty string.
             timeout_seconds: Request timeout in seconds. Defaults to 5 minutes.
             headers: Optional headers to include in the request
@@ -255,10 +720,11 @@ class InferenceClient:
         Raises:
             InferenceClientError: If the request fails
         """
+        sent_at = time.perf_counter()
         response = self._make_request(
             http_method,
             path,
-            json=data,
+            **_body_kwargs(data),
             timeout_seconds=timeout_seconds,
             headers=headers,
             stream=stream,
@@ -269,11 +735,15 @@ class InferenceClient:
             status_code=response.status_code,
             status_text=response.reason,
             _original_response=response,
+            _stream=stream,
+            _on_leak=self._record_leaked_response,
+            _sent_at=sent_at,
+            _on_stream_end=self._record_stream if self.token_metrics is not None else None,
         )
 
     def run(
         self,
-        data: dict[str, Any],
+        data: dict[str, Any] | RawBody | BytesLike,
         path: str = '',
         timeout_seconds: int = 60 * 5,
         headers: dict[str, str] | None = None,
@@ -283,7 +753,8 @@ class InferenceClient:
         """Make an asynchronous request to the inference endpoint.
 
         Args:
-            data: The data payload to send with the request
+            data: The data payload to send with the request, as a JSON-serializable
+                object, a pre-encoded RawBody or raw bytes
             path: API endpoint path. Defaults to empty string.
             timeout_seconds: Request timeout in seconds. Defaults to 5 minutes.
             headers: Optional headers to include in the request
@@ -305,7 +776,7 @@ class InferenceClient:
             self._make_request(
                 http_method,
                 path,
-                json=data,
+                **_body_kwargs(data),
                 timeout_seconds=timeout_seconds,
                 headers=headers,
             )
@@ -316,7 +787,7 @@ class InferenceClient:
         response = self._make_request(
             http_method,
             path,
-            json=data,
+            **_body_kwargs(data),
             timeout_seconds=timeout_seconds,
             headers=headers,
         )
@@ -342,7 +813,7 @@ class InferenceClient:
         self,
         path: str,
         json: dict[str, Any] | None = None,
-        data: str | dict[str, Any] | None = None,
+        data: str | dict[str, Any] | RawBody | BytesLike | None = None,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         timeout_seconds: int | None = None,
@@ -362,7 +833,7 @@ class InferenceClient:
         self,
         path: str,
         json: dict[str, Any] | None = None,
-        data: str | dict[str, Any] | None = None,
+        data: str | dict[str, Any] | RawBody | BytesLike | None = None,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         timeout_seconds: int | None = None,
@@ -398,7 +869,7 @@ class InferenceClient:
         self,
         path: str,
         json: dict[str, Any] | None = None,
-        data: str | dict[str, Any] | None = None,
+        data: str | dict[str, Any] | RawBody | BytesLike | None = None,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         timeout_seconds: int | None = None,
@@ -449,6 +920,9 @@ class InferenceClient:
     def health(self, healthcheck_path: str = '/health') -> requests.Response:
         """Check the health status of the API.
 
+        Health checks bypass the circuit breaker, so they can tell when the endpoint is
+        back.
+
         Returns:
             requests.Response: The response from the health check
 
@@ -456,21 +930,59 @@ class InferenceClient:
             InferenceClientError: If the health check fails
         """
         try:
-            return self.get(healthcheck_path)
+            return self._send_request('GET', healthcheck_path)
         except InferenceClientError as e:
             raise InferenceClientError(f'Health check failed: {e!s}') from e
 
 
+def _is_endpoint_failure(error: Exception) -> bool:
+    """Whether an error says something about the endpoint rather than the request."""
+    if not isinstance(error, InferenceClientError):
+        return False
+    return error.status_code is None or error.status_code >= 500
+
+
 @dataclass_json(undefined=Undefined.EXCLUDE)
 @dataclass
 class AsyncInferenceExecution:
-    """Async inference execution."""
+    """Async inference execution.
+
+    Executions can be awaited in asyncio code or turned into a
+    `concurrent.futures.Future`; both resolve with the result and are backed by one
+    shared background poller. `submitted_at` is the Unix time the request was
+    submitted, the queue TTL of the scheduler counts from it.
+    """
 
     _inference_client: 'InferenceClient'
     id: str
     _status: AsyncStatus
+    _future: Future | None = field(default=None, repr=False, compare=False)
+    submitted_at: float = field(default_factory=time.time, repr=False, compare=False)
     INFERENCE_ID_HEADER = 'X-Inference-Id'
 
+    def future(self) -> Future:
+        """Get a future that resolves with the result once the execution completes.
+
+        The execution is polled by the shared default AsyncExecutionScheduler. Calling
+        this repeatedly returns the same future.
+
+        Returns:
+            Future: Resolves with the result of the execution
+        """
+        if self._future is None:
+            from ._polling import default_execution_scheduler
+
+            self._future = default_execution_scheduler().add(self, submitted_at=self.submitted_at)
+        return self._future
+
+    def __await__(self):
+        """Wait for the result of the execution without blocking the event loop."""
+        return asyncio.wrap_future(self.future()).__await__()
+
+    def __hash__(self) -> int:
+        # asyncio.gather and friends hash the awaitables they are given
+        return hash(self.id)
+
     def status(self) -> AsyncStatus:
         """Get the current stored status of the async inference execution. Only the status value type.
 
@@ -485,14 +997,13 @@ class AsyncInferenceExecution:
         Returns:
             dict[str, Any]: The status response containing the execution status and other metadata
         """
-        url = (
-            f'{self._inference_client.base_domain}/status/{self._inference_client.deployment_name}'
-        )
+        url = self._inference_client._status_url()
         response = self._inference_client._session.get(
             url,
             headers=self._inference_client._build_request_headers(
                 {self.INFERENCE_ID_HEADER: self.id}
             ),
+            timeout=self._inference_client.timeout_seconds,
         )
 
         response_json = response.json()
@@ -506,14 +1017,13 @@ class AsyncInferenceExecution:
         Returns:
             dict[str, Any]: The results of the inference execution
         """
-        url = (
-            f'{self._inference_client.base_domain}/result/{self._inference_client.deployment_name}'
-        )
+        url = self._inference_client._result_url()
         response = self._inference_client._session.get(
             url,
             headers=self._inference_client._build_request_headers(
                 {self.INFERENCE_ID_HEADER: self.id}
             ),
+            timeout=self._inference_client.timeout_seconds,
         )
 
         if response.headers['Content-Type'] == 'application/json':
@@ -0,0 +1,317 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+from ._cache import cache_key
+from ._inference_client import (
+    AsyncInferenceExecution,
+    AsyncStatus,
+    InferenceClient,
+    InferenceClientError,
+)
+from ._polling import AsyncExecutionScheduler, default_execution_scheduler
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    id TEXT PRIMARY KEY,
+    endpoint_base_url TEXT NOT NULL,
+    path TEXT NOT NULL,
+    payload_hash TEXT NOT NULL,
+    status TEXT NOT NULL,
+    submitted_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS executions_payload
+    ON executions (endpoint_base_url, payload_hash);
+"""
+
+_COLUMNS = 'id, endpoint_base_url, path, payload_hash, status, submitted_at, updated_at, error'
+
+
+@dataclass_json
+@dataclass
+class JournalEntry:
+    """A journaled async inference execution.
+
+    Attributes:
+        id: Execution id returned by the endpoint.
+        endpoint_base_url: Base URL of the deployment the execution runs on.
+        path: API endpoint path the request was sent to.
+        payload_hash: Canonical hash of the request, see `cache_key`.
+        status: Last polled status.
+        submitted_at: Unix time the request was submitted.
+        updated_at: Unix time the entry last changed.
+        error: Error that stopped the execution from completing, if any.
+    """
+
+    id: str
+    endpoint_base_url: str
+    path: str
+    payload_hash: str
+    status: str
+    submitted_at: float
+    updated_at: float
+    error: str | None = None
+
+    @property
+    def is_pending(self) -> bool:
+        """Whether the result hasn't been collected yet and the execution hasn't failed."""
+        return self.status != AsyncStatus.Completed.value and self.error is None
+
+
+class ExecutionJournal:
+    """SQLite journal of async inference executions for crash-safe result retrieval.
+
+    Every execution submitted through the journal is recorded with a hash of its
+    payload before its id is handed back, its status is updated on every poll and its
+    result is stored once collected. After a restart `resume()` continues polling the
+    pending executions, and `submit()` answers requests that were already submitted
+    from the journal instead of sending them to the GPU again.
+
+    Closing the journal stops journaling the executions it still tracks; their futures
+    keep resolving, and `resume()` picks them up again from the journal. Journal write
+    errors never fail an execution's future.
+
+    Example:
+        ```
+        with ExecutionJournal('executions.db') as journal:
+            journal.resume(client)
+            futures = [journal.submit(client, data) for data in inputs]
+            results = [future.result() for future in futures]
+        ```
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Open the journal, creating the database if needed.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._closed = False
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.executescript(_SCHEMA)
+            self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Stop journaling tracked executions and close the database connection."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._connection.close()
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        with self._lock:
+            rows = self._connection.execute(sql, parameters).fetchall()
+            self._connection.commit()
+        return rows
+
+    def _write_polled(self, sql: str, parameters: tuple) -> None:
+        """Journal what polling observed, without ever failing the polling."""
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self._connection.execute(sql, parameters)
+                self._connection.commit()
+            except sqlite3.Error:
+                # the entry stays pending, so a restart polls the execution again
+                pass
+
+    def entries(self, pending_only: bool = False) -> list[JournalEntry]:
+        """Journaled executions, oldest first.
+
+        Args:
+            pending_only: If True, only return executions whose result is outstanding
+
+        Returns:
+            list[JournalEntry]: The journal entries
+        """
+        rows = self._execute(f'SELECT {_COLUMNS} FROM executions ORDER BY submitted_at')
+        entries = [JournalEntry(*row) for row in rows]
+        return [e for e in entries if e.is_pending] if pending_only else entries
+
+    def get(self, execution_id: str) -> JournalEntry | None:
+        """Get the journal entry of an execution, if any."""
+        rows = self._execute(f'SELECT {_COLUMNS} FROM executions WHERE id = ?', (execution_id,))
+        return JournalEntry(*rows[0]) if rows else None
+
+    def result(self, execution_id: str) -> Any:
+        """Get the stored result of a completed execution, or None."""
+        rows = self._execute('SELECT result FROM executions WHERE id = ?', (execution_id,))
+        return json.loads(rows[0][0]) if rows and rows[0][0] is not None else None
+
+    def record(self, execution: AsyncInferenceExecution, payload_hash: str, path: str = '') -> None:
+        """Record a submitted execution.
+
+        Args:
+            execution: Execution returned by `InferenceClient.run()`
+            payload_hash: Canonical hash of the request
+            path: API endpoint path the request was sent to
+        """
+        self._execute(
+            'INSERT OR REPLACE INTO executions '
+            '(id, endpoint_base_url, path, payload_hash, status, submitted_at, updated_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (
+                execution.id,
+                execution._inference_client.endpoint_base_url,
+                path,
+                payload_hash,
+                execution.status().value,
+                execution.submitted_at,
+                time.time(),
+            ),
+        )
+
+    def _record_status(self, execution: AsyncInferenceExecution) -> None:
+        self._write_polled(
+            'UPDATE executions SET status = ?, updated_at = ? WHERE id = ?',
+            (execution.status().value, time.time(), execution.id),
+        )
+
+    def _record_outcome(self, execution_id: str, future: Future) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._write_polled(
+                'UPDATE executions SET error = ?, updated_at = ? WHERE id = ?',
+                (str(error), time.time(), execution_id),
+            )
+            return
+        self._write_polled(
+            'UPDATE executions SET status = ?, result = ?, updated_at = ? WHERE id = ?',
+            (
+                AsyncStatus.Completed.value,
+                json.dumps(future.result()),
+                time.time(),
+                execution_id,
+            ),
+        )
+
+    def track(
+        self,
+        execution: AsyncInferenceExecution,
+        scheduler: AsyncExecutionScheduler | None = None,
+    ) -> Future:
+        """Poll a recorded execution, journaling its status and result.
+
+        Args:
+            execution: A recorded execution
+            scheduler: Scheduler to poll with, defaults to the shared default scheduler
+
+        Returns:
+            Future: Resolves with the result of the execution
+        """
+        scheduler = scheduler or default_execution_scheduler()
+        future = scheduler.add(
+            execution, on_status=self._record_status, submitted_at=execution.submitted_at
+        )
+        future.add_done_callback(lambda f: self._record_outcome(execution.id, f))
+        return future
+
+    def submit(
+        self,
+        inference_client: InferenceClient,
+        data: dict[str, Any],
+        path: str = '',
+        timeout_seconds: int = 60 * 5,
+        headers: dict[str, str] | None = None,
+        http_method: str = 'POST',
+        scheduler: AsyncExecutionScheduler | None = None,
+    ) -> Future:
+        """Submit an async inference request unless the journal already has it.
+
+        A request whose payload was already submitted to the same endpoint is not sent
+        again: a completed execution resolves with its stored result and a pending one
+        is polled again. Requests whose earlier execution failed are resubmitted.
+
+        Args:
+            inference_client: Client of the deployment
+            data: The data payload to send with the request
+            path: API endpoint path. Defaults to empty string.
+            timeout_seconds: Request timeout in seconds. Defaults to 5 minutes.
+            headers: Optional headers to include in the request
+            http_method: HTTP method to use. Defaults to "POST".
+            scheduler: Scheduler to poll with, defaults to the shared default scheduler
+
+        Returns:
+            Future: Resolves with the result of the execution
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        payload_hash = cache_key(http_method, path, data)
+        rows = self._execute(
+            f'SELECT {_COLUMNS} FROM executions '
+            'WHERE endpoint_base_url = ? AND payload_hash = ? AND error IS NULL '
+            'ORDER BY submitted_at DESC LIMIT 1',
+            (inference_client.endpoint_base_url, payload_hash),
+        )
+        if rows:
+            entry = JournalEntry(*rows[0])
+            if not entry.is_pending:
+                future: Future = Future()
+                future.set_result(self.result(entry.id))
+                return future
+            execution = AsyncInferenceExecution(
+                inference_client,
+                entry.id,
+                AsyncStatus(entry.status),
+                submitted_at=entry.submitted_at,
+            )
+            return self.track(execution, scheduler)
+
+        execution = inference_client.run(data, path, timeout_seconds, headers, http_method)
+        if execution is None:
+            raise InferenceClientError('Async inference request returned no execution id')
+        self.record(execution, payload_hash, path)
+        return self.track(execution, scheduler)
+
+    def resume(
+        self,
+        inference_client: InferenceClient,
+        scheduler: AsyncExecutionScheduler | None = None,
+    ) -> dict[str, Future]:
+        """Resume polling the pending executions of a deployment, e.g. after a restart.
+
+        Args:
+            inference_client: Client of the deployment
+            scheduler: Scheduler to poll with, defaults to the shared default scheduler
+
+        Returns:
+            dict[str, Future]: Futures of the resumed executions by execution id
+        """
+        return {
+            entry.id: self.track(
+                AsyncInferenceExecution(
+                    inference_client,
+                    entry.id,
+                    AsyncStatus(entry.status),
+                    submitted_at=entry.submitted_at,
+                ),
+                scheduler,
+            )
+            for entry in self.entries(pending_only=True)
+            if entry.endpoint_base_url == inference_client.endpoint_base_url
+        }
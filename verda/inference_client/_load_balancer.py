@@ -0,0 +1,296 @@
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+from ._inference_client import (
+    AsyncInferenceExecution,
+    InferenceClient,
+    InferenceClientError,
+    InferenceResponse,
+    _is_endpoint_failure,
+)
+
+if TYPE_CHECKING:
+    from verda.containers import Deployment
+
+
+class LoadBalancingStrategy(str, Enum):
+    """How LoadBalancedInferenceClient picks an endpoint."""
+
+    EWMA = 'ewma'
+    LEAST_OUTSTANDING = 'least_outstanding'
+
+
+@dataclass_json
+@dataclass
+class EndpointStats:
+    """Snapshot of the state of one load-balanced endpoint.
+
+    Attributes:
+        endpoint_base_url: Base URL of the endpoint.
+        healthy: Whether the endpoint currently receives traffic.
+        outstanding: Number of requests in flight.
+        ewma_latency_seconds: Exponentially weighted moving average of latency, if known.
+        requests: Number of requests sent.
+        failures: Number of failed requests.
+    """
+
+    endpoint_base_url: str
+    healthy: bool
+    outstanding: int
+    ewma_latency_seconds: float | None
+    requests: int
+    failures: int
+
+
+class _Endpoint:
+    def __init__(self, client: InferenceClient, health_check: Callable[[], Any]) -> None:
+        self.client = client
+        self.health_check = health_check
+        self.outstanding = 0
+        self.ewma: float | None = None
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+
+    def is_healthy(self, now: float) -> bool:
+        return self.ejected_until <= now
+
+
+class LoadBalancedInferenceClient:
+    """Spreads inference requests over several endpoints serving the same model.
+
+    Every request goes to the healthy endpoint with the lowest expected latency
+    (EWMA latency scaled by requests in flight) or the fewest requests in flight. An
+    endpoint is ejected for `ejection_seconds` after `max_consecutive_failures` failed
+    requests or a failed health check, and comes back once the ejection expires or a
+    health check passes. If every endpoint is ejected, all of them are used again.
+    """
+
+    def __init__(
+        self,
+        inference_clients: Iterable[InferenceClient],
+        strategy: LoadBalancingStrategy = LoadBalancingStrategy.EWMA,
+        ewma_alpha: float = 0.3,
+        max_consecutive_failures: int = 3,
+        ejection_seconds: float = 30.0,
+        health_check_interval_seconds: float | None = None,
+        health_checks: Iterable[Callable[[], Any]] | None = None,
+    ) -> None:
+        """Initialize the load-balanced client.
+
+        Args:
+            inference_clients: Clients of the endpoints to balance over
+            strategy: Endpoint selection strategy
+            ewma_alpha: Weight of the newest latency sample in the moving average
+            max_consecutive_failures: Failed requests in a row that eject an endpoint
+            ejection_seconds: How long an ejected endpoint receives no traffic
+            health_check_interval_seconds: If set, run health checks in a background
+                thread at this interval
+            health_checks: Optional health check callables, one per client; defaults to
+                each client's `health()`
+
+        Raises:
+            ValueError: If no clients are given
+        """
+        clients = list(inference_clients)
+        if not clients:
+            raise ValueError('At least one inference client is required')
+        checks = list(health_checks) if health_checks is not None else [c.health for c in clients]
+        self._endpoints = [
+            _Endpoint(client, check) for client, check in zip(clients, checks, strict=True)
+        ]
+        self.strategy = LoadBalancingStrategy(strategy)
+        self.ewma_alpha = ewma_alpha
+        self.max_consecutive_failures = max_consecutive_failures
+        self.ejection_seconds = ejection_seconds
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._health_thread = None
+        if health_check_interval_seconds:
+            self._health_thread = threading.Thread(
+                target=self._health_check_loop,
+                args=(health_check_interval_seconds,),
+                name='verda-inference-health-checks',
+                daemon=True,
+            )
+            self._health_thread.start()
+
+    @classmethod
+    def from_deployments(
+        cls, deployments: Iterable['Deployment'], **kwargs
+    ) -> 'LoadBalancedInferenceClient':
+        """Create a load-balanced client over container deployments.
+
+        Health checks use each deployment's configured healthcheck path.
+
+        Args:
+            deployments: Deployments with initialized inference clients
+            **kwargs: Additional arguments passed to LoadBalancedInferenceClient
+
+        Returns:
+            LoadBalancedInferenceClient: The load-balanced client
+        """
+        deployments = list(deployments)
+        return cls(
+            [deployment.inference_client for deployment in deployments],
+            health_checks=[deployment.health for deployment in deployments],
+            **kwargs,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Stop background health checks."""
+        self._stop.set()
+        if self._health_thread is not None:
+            self._health_thread.join()
+
+    def endpoint_stats(self) -> list[EndpointStats]:
+        """Current state of every endpoint."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                EndpointStats(
+                    endpoint_base_url=e.client.endpoint_base_url,
+                    healthy=e.is_healthy(now),
+                    outstanding=e.outstanding,
+                    ewma_latency_seconds=e.ewma,
+                    requests=e.requests,
+                    failures=e.failures,
+                )
+                for e in self._endpoints
+            ]
+
+    def check_health(self) -> None:
+        """Run the health check of every endpoint, ejecting or reinstating it."""
+        for endpoint in self._endpoints:
+            try:
+                endpoint.health_check()
+            except Exception:
+                with self._lock:
+                    endpoint.ejected_until = time.monotonic() + self.ejection_seconds
+            else:
+                with self._lock:
+                    endpoint.ejected_until = 0.0
+                    endpoint.consecutive_failures = 0
+
+    def _health_check_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.check_health()
+
+    def _acquire(self) -> _Endpoint:
+        now = time.monotonic()
+        with self._lock:
+            candidates = [e for e in self._endpoints if e.is_healthy(now)] or self._endpoints
+            if self.strategy == LoadBalancingStrategy.LEAST_OUTSTANDING:
+                scores = [e.outstanding for e in candidates]
+            else:
+                # endpoints without samples yet are assumed as fast as the fastest known one
+                known = [e.ewma for e in candidates if e.ewma is not None]
+                default = min(known) if known else 1.0
+                scores = [
+                    (default if e.ewma is None else e.ewma) * (e.outstanding + 1)
+                    for e in candidates
+                ]
+            best = min(scores)
+            endpoint = random.choice(
+                [e for e, score in zip(candidates, scores, strict=True) if score == best]
+            )
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def _release(self, endpoint: _Endpoint, latency: float, error: Exception | None) -> None:
+        with self._lock:
+            endpoint.outstanding -= 1
+            if error is None or not _is_endpoint_failure(error):
+                endpoint.consecutive_failures = 0
+                if endpoint.ewma is None:
+                    endpoint.ewma = latency
+                else:
+                    endpoint.ewma += self.ewma_alpha * (latency - endpoint.ewma)
+                return
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.max_consecutive_failures:
+                endpoint.ejected_until = time.monotonic() + self.ejection_seconds
+
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        endpoint = self._acquire()
+        start = time.monotonic()
+        try:
+            result = getattr(endpoint.client, method)(*args, **kwargs)
+        except Exception as e:
+            self._release(endpoint, time.monotonic() - start, e)
+            raise
+        self._release(endpoint, time.monotonic() - start, None)
+        return result
+
+    def run_sync(
+        self,
+        data: dict[str, Any],
+        path: str = '',
+        timeout_seconds: int = 60 * 5,
+        headers: dict[str, str] | None = None,
+        http_method: str = 'POST',
+        stream: bool = False,
+    ) -> InferenceResponse:
+        """Make a synchronous inference request on the selected endpoint.
+
+        Args:
+            data: The data payload to send with the request
+            path: API endpoint path. Defaults to empty string.
+            timeout_seconds: Request timeout in seconds. Defaults to 5 minutes.
+            headers: Optional headers to include in the request
+            http_method: HTTP method to use. Defaults to "POST".
+            stream: Whether to stream the response. Defaults to False.
+
+        Returns:
+            InferenceResponse: Object containing the response data.
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        return self._call('run_sync', data, path, timeout_seconds, headers, http_method, stream)
+
+    def run(
+        self,
+        data: dict[str, Any],
+        path: str = '',
+        timeout_seconds: int = 60 * 5,
+        headers: dict[str, str] | None = None,
+        http_method: str = 'POST',
+        no_response: bool = False,
+    ) -> AsyncInferenceExecution | None:
+        """Make an asynchronous inference request on the selected endpoint.
+
+        The returned execution polls the endpoint that accepted the request.
+
+        Args:
+            data: The data payload to send with the request
+            path: API endpoint path. Defaults to empty string.
+            timeout_seconds: Request timeout in seconds. Defaults to 5 minutes.
+            headers: Optional headers to include in the request
+            http_method: HTTP method to use. Defaults to "POST".
+            no_response: If True, don't wait for response. Defaults to False.
+
+        Returns:
+            AsyncInferenceExecution: Object to track the async execution status.
+            If no_response is True, returns None.
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        return self._call('run', data, path, timeout_seconds, headers, http_method, no_response)
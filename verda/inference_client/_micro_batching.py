@@ -0,0 +1,213 @@
+import queue
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+from ._inference_client import InferenceClient, InferenceClientError
+
+
+@dataclass_json
+@dataclass
+class MicroBatchStats:
+    """Counters describing how items were batched.
+
+    Attributes:
+        items: Number of items submitted.
+        batches: Number of batched requests sent.
+        failed_batches: Number of batched requests that failed.
+    """
+
+    items: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average number of items per batched request."""
+        return self.items / self.batches if self.batches else 0.0
+
+
+_STOP = object()
+
+
+class MicroBatchingInferenceClient:
+    """Combines concurrent single-item inference calls into batched requests.
+
+    Items submitted from any thread are collected until `max_batch_size` items are
+    waiting or `max_wait_ms` has passed since the first of them, then sent as one
+    request built by `merge`. The response output is cut back into one result per item
+    by `split`, and each caller's future resolves with its own result.
+
+    Example:
+        ```
+        batcher = MicroBatchingInferenceClient(
+            client,
+            path='v1/embeddings',
+            merge=lambda items: {'model': 'm', 'input': items},
+            split=lambda output, items: [d['embedding'] for d in output['data']],
+        )
+        embedding = batcher.infer('hello')
+        ```
+    """
+
+    def __init__(
+        self,
+        inference_client: InferenceClient,
+        merge: Callable[[list[Any]], Any],
+        split: Callable[[Any, list[Any]], Sequence[Any]],
+        path: str = '',
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_concurrent_batches: int = 4,
+        timeout_seconds: int = 60 * 5,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize the micro-batching client.
+
+        Args:
+            inference_client: Client used to send the batched requests
+            merge: Builds the request payload from a list of items
+            split: Returns one result per item from the response output and the items
+            path: API endpoint path of the batched requests
+            max_batch_size: Maximum number of items per request
+            max_wait_ms: Maximum time an item waits for others to join its batch
+            max_concurrent_batches: Maximum number of batched requests in flight
+            timeout_seconds: Timeout of each batched request
+            headers: Optional headers to include in the batched requests
+
+        Raises:
+            ValueError: If max_batch_size is smaller than 1
+        """
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be at least 1')
+        self._inference_client = inference_client
+        self.merge = merge
+        self.split = split
+        self.path = path
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000
+        self.timeout_seconds = timeout_seconds
+        self.headers = headers
+        self._queue: queue.Queue = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_batches)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = MicroBatchStats()
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name='verda-micro-batching', daemon=True
+        )
+        self._dispatcher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Send the items still waiting and wait for all batched requests to finish."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+
+    @property
+    def stats(self) -> MicroBatchStats:
+        """Snapshot of the batching counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    def submit(self, item: Any) -> Future:
+        """Queue an item for the next batch.
+
+        Args:
+            item: The item, as accepted by `merge`
+
+        Returns:
+            Future: Resolves with the item's result, or the error of its batch
+
+        Raises:
+            InferenceClientError: If the client is closed
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise InferenceClientError('Micro-batching client is closed')
+            self._stats.items += 1
+            self._queue.put((item, future))
+        return future
+
+    def infer(self, item: Any, timeout: float | None = None) -> Any:
+        """Submit an item and wait for its result.
+
+        Args:
+            item: The item, as accepted by `merge`
+            timeout: Optional maximum number of seconds to wait
+
+        Returns:
+            Any: The item's result as returned by `split`
+
+        Raises:
+            InferenceClientError: If the batched request fails
+        """
+        return self.submit(item).result(timeout=timeout)
+
+    def _dispatch_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait_seconds
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    # submit() refuses items once closed, so nothing follows the sentinel
+                    stopping = True
+                    break
+                batch.append(entry)
+            self._executor.submit(self._send_batch, batch)
+
+    def _send_batch(self, batch: list[tuple[Any, Future]]) -> None:
+        batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        items = [item for item, _ in batch]
+        try:
+            response = self._inference_client.run_sync(
+                self.merge(items),
+                path=self.path,
+                timeout_seconds=self.timeout_seconds,
+                headers=self.headers,
+            )
+            results = list(self.split(response.output(), items))
+            if len(results) != len(items):
+                raise InferenceClientError(
+                    f'split returned {len(results)} results for a batch of {len(items)} items'
+                )
+        except Exception as e:
+            with self._lock:
+                self._stats.batches += 1
+                self._stats.failed_batches += 1
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        with self._lock:
+            self._stats.batches += 1
+        for (_, future), result in zip(batch, results, strict=True):
+            future.set_result(result)
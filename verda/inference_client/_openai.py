@@ -0,0 +1,593 @@
+from collections.abc import AsyncIterator, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from dataclasses_json import Undefined, dataclass_json  # type: ignore
+
+from ._inference_client import InferenceClient, InferenceClientError, InferenceResponse
+
+if TYPE_CHECKING:
+    from ._async_inference_client import AsyncInferenceClient, AsyncInferenceResponse
+
+
+@dataclass_json(undefined=Undefined.EXCLUDE)
+@dataclass
+class Usage:
+    """Token usage of a request.
+
+    Attributes:
+        prompt_tokens: Number of tokens in the prompt.
+        completion_tokens: Number of generated tokens.
+        total_tokens: Sum of prompt and completion tokens.
+    """
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+
+@dataclass_json(undefined=Undefined.EXCLUDE)
+@dataclass
+class ChatMessage:
+    """A chat message.
+
+    Attributes:
+        role: 'system', 'user', 'assistant' or 'tool'.
+        content: Text of the message.
+        name: Optional name of the participant.
+        tool_calls: Tool calls requested by the assistant.
+        tool_call_id: Id of the tool call a 'tool' message answers.
+    """
+
+    role: str
+    content: str | None = None
+    name: str | None = None
+    tool_calls: list[dict[str, Any]] | None = None
+    tool_call_id: str | None = None
+
+
+@dataclass_json(undefined=Undefined.EXCLUDE)
+@dataclass
+class ChatCompletionChoice:
+    """A generated chat message.
+
+    Attributes:
+        index: Index of the choice.
+        message: The generated message.
+        finish_reason: Why generation stopped, e.g. 'stop' or 'length'.
+    """
+
+    index: int
+    message: ChatMessage
+    finish_reason: str | None = None
+
+
+@dataclass_json(undefined=Undefined.EXCLUDE)
+@dataclass
+class ChatCompletion:
+    """Response of the chat completions API.
+
+    Attributes:
+        id: Id of the completion.
+        model: Model that generated it.
+        choices: Generated messages.
+        usage: Token usage, if the server reported it.
+        created: Unix time the completion was created.
+    """
+
+    id: str
+    model: str
+    choices: list[ChatCompletionChoice]
+    usage: Usage | None = None
+    created: int = 0
+
+    @property
+    def content(self) -> str | None:
+        """Content of the first generated message."""
+        return self.choices[0].message.content if self.choices else None
+
+
+@dataclass_json(undefined=Undefined.EXCLUDE)
+@dataclass
+class CompletionChoice:
+    """A generated text.
+
+    Attributes:
+        index: Index of the choice.
+        text: The generated text.
+        finish_reason: Why generation stopped, e.g. 'stop' or 'length'.
+    """
+
+    index: int
+    text: str
+    finish_reason: str | None = None
+
+
+@dataclass_json(undefined=Undefined.EXCLUDE)
+@dataclass
+class Completion:
+    """Response of the completions API.
+
+    Attributes:
+        id: Id of the completion.
+        model: Model that generated it.
+        choices: Generated texts.
+        usage: Token usage, if the server reported it.
+        created: Unix time the completion was created.
+    """
+
+    id: str
+    model: str
+    choices: list[CompletionChoice]
+    usage: Usage | None = None
+    created: int = 0
+
+    @property
+    def text(self) -> str | None:
+        """The first generated text."""
+        return self.choices[0].text if self.choices else None
+
+
+@dataclass_json(undefined=Undefined.EXCLUDE)
+@dataclass
+class Embedding:
+    """Embedding of one input.
+
+    Attributes:
+        index: Index of the input.
+        embedding: The embedding vector.
+    """
+
+    index: int
+    embedding: list[float]
+
+
+@dataclass_json(undefined=Undefined.EXCLUDE)
+@dataclass
+class EmbeddingsResponse:
+    """Response of the embeddings API.
+
+    Attributes:
+        model: Model that computed the embeddings.
+        data: Embeddings in input order.
+        usage: Token usage, if the server reported it.
+    """
+
+    model: str
+    data: list[Embedding] = field(default_factory=list)
+    usage: Usage | None = None
+
+    @property
+    def embeddings(self) -> list[list[float]]:
+        """The embedding vectors in input order."""
+        return [item.embedding for item in sorted(self.data, key=lambda item: item.index)]
+
+
+class _StreamState:
+    """Bookkeeping shared by the sync and async completion streams."""
+
+    def __init__(self, chat: bool) -> None:
+        self.chat = chat
+        self.id: str | None = None
+        self.model: str | None = None
+        self.finish_reason: str | None = None
+        self.usage: Usage | None = None
+
+    def delta(self, chunk: Any) -> str | None:
+        """Text added by a stream chunk of the first choice, if any."""
+        if self.id is None:
+            self.id = chunk.get('id')
+            self.model = chunk.get('model')
+        usage = chunk.get('usage')
+        if usage:
+            self.usage = Usage.from_dict(usage)
+        for choice in chunk.get('choices') or ():
+            if choice.get('index', 0) != 0:
+                continue
+            if choice.get('finish_reason'):
+                self.finish_reason = choice['finish_reason']
+            if self.chat:
+                return (choice.get('delta') or {}).get('content') or None
+            return choice.get('text') or None
+        return None
+
+
+class CompletionStream:
+    """Iterator over the text deltas of a streamed completion or chat completion.
+
+    Yields the new text of the first choice as plain strings, without building an
+    object per chunk. The finish reason, usage (sent by servers when requested with
+    `stream_options={'include_usage': True}`) and stream metrics are available once the
+    stream has been read. Use it as a context manager, or read it to the end, to
+    return its connection to the pool.
+
+    Example:
+        ```
+        with client.stream_chat_completions([{'role': 'user', 'content': 'Hi'}]) as stream:
+            for text in stream:
+                print(text, end='', flush=True)
+        print(stream.finish_reason, stream.response.stream_metrics)
+        ```
+    """
+
+    def __init__(self, response: InferenceResponse, chat: bool) -> None:
+        """Initialize the stream.
+
+        Args:
+            response: Streamed response of a completions or chat completions request
+            chat: Whether the response holds chat completion chunks
+        """
+        self.response = response
+        self._state = _StreamState(chat)
+        self._chunks = response.stream_json()
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        for chunk in self._chunks:
+            text = self._state.delta(chunk)
+            if text is not None:
+                return text
+        raise StopIteration
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Stop reading and release the connection."""
+        self._chunks.close()
+        self.response.close()
+
+    def text(self) -> str:
+        """Read the rest of the stream and return the joined text."""
+        return ''.join(self)
+
+    @property
+    def id(self) -> str | None:
+        """Id of the completion."""
+        return self._state.id
+
+    @property
+    def model(self) -> str | None:
+        """Model generating the completion."""
+        return self._state.model
+
+    @property
+    def finish_reason(self) -> str | None:
+        """Why generation stopped, once the stream has been read."""
+        return self._state.finish_reason
+
+    @property
+    def usage(self) -> Usage | None:
+        """Token usage, if the server sent it."""
+        return self._state.usage
+
+
+class AsyncCompletionStream:
+    """Async iterator over the text deltas of a streamed completion, see CompletionStream."""
+
+    def __init__(self, response: 'AsyncInferenceResponse', chat: bool) -> None:
+        """Initialize the stream.
+
+        Args:
+            response: Streamed response of a completions or chat completions request
+            chat: Whether the response holds chat completion chunks
+        """
+        self.response = response
+        self._state = _StreamState(chat)
+        self._chunks = response.stream_json()
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self
+
+    async def __anext__(self) -> str:
+        async for chunk in self._chunks:
+            text = self._state.delta(chunk)
+            if text is not None:
+                return text
+        raise StopAsyncIteration
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop reading and release the connection."""
+        await self._chunks.aclose()
+        await self.response.aclose()
+
+    async def text(self) -> str:
+        """Read the rest of the stream and return the joined text."""
+        return ''.join([text async for text in self])
+
+    @property
+    def id(self) -> str | None:
+        """Id of the completion."""
+        return self._state.id
+
+    @property
+    def model(self) -> str | None:
+        """Model generating the completion."""
+        return self._state.model
+
+    @property
+    def finish_reason(self) -> str | None:
+        """Why generation stopped, once the stream has been read."""
+        return self._state.finish_reason
+
+    @property
+    def usage(self) -> Usage | None:
+        """Token usage, if the server sent it."""
+        return self._state.usage
+
+
+def _messages(messages: Sequence[ChatMessage | dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {key: value for key, value in message.to_dict().items() if value is not None}
+        if isinstance(message, ChatMessage)
+        else message
+        for message in messages
+    ]
+
+
+class _OpenAICompatibleBase:
+    """Paths and payloads shared by the sync and async OpenAI-compatible clients."""
+
+    def __init__(self, model: str | None, path_prefix: str, timeout_seconds: int | None) -> None:
+        self.model = model
+        self.path_prefix = path_prefix.strip('/')
+        self.timeout_seconds = timeout_seconds
+
+    def _path(self, endpoint: str) -> str:
+        return f'{self.path_prefix}/{endpoint}' if self.path_prefix else endpoint
+
+    def _payload(self, model: str | None, params: dict[str, Any], **fields) -> dict[str, Any]:
+        payload = dict(fields)
+        model = model or self.model
+        if model is not None:
+            payload['model'] = model
+        payload.update(params)
+        return payload
+
+
+def _parse(response_json: Any, response_type: type) -> Any:
+    try:
+        return response_type.from_dict(response_json)
+    except (KeyError, TypeError, AttributeError) as e:
+        raise InferenceClientError(
+            f'Unexpected {response_type.__name__} response: {response_json!r:.200}'
+        ) from e
+
+
+class OpenAICompatibleClient(_OpenAICompatibleBase):
+    """Typed client for the OpenAI-compatible API of SGLang, vLLM and TGI deployments.
+
+    Requests go through the pooled connections of the wrapped InferenceClient, and
+    streamed responses record the client's token metrics.
+
+    Example:
+        ```
+        client = OpenAICompatibleClient(deployment.inference_client, model='llama-3')
+        reply = client.chat_completions([{'role': 'user', 'content': 'Hi'}], max_tokens=64)
+        print(reply.content)
+        ```
+    """
+
+    def __init__(
+        self,
+        inference_client: InferenceClient,
+        model: str | None = None,
+        path_prefix: str = 'v1',
+        timeout_seconds: int | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            inference_client: Client of the deployment serving the API
+            model: Default model name, omitted from requests if None
+            path_prefix: Path of the API below the endpoint base URL
+            timeout_seconds: Request timeout, defaults to the inference client's
+        """
+        super().__init__(model, path_prefix, timeout_seconds)
+        self.inference_client = inference_client
+
+    def _post(
+        self, endpoint: str, payload: dict[str, Any], stream: bool = False
+    ) -> InferenceResponse:
+        return self.inference_client.run_sync(
+            payload,
+            self._path(endpoint),
+            self.timeout_seconds or self.inference_client.timeout_seconds,
+            stream=stream,
+        )
+
+    def chat_completions(
+        self,
+        messages: Sequence[ChatMessage | dict[str, Any]],
+        model: str | None = None,
+        **params: Any,
+    ) -> ChatCompletion:
+        """Create a chat completion.
+
+        Args:
+            messages: Conversation so far, as ChatMessage objects or dicts
+            model: Model name, defaults to the client's
+            **params: Further request fields, e.g. max_tokens or temperature
+
+        Returns:
+            ChatCompletion: The completion
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        payload = self._payload(model, params, messages=_messages(messages))
+        return _parse(self._post('chat/completions', payload).output(), ChatCompletion)
+
+    def stream_chat_completions(
+        self,
+        messages: Sequence[ChatMessage | dict[str, Any]],
+        model: str | None = None,
+        **params: Any,
+    ) -> CompletionStream:
+        """Create a streamed chat completion.
+
+        Args:
+            messages: Conversation so far, as ChatMessage objects or dicts
+            model: Model name, defaults to the client's
+            **params: Further request fields, e.g. max_tokens or temperature
+
+        Returns:
+            CompletionStream: Iterator over the content deltas
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        payload = self._payload(model, params, messages=_messages(messages), stream=True)
+        return CompletionStream(self._post('chat/completions', payload, stream=True), chat=True)
+
+    def completions(
+        self, prompt: str | list[str], model: str | None = None, **params: Any
+    ) -> Completion:
+        """Create a text completion.
+
+        Args:
+            prompt: Prompt, or list of prompts
+            model: Model name, defaults to the client's
+            **params: Further request fields, e.g. max_tokens or temperature
+
+        Returns:
+            Completion: The completion
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        payload = self._payload(model, params, prompt=prompt)
+        return _parse(self._post('completions', payload).output(), Completion)
+
+    def stream_completions(
+        self, prompt: str, model: str | None = None, **params: Any
+    ) -> CompletionStream:
+        """Create a streamed text completion.
+
+        Args:
+            prompt: Prompt
+            model: Model name, defaults to the client's
+            **params: Further request fields, e.g. max_tokens or temperature
+
+        Returns:
+            CompletionStream: Iterator over the text deltas
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        payload = self._payload(model, params, prompt=prompt, stream=True)
+        return CompletionStream(self._post('completions', payload, stream=True), chat=False)
+
+    def embeddings(
+        self,
+        input: str | list[str],  # noqa: A002 - the API's name for it
+        model: str | None = None,
+        **params: Any,
+    ) -> EmbeddingsResponse:
+        """Compute embeddings.
+
+        Args:
+            input: Text, or list of texts
+            model: Model name, defaults to the client's
+            **params: Further request fields, e.g. dimensions
+
+        Returns:
+            EmbeddingsResponse: The embeddings
+
+        Raises:
+            InferenceClientError: If the request fails
+        """
+        payload = self._payload(model, params, input=input)
+        return _parse(self._post('embeddings', payload).output(), EmbeddingsResponse)
+
+
+class AsyncOpenAICompatibleClient(_OpenAICompatibleBase):
+    """Asyncio variant of OpenAICompatibleClient, built on AsyncInferenceClient."""
+
+    def __init__(
+        self,
+        inference_client: 'AsyncInferenceClient',
+        model: str | None = None,
+        path_prefix: str = 'v1',
+        timeout_seconds: int | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            inference_client: Async client of the deployment serving the API
+            model: Default model name, omitted from requests if None
+            path_prefix: Path of the API below the endpoint base URL
+            timeout_seconds: Request timeout, defaults to the inference client's
+        """
+        super().__init__(model, path_prefix, timeout_seconds)
+        self.inference_client = inference_client
+
+    async def _post(
+        self, endpoint: str, payload: dict[str, Any], stream: bool = False
+    ) -> 'AsyncInferenceResponse':
+        return await self.inference_client.run_sync(
+            payload,
+            self._path(endpoint),
+            self.timeout_seconds or self.inference_client.timeout_seconds,
+            stream=stream,
+        )
+
+    async def chat_completions(
+        self,
+        messages: Sequence[ChatMessage | dict[str, Any]],
+        model: str | None = None,
+        **params: Any,
+    ) -> ChatCompletion:
+        """Create a chat completion, see OpenAICompatibleClient.chat_completions."""
+        payload = self._payload(model, params, messages=_messages(messages))
+        response = await self._post('chat/completions', payload)
+        return _parse(await response.output(), ChatCompletion)
+
+    async def stream_chat_completions(
+        self,
+        messages: Sequence[ChatMessage | dict[str, Any]],
+        model: str | None = None,
+        **params: Any,
+    ) -> AsyncCompletionStream:
+        """Create a streamed chat completion, see OpenAICompatibleClient.stream_chat_completions."""
+        payload = self._payload(model, params, messages=_messages(messages), stream=True)
+        response = await self._post('chat/completions', payload, stream=True)
+        return AsyncCompletionStream(response, chat=True)
+
+    async def completions(
+        self, prompt: str | list[str], model: str | None = None, **params: Any
+    ) -> Completion:
+        """Create a text completion, see OpenAICompatibleClient.completions."""
+        payload = self._payload(model, params, prompt=prompt)
+        response = await self._post('completions', payload)
+        return _parse(await response.output(), Completion)
+
+    async def stream_completions(
+        self, prompt: str, model: str | None = None, **params: Any
+    ) -> AsyncCompletionStream:
+        """Create a streamed text completion, see OpenAICompatibleClient.stream_completions."""
+        payload = self._payload(model, params, prompt=prompt, stream=True)
+        response = await self._post('completions', payload, stream=True)
+        return AsyncCompletionStream(response, chat=False)
+
+    async def embeddings(
+        self,
+        input: str | list[str],  # noqa: A002 - the API's name for it
+        model: str | None = None,
+        **params: Any,
+    ) -> EmbeddingsResponse:
+        """Compute embeddings, see OpenAICompatibleClient.embeddings."""
+        payload = self._payload(model, params, input=input)
+        response = await self._post('embeddings', payload)
+        return _parse(await response.output(), EmbeddingsResponse)
@@ -0,0 +1,99 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    msgpack = None
+
+JSON_CONTENT_TYPE = 'application/json'
+MSGPACK_CONTENT_TYPE = 'application/msgpack'
+OCTET_STREAM_CONTENT_TYPE = 'application/octet-stream'
+
+_MSGPACK_CONTENT_TYPES = (MSGPACK_CONTENT_TYPE, 'application/x-msgpack', 'application/vnd.msgpack')
+
+BytesLike = bytes | bytearray | memoryview
+
+
+def _require_msgpack() -> None:
+    """Raise a helpful error if the optional msgpack dependency is not installed.
+
+    Raises:
+        InferenceClientError: If msgpack cannot be imported
+    """
+    if msgpack is None:
+        from ._inference_client import InferenceClientError
+
+        raise InferenceClientError(
+            'msgpack payloads require the msgpack package, '
+            'install it with: pip install "verda[msgpack]"'
+        )
+
+
+@dataclass(frozen=True)
+class RawBody:
+    """A pre-encoded request body, sent as-is with its content type.
+
+    The content is handed to the HTTP library without being decoded or copied into a
+    Python dict first, so large payloads cost no more than writing them to the socket.
+
+    Attributes:
+        content: The encoded body. Memoryviews must be C-contiguous.
+        content_type: Value of the Content-Type header.
+        headers: Optional headers describing the body, e.g. tensor shape and dtype.
+            Headers passed with the request take precedence.
+    """
+
+    content: BytesLike
+    content_type: str = OCTET_STREAM_CONTENT_TYPE
+    headers: Mapping[str, str] | None = None
+
+    @classmethod
+    def json(cls, content: BytesLike | str) -> 'RawBody':
+        """Body of already serialized JSON."""
+        return cls(content.encode() if isinstance(content, str) else content, JSON_CONTENT_TYPE)
+
+    @classmethod
+    def msgpack(cls, obj: Any) -> 'RawBody':
+        """Body encoding an object with msgpack.
+
+        Raises:
+            InferenceClientError: If msgpack is not installed
+        """
+        _require_msgpack()
+        return cls(msgpack.packb(obj, use_bin_type=True), MSGPACK_CONTENT_TYPE)
+
+    def view(self) -> bytes | memoryview:
+        """The content as a flat byte buffer, without copying it."""
+        if isinstance(self.content, bytes):
+            return self.content
+        return memoryview(self.content).cast('B')
+
+
+def _with_content_type(headers: dict[str, str] | None, content_type: str) -> dict[str, str]:
+    """Request headers with the given Content-Type, unless one was set explicitly."""
+    headers = dict(headers or {})
+    if not any(name.lower() == 'content-type' for name in headers):
+        headers['Content-Type'] = content_type
+    return headers
+
+
+def _body_headers(headers: dict[str, str] | None, body: RawBody) -> dict[str, str]:
+    """Request headers completed with the body's content type and headers."""
+    return _with_content_type({**(body.headers or {}), **(headers or {})}, body.content_type)
+
+
+def is_msgpack(content_type: str | None) -> bool:
+    """Whether a Content-Type header value denotes msgpack."""
+    return (content_type or '').split(';')[0].strip().lower() in _MSGPACK_CONTENT_TYPES
+
+
+def unpack_msgpack(content: BytesLike) -> Any:
+    """Decode a msgpack response body.
+
+    Raises:
+        InferenceClientError: If msgpack is not installed
+    """
+    _require_msgpack()
+    return msgpack.unpackb(content, raw=False)
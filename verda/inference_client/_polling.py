@@ -0,0 +1,302 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ._inference_client import AsyncInferenceExecution, AsyncStatus, InferenceClientError
+
+if TYPE_CHECKING:
+    from verda.containers import Deployment
+
+
+@dataclass
+class PollingPolicy:
+    """How often AsyncExecutionScheduler polls the status of an execution.
+
+    Attributes:
+        initial_interval_seconds: Delay before the first poll, and after a status change.
+        max_interval_seconds: Upper bound for the delay between polls.
+        backoff_multiplier: Factor the delay grows by while the status stays the same.
+        jitter: Whether to spread poll times randomly by up to 20% to avoid bursts.
+        max_poll_errors: Failed polls in a row after which the execution fails.
+    """
+
+    initial_interval_seconds: float = 0.5
+    max_interval_seconds: float = 30.0
+    backoff_multiplier: float = 1.5
+    jitter: bool = True
+    max_poll_errors: int = 5
+
+
+_QUEUED_STATUSES = (AsyncStatus.Initialized, AsyncStatus.Queue)
+
+
+class _TrackedExecution:
+    def __init__(
+        self,
+        execution: AsyncInferenceExecution,
+        future: Future,
+        interval: float,
+        on_status: Callable[[AsyncInferenceExecution], Any] | None,
+        submitted_at: float | None,
+    ):
+        self.execution = execution
+        self.future = future
+        self.on_status = on_status
+        self.interval = interval
+        self.status = execution.status()
+        # monotonic time of the submission, the Unix time is only used for its age
+        self.submitted_at = time.monotonic()
+        if submitted_at is not None:
+            self.submitted_at -= max(time.time() - submitted_at, 0.0)
+        self.errors = 0
+
+
+class AsyncExecutionScheduler:
+    """Polls many async inference executions from one background thread.
+
+    Executions are kept in a min-heap ordered by their next poll time. Each execution's
+    poll interval grows while its status stays the same and is reset when the status
+    changes, and at most `max_concurrent_polls` status requests are in flight. Once an
+    execution completes its result is fetched and resolves the future returned by
+    `add()`. Executions still queued `queue_ttl_seconds` after they were submitted
+    fail, since the deployment drops queue messages older than its
+    `queue_message_ttl_seconds`.
+
+    Example:
+        ```
+        with AsyncExecutionScheduler.from_deployment(deployment) as scheduler:
+            futures = [scheduler.add(deployment.run(data)) for data in inputs]
+            for future in concurrent.futures.as_completed(futures):
+                print(future.result())
+        ```
+    """
+
+    def __init__(
+        self,
+        policy: PollingPolicy | None = None,
+        max_concurrent_polls: int = 8,
+        queue_ttl_seconds: float | None = None,
+        fetch_result: bool = True,
+    ) -> None:
+        """Initialize the scheduler and start its polling thread.
+
+        Args:
+            policy: Polling policy, defaults to PollingPolicy()
+            max_concurrent_polls: Maximum number of status and result requests in flight
+            queue_ttl_seconds: Optional time after which a still queued execution fails
+            fetch_result: If True, futures resolve with the execution's result, otherwise
+                with the completed execution itself
+        """
+        self.policy = policy or PollingPolicy()
+        self.max_concurrent_polls = max_concurrent_polls
+        self.queue_ttl_seconds = queue_ttl_seconds
+        self.fetch_result = fetch_result
+        self._heap: list[tuple[float, int, _TrackedExecution]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._tracked = 0
+        self._stopped = False
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_polls)
+        self._thread = threading.Thread(
+            target=self._schedule_loop, name='verda-execution-scheduler', daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def from_deployment(cls, deployment: 'Deployment', **kwargs) -> 'AsyncExecutionScheduler':
+        """Create a scheduler using the queue message TTL of a deployment.
+
+        Args:
+            deployment: Deployment whose scaling options define the queue message TTL
+            **kwargs: Additional arguments passed to AsyncExecutionScheduler
+
+        Returns:
+            AsyncExecutionScheduler: The scheduler
+        """
+        if deployment.scaling is not None and 'queue_ttl_seconds' not in kwargs:
+            kwargs['queue_ttl_seconds'] = deployment.scaling.queue_message_ttl_seconds
+        return cls(**kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Stop polling. Futures of executions that haven't completed are cancelled."""
+        with self._condition:
+            self._stopped = True
+            pending, self._heap = self._heap, []
+            self._condition.notify_all()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+        for _, _, tracked in pending:
+            tracked.future.cancel()
+
+    @property
+    def pending(self) -> int:
+        """Number of executions that haven't completed yet."""
+        with self._condition:
+            return self._tracked
+
+    def add(
+        self,
+        execution: AsyncInferenceExecution,
+        on_status: Callable[[AsyncInferenceExecution], Any] | None = None,
+        submitted_at: float | None = None,
+    ) -> Future:
+        """Track an execution until it completes.
+
+        Args:
+            execution: Execution returned by `InferenceClient.run()`
+            on_status: Optional callback called with the execution after every
+                successful status poll
+            submitted_at: Unix time the execution was submitted, the queue TTL counts
+                from it. Defaults to now.
+
+        Returns:
+            Future: Resolves with the execution's result, or fails with the error that
+            stopped it from being polled
+
+        Raises:
+            InferenceClientError: If the scheduler is closed
+        """
+        future: Future = Future()
+        tracked = _TrackedExecution(
+            execution, future, self.policy.initial_interval_seconds, on_status, submitted_at
+        )
+        with self._condition:
+            if self._stopped:
+                raise InferenceClientError('Execution scheduler is closed')
+            self._tracked += 1
+            self._push(tracked)
+        return future
+
+    def _push(self, tracked: _TrackedExecution) -> None:
+        delay = tracked.interval
+        if self.policy.jitter:
+            delay *= random.uniform(0.8, 1.2)
+        next_poll = time.monotonic() + delay
+        if self.queue_ttl_seconds is not None and tracked.status in _QUEUED_STATUSES:
+            # check right when the TTL runs out instead of up to a whole interval later
+            next_poll = min(next_poll, tracked.submitted_at + self.queue_ttl_seconds)
+        heapq.heappush(self._heap, (next_poll, next(self._sequence), tracked))
+        self._condition.notify_all()
+
+    def _schedule_loop(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if self._stopped:
+                        return
+                    if self._heap and self._in_flight < self.max_concurrent_polls:
+                        delay = self._heap[0][0] - time.monotonic()
+                        if delay <= 0:
+                            break
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+                _, _, tracked = heapq.heappop(self._heap)
+                self._in_flight += 1
+            self._executor.submit(self._poll, tracked)
+
+    def _poll(self, tracked: _TrackedExecution) -> None:
+        reschedule = False
+        try:
+            if tracked.future.cancelled():
+                return
+            try:
+                tracked.execution.status_json()
+                if tracked.on_status is not None:
+                    tracked.on_status(tracked.execution)
+            except Exception as e:
+                tracked.errors += 1
+                if tracked.errors >= self.policy.max_poll_errors:
+                    _resolve(tracked.future, error=e)
+                    return
+                tracked.interval = self._backoff(tracked.interval)
+                reschedule = True
+                return
+            tracked.errors = 0
+            status = tracked.execution.status()
+            if status == AsyncStatus.Completed:
+                self._complete(tracked)
+            elif (
+                self.queue_ttl_seconds is not None
+                and status in _QUEUED_STATUSES
+                and time.monotonic() - tracked.submitted_at >= self.queue_ttl_seconds
+            ):
+                _resolve(
+                    tracked.future,
+                    error=InferenceClientError(
+                        f'Execution {tracked.execution.id} still queued after the '
+                        f'{self.queue_ttl_seconds}s queue message TTL'
+                    ),
+                )
+            else:
+                if status != tracked.status:
+                    tracked.interval = self.policy.initial_interval_seconds
+                else:
+                    tracked.interval = self._backoff(tracked.interval)
+                tracked.status = status
+                reschedule = True
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                if reschedule and not self._stopped:
+                    self._push(tracked)
+                elif reschedule:
+                    tracked.future.cancel()
+                else:
+                    self._tracked -= 1
+                self._condition.notify_all()
+
+    def _complete(self, tracked: _TrackedExecution) -> None:
+        if not self.fetch_result:
+            _resolve(tracked.future, result=tracked.execution)
+            return
+        try:
+            result = tracked.execution.result()
+        except Exception as e:
+            _resolve(tracked.future, error=e)
+        else:
+            _resolve(tracked.future, result=result)
+
+    def _backoff(self, interval: float) -> float:
+        return min(interval * self.policy.backoff_multiplier, self.policy.max_interval_seconds)
+
+
+def _resolve(future: Future, result: Any = None, error: BaseException | None = None) -> None:
+    """Resolve a future unless it was cancelled in the meantime."""
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+_default_scheduler: AsyncExecutionScheduler | None = None
+_default_scheduler_lock = threading.Lock()
+
+
+def default_execution_scheduler() -> AsyncExecutionScheduler:
+    """Shared scheduler backing `AsyncInferenceExecution.future()` and `await execution`.
+
+    Returns:
+        AsyncExecutionScheduler: The scheduler, started on first use
+    """
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = AsyncExecutionScheduler(max_concurrent_polls=32)
+        return _default_scheduler
@@ -0,0 +1,71 @@
+import threading
+from typing import Any
+
+from ._inference_client import InferenceClient
+
+
+class InferenceClientRegistry:
+    """Hands out one shared InferenceClient per endpoint URL and inference key.
+
+    Objects that point at the same endpoint reuse the same client, and with it the
+    same warm connection pool, instead of opening new connections each time. Global
+    headers set on a shared client apply to every user of that client.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._clients: dict[tuple[str, str], tuple[InferenceClient, dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(self, inference_key: str, endpoint_base_url: str, **client_options) -> InferenceClient:
+        """Get the client of an endpoint, creating it on first use.
+
+        A new client replaces the registered one if different client options are given,
+        so later callers share the newly configured client.
+
+        Args:
+            inference_key: The authentication key for the API
+            endpoint_base_url: The base URL for the API
+            **client_options: Additional options passed to InferenceClient,
+                e.g. pool_maxsize or pool_block.
+
+        Returns:
+            InferenceClient: The shared client
+
+        Raises:
+            InferenceClientError: If the parameters are invalid
+        """
+        key = (endpoint_base_url.rstrip('/'), inference_key)
+        with self._lock:
+            registered = self._clients.get(key)
+            if registered is not None and (not client_options or registered[1] == client_options):
+                return registered[0]
+            client = InferenceClient(inference_key, endpoint_base_url, **client_options)
+            self._clients[key] = (client, client_options)
+            return client
+
+    def remove(self, inference_key: str, endpoint_base_url: str) -> None:
+        """Forget the client of an endpoint and close its connections.
+
+        Args:
+            inference_key: The authentication key for the API
+            endpoint_base_url: The base URL for the API
+        """
+        with self._lock:
+            registered = self._clients.pop((endpoint_base_url.rstrip('/'), inference_key), None)
+        if registered is not None:
+            registered[0]._session.close()
+
+    def clear(self) -> None:
+        """Forget all clients and close their connections."""
+        with self._lock:
+            registered, self._clients = list(self._clients.values()), {}
+        for client, _ in registered:
+            client._session.close()
+
+
+default_client_registry = InferenceClientRegistry()
+"""Registry used by container deployments to share inference clients."""
@@ -0,0 +1,263 @@
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+SSE_DONE_MARKER = '[DONE]'
+_UNDECODED = object()
+_LF_LINE_END = re.compile(rb'\r?\n')
+_ANY_LINE_END = re.compile(rb'\r\n|\r|\n')
+
+
+@dataclass
+class ServerSentEvent:
+    """A single Server-Sent Event.
+
+    Attributes:
+        data: Event payload; multiple `data:` lines are joined with newlines.
+        event: Event type, `message` unless the server set one.
+        id: Last event id seen on the stream, if any.
+        retry: Reconnection time in milliseconds, if the event set one.
+    """
+
+    data: str
+    event: str = 'message'
+    id: str | None = None
+    retry: int | None = None
+    _json: Any = field(default=_UNDECODED, init=False, repr=False, compare=False)
+
+    def json(self) -> Any:
+        """Decode the event data as JSON, once; later calls return the same value."""
+        if self._json is _UNDECODED:
+            self._json = json.loads(self.data)
+        return self._json
+
+
+class _LineBuffer:
+    """Splits a byte stream into lines, keeping partial lines across chunks.
+
+    Lines end with LF or CRLF, and with a bare CR too when `split_cr` is set.
+    """
+
+    def __init__(self, split_cr: bool = False) -> None:
+        self._buffer = bytearray()
+        self._line_end = _ANY_LINE_END if split_cr else _LF_LINE_END
+        # a CR ending the last chunk may be the first half of a CRLF
+        self._skip_lf = False
+
+    def feed(self, chunk: bytes) -> list[bytearray]:
+        """Add a chunk and return the complete lines it finished, without line endings."""
+        buffer = self._buffer
+        buffer += chunk
+        if not buffer:
+            return []
+        start = 0
+        if self._skip_lf:
+            self._skip_lf = False
+            if buffer[0] == 0x0A:
+                start = 1
+        lines = []
+        for match in self._line_end.finditer(buffer, start):
+            lines.append(buffer[start : match.start()])
+            start = match.end()
+        if start == len(buffer) and buffer[-1] == 0x0D:
+            self._skip_lf = True
+        if start:
+            del buffer[:start]
+        return lines
+
+    def flush(self) -> bytes:
+        """Return and clear the trailing partial line."""
+        line = bytes(self._buffer.rstrip(b'\r'))
+        self._buffer.clear()
+        self._skip_lf = False
+        return line
+
+
+class SSEParser:
+    """Incremental Server-Sent Events parser.
+
+    Feed it raw body chunks as they arrive; events are returned as soon as their
+    terminating blank line has been received, regardless of how the chunks split lines.
+    Lines may end with LF, CRLF or a bare CR.
+    """
+
+    def __init__(self) -> None:
+        self._lines = _LineBuffer(split_cr=True)
+        self._data: list[str] = []
+        self._event = ''
+        self._last_id: str | None = None
+        self._retry: int | None = None
+
+    def feed(self, chunk: bytes) -> list[ServerSentEvent]:
+        """Parse a chunk of the response body.
+
+        Args:
+            chunk: Raw bytes from the response body
+
+        Returns:
+            list[ServerSentEvent]: Events completed by this chunk
+        """
+        events = []
+        for line in self._lines.feed(chunk):
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> list[ServerSentEvent]:
+        """Finish parsing at the end of the stream.
+
+        Unlike the strict specification, a final event that is missing its terminating
+        blank line is still dispatched.
+
+        Returns:
+            list[ServerSentEvent]: The remaining event, if any
+        """
+        events = []
+        for line in (self._lines.flush(), b''):
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _process_line(self, line: bytes | bytearray) -> ServerSentEvent | None:
+        if not line:
+            return self._dispatch()
+        if line[0] == 58:  # b':' starts a comment, used by servers as keep-alive
+            return None
+        field_name, sep, value = line.partition(b':')
+        if sep and value[:1] == b' ':
+            value = value[1:]
+        if field_name == b'data':
+            self._data.append(value.decode('utf-8'))
+        elif field_name == b'event':
+            self._event = value.decode('utf-8')
+        elif field_name == b'id':
+            if b'\0' not in value:
+                self._last_id = value.decode('utf-8')
+        elif field_name == b'retry' and value.isdigit():
+            self._retry = int(value)
+        return None
+
+    def _dispatch(self) -> ServerSentEvent | None:
+        if not self._data:
+            self._event = ''
+            return None
+        event = ServerSentEvent(
+            data='\n'.join(self._data),
+            event=self._event or 'message',
+            id=self._last_id,
+            retry=self._retry,
+        )
+        self._data = []
+        self._event = ''
+        self._retry = None
+        return event
+
+
+class NDJSONParser:
+    """Incremental newline-delimited JSON parser."""
+
+    def __init__(self) -> None:
+        self._lines = _LineBuffer()
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Parse a chunk of the response body.
+
+        Args:
+            chunk: Raw bytes from the response body
+
+        Returns:
+            list[Any]: JSON values completed by this chunk
+        """
+        return [json.loads(line) for line in self._lines.feed(chunk) if line.strip()]
+
+    def flush(self) -> list[Any]:
+        """Decode a final value that is missing its trailing newline."""
+        line = self._lines.flush()
+        return [json.loads(line)] if line.strip() else []
+
+
+def iter_sse_events(chunks: Iterable[bytes]) -> Iterator[ServerSentEvent]:
+    """Parse Server-Sent Events from an iterable of body chunks.
+
+    Args:
+        chunks: Raw response body chunks
+
+    Returns:
+        Iterator over the parsed events
+    """
+    parser = SSEParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.flush()
+
+
+def iter_sse_json(
+    chunks: Iterable[bytes], done_marker: str | None = SSE_DONE_MARKER
+) -> Iterator[Any]:
+    """Decode the JSON payloads of a Server-Sent Events stream.
+
+    Args:
+        chunks: Raw response body chunks
+        done_marker: Event data that ends the stream, as sent by OpenAI-compatible servers
+
+    Returns:
+        Iterator over the decoded JSON payloads
+    """
+    for event in iter_sse_events(chunks):
+        if event.data == done_marker:
+            return
+        yield event.json()
+
+
+def iter_ndjson(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Decode newline-delimited JSON from an iterable of body chunks.
+
+    Args:
+        chunks: Raw response body chunks
+
+    Returns:
+        Iterator over the decoded JSON values
+    """
+    parser = NDJSONParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.flush()
+
+
+async def aiter_sse_events(chunks: AsyncIterable[bytes]) -> AsyncIterator[ServerSentEvent]:
+    """Async variant of iter_sse_events."""
+    parser = SSEParser()
+    async for chunk in chunks:
+        for event in parser.feed(chunk):
+            yield event
+    for event in parser.flush():
+        yield event
+
+
+async def aiter_sse_json(
+    chunks: AsyncIterable[bytes], done_marker: str | None = SSE_DONE_MARKER
+) -> AsyncIterator[Any]:
+    """Async variant of iter_sse_json."""
+    async for event in aiter_sse_events(chunks):
+        if event.data == done_marker:
+            return
+        yield event.json()
+
+
+async def aiter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Async variant of iter_ndjson."""
+    parser = NDJSONParser()
+    async for chunk in chunks:
+        for value in parser.feed(chunk):
+            yield value
+    for value in parser.flush():
+        yield value
+
+
+def is_event_stream(content_type: str | None) -> bool:
+    """Whether a Content-Type header denotes a Server-Sent Events stream."""
+    return (content_type or '').split(';', 1)[0].strip().lower() == 'text/event-stream'
@@ -0,0 +1,174 @@
+import bisect
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list.
+
+    Args:
+        sorted_values: Values sorted in ascending order
+        q: Percentile to compute, between 0 and 100
+
+    Returns:
+        float: The percentile value, or 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(q / 100 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+@dataclass_json
+@dataclass
+class LatencySummary:
+    """Summary statistics of a set of latency samples, in seconds.
+
+    Attributes:
+        count: Number of samples.
+        mean: Arithmetic mean.
+        p50: Median.
+        p90: 90th percentile.
+        p99: 99th percentile.
+        max: Largest sample.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    p50: float = 0.0
+    p90: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+
+    @classmethod
+    def from_samples(cls, samples: Iterable[float]) -> 'LatencySummary':
+        """Build a summary from raw latency samples.
+
+        Args:
+            samples: Latency samples in seconds
+
+        Returns:
+            LatencySummary: The summary statistics
+        """
+        values = sorted(samples)
+        if not values:
+            return cls()
+        return cls(
+            count=len(values),
+            mean=sum(values) / len(values),
+            p50=percentile(values, 50),
+            p90=percentile(values, 90),
+            p99=percentile(values, 99),
+            max=values[-1],
+        )
+
+
+def exponential_buckets(start: float, factor: float, count: int) -> tuple[float, ...]:
+    """Upper bounds of histogram buckets growing by a constant factor.
+
+    Args:
+        start: Upper bound of the first bucket
+        factor: Ratio between consecutive bounds, greater than 1
+        count: Number of bounds
+
+    Returns:
+        tuple[float, ...]: The bucket bounds in ascending order
+    """
+    return tuple(start * factor**i for i in range(count))
+
+
+@dataclass_json
+@dataclass
+class HistogramSnapshot:
+    """Point-in-time copy of a Histogram.
+
+    Attributes:
+        bounds: Upper bounds of the buckets, in ascending order.
+        counts: Number of observations per bucket; the last one counts observations
+            above the largest bound.
+        count: Total number of observations.
+        sum: Sum of all observations.
+        min: Smallest observation.
+        max: Largest observation.
+    """
+
+    bounds: list[float]
+    counts: list[int]
+    count: int = 0
+    sum: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Arithmetic mean of the observations."""
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Estimate a percentile by interpolating within its bucket.
+
+        Args:
+            q: Percentile to compute, between 0 and 100
+
+        Returns:
+            float: The estimate, or 0.0 without observations
+        """
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.bounds[i - 1] if i > 0 else self.min
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * max(rank - cumulative, 0) / bucket_count
+            cumulative += bucket_count
+        return self.max
+
+
+class Histogram:
+    """Fixed-bucket histogram of non-negative observations.
+
+    Memory use doesn't grow with the number of observations, so it can aggregate
+    every request of a long-running process. Not thread-safe; callers hold a lock.
+    """
+
+    def __init__(self, bounds: Iterable[float]) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            bounds: Upper bounds of the buckets, in ascending order
+        """
+        self.bounds = sorted(bounds)
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all observations."""
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add an observation."""
+        self._counts[bisect.bisect_left(self.bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Copy of the current state."""
+        return HistogramSnapshot(
+            bounds=list(self.bounds),
+            counts=list(self._counts),
+            count=self._count,
+            sum=self._sum,
+            min=self._min if self._count else 0.0,
+            max=self._max,
+        )
@@ -0,0 +1,298 @@
+import json
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from dataclasses_json import dataclass_json  # type: ignore
+
+from ._sse import ServerSentEvent
+from ._stats import Histogram, HistogramSnapshot, LatencySummary, exponential_buckets
+
+# 1 ms to about 92 s in steps of √2
+DEFAULT_LATENCY_BUCKETS = exponential_buckets(0.001, 2**0.5, 34)
+# 1 to 16384 tokens per second in steps of √2
+DEFAULT_THROUGHPUT_BUCKETS = exponential_buckets(1.0, 2**0.5, 29)
+
+
+@dataclass_json
+@dataclass
+class StreamMetrics:
+    """Timing of one streamed response.
+
+    Token counts are taken from OpenAI-compatible completion and chat completion
+    chunks, as sent by SGLang, vLLM and TGI: each chunk carrying generated text counts
+    as one token, unless the stream reports its `usage`. For other streams only the
+    chunk timing is recorded. Times are taken when chunks reach the caller, so a slow
+    consumer shows up as slow decoding.
+
+    Attributes:
+        first_chunk_seconds: Seconds from sending the request to the first chunk.
+        ttft_seconds: Seconds from sending the request to the first generated token.
+        duration_seconds: Seconds from sending the request to the end of the stream.
+        chunks: Number of chunks received.
+        completion_tokens: Number of generated tokens.
+        prompt_tokens: Number of prompt tokens, if the stream reported its usage.
+        inter_token_latency: Intervals between chunks carrying tokens, or between all
+            chunks if the stream has no recognizable tokens.
+    """
+
+    first_chunk_seconds: float | None = None
+    ttft_seconds: float | None = None
+    duration_seconds: float = 0.0
+    chunks: int = 0
+    completion_tokens: int = 0
+    prompt_tokens: int | None = None
+    inter_token_latency: LatencySummary = field(default_factory=LatencySummary)
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Decode speed: tokens after the first one per second until the end of the stream."""
+        if self.ttft_seconds is None or self.completion_tokens < 2:
+            return 0.0
+        decode_seconds = self.duration_seconds - self.ttft_seconds
+        return (self.completion_tokens - 1) / decode_seconds if decode_seconds > 0 else 0.0
+
+
+def _chunk_tokens(value: Any) -> tuple[int, dict | None]:
+    """Number of tokens in an OpenAI-compatible stream chunk, and its usage if any."""
+    if not isinstance(value, dict):
+        return 0, None
+    tokens = 0
+    for choice in value.get('choices') or ():
+        if not isinstance(choice, dict):
+            continue
+        delta = choice.get('delta')
+        if isinstance(delta, dict):
+            if delta.get('content') or delta.get('reasoning_content') or delta.get('tool_calls'):
+                tokens += 1
+        elif choice.get('text'):
+            tokens += 1
+    usage = value.get('usage')
+    return tokens, usage if isinstance(usage, dict) else None
+
+
+class _StreamRecorder:
+    """Collects the timing of one response stream as its chunks are consumed."""
+
+    def __init__(self, sent_at: float | None) -> None:
+        self._start = sent_at if sent_at is not None else time.perf_counter()
+        self._first_chunk_at: float | None = None
+        self._first_token_at: float | None = None
+        self._last_chunk_at: float | None = None
+        self._last_token_at: float | None = None
+        self._chunk_intervals: list[float] = []
+        self._token_intervals: list[float] = []
+        self._chunks = 0
+        self._tokens = 0
+        self._usage: dict | None = None
+
+    def chunk(self, tokens: int = 0) -> None:
+        """Record a chunk carrying the given number of tokens."""
+        now = time.perf_counter()
+        self._chunks += 1
+        if self._first_chunk_at is None:
+            self._first_chunk_at = now
+        else:
+            self._chunk_intervals.append(now - self._last_chunk_at)
+        self._last_chunk_at = now
+        if tokens:
+            self._tokens += tokens
+            if self._first_token_at is None:
+                self._first_token_at = now
+            else:
+                self._token_intervals.append(now - self._last_token_at)
+            self._last_token_at = now
+
+    def value(self, value: Any) -> None:
+        """Record a chunk decoded from JSON."""
+        tokens, usage = _chunk_tokens(value)
+        if usage is not None:
+            self._usage = usage
+        self.chunk(tokens)
+
+    def line(self, line: bytes | str) -> None:
+        """Record a raw Server-Sent Events or NDJSON line."""
+        if isinstance(line, str):
+            line = line.encode()
+        if line.startswith(b'data:'):
+            line = line[5:].lstrip()
+        if not line.startswith(b'{'):
+            self.chunk()
+            return
+        try:
+            value = json.loads(line)
+        except ValueError:
+            self.chunk()
+            return
+        self.value(value)
+
+    def event(self, event: ServerSentEvent) -> None:
+        """Record a Server-Sent Event, decoding its data through `event.json()`."""
+        if not event.data.startswith('{'):
+            self.chunk()
+            return
+        try:
+            value = event.json()
+        except ValueError:
+            self.chunk()
+            return
+        self.value(value)
+
+    @property
+    def intervals(self) -> list[float]:
+        """Intervals summarized by StreamMetrics.inter_token_latency."""
+        return self._token_intervals if self._tokens else self._chunk_intervals
+
+    def finish(self) -> StreamMetrics:
+        """Metrics of the stream so far."""
+        end = self._last_chunk_at if self._last_chunk_at is not None else time.perf_counter()
+        usage = self._usage or {}
+        completion_tokens = usage.get('completion_tokens')
+        return StreamMetrics(
+            first_chunk_seconds=_since(self._start, self._first_chunk_at),
+            ttft_seconds=_since(self._start, self._first_token_at),
+            duration_seconds=end - self._start,
+            chunks=self._chunks,
+            completion_tokens=(
+                completion_tokens if isinstance(completion_tokens, int) else self._tokens
+            ),
+            prompt_tokens=usage.get('prompt_tokens'),
+            inter_token_latency=LatencySummary.from_samples(self.intervals),
+        )
+
+
+def _since(start: float, at: float | None) -> float | None:
+    return at - start if at is not None else None
+
+
+@dataclass_json
+@dataclass
+class DeploymentTokenMetrics:
+    """Aggregated streaming metrics of one deployment.
+
+    Attributes:
+        streams: Number of recorded streams.
+        completion_tokens: Total number of generated tokens.
+        ttft: Time to first token, in seconds.
+        inter_token_latency: Intervals between tokens, in seconds.
+        tokens_per_second: Decode speed of each stream.
+    """
+
+    streams: int
+    completion_tokens: int
+    ttft: HistogramSnapshot
+    inter_token_latency: HistogramSnapshot
+    tokens_per_second: HistogramSnapshot
+
+
+class _DeploymentHistograms:
+    def __init__(self, latency_buckets: tuple[float, ...], throughput_buckets: tuple[float, ...]):
+        self.streams = 0
+        self.completion_tokens = 0
+        self.ttft = Histogram(latency_buckets)
+        self.inter_token_latency = Histogram(latency_buckets)
+        self.tokens_per_second = Histogram(throughput_buckets)
+
+    def snapshot(self) -> DeploymentTokenMetrics:
+        return DeploymentTokenMetrics(
+            streams=self.streams,
+            completion_tokens=self.completion_tokens,
+            ttft=self.ttft.snapshot(),
+            inter_token_latency=self.inter_token_latency.snapshot(),
+            tokens_per_second=self.tokens_per_second.snapshot(),
+        )
+
+
+class TokenMetrics:
+    """Per-deployment histograms of time to first token, inter-token latency and decode speed.
+
+    Inference clients whose `token_metrics` is set record every streamed response into
+    it; recording is off by default, since it decodes every chunk. Histograms have fixed
+    buckets, so memory use doesn't grow with traffic.
+
+    Example:
+        ```
+        client.token_metrics = default_token_metrics
+        ...
+        metrics = default_token_metrics.snapshot(reset=True)['my-deployment']
+        if metrics.ttft.percentile(90) > 2.0:
+            scale_up()
+        ```
+    """
+
+    def __init__(
+        self,
+        latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+        throughput_buckets: tuple[float, ...] = DEFAULT_THROUGHPUT_BUCKETS,
+    ) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            latency_buckets: Bucket bounds of the latency histograms, in seconds
+            throughput_buckets: Bucket bounds of the tokens per second histogram
+        """
+        self.latency_buckets = latency_buckets
+        self.throughput_buckets = throughput_buckets
+        self._lock = threading.Lock()
+        self._deployments: dict[str, _DeploymentHistograms] = {}
+
+    def record(
+        self,
+        deployment: str,
+        metrics: StreamMetrics,
+        intervals: Iterable[float] | None = None,
+    ) -> None:
+        """Add the metrics of a finished stream.
+
+        Args:
+            deployment: Name of the deployment that produced the stream
+            metrics: Metrics of the stream
+            intervals: The individual inter-token intervals of the stream. If omitted,
+                its mean interval is observed once.
+        """
+        if not metrics.chunks:
+            return
+        with self._lock:
+            histograms = self._deployments.get(deployment)
+            if histograms is None:
+                histograms = _DeploymentHistograms(self.latency_buckets, self.throughput_buckets)
+                self._deployments[deployment] = histograms
+            histograms.streams += 1
+            histograms.completion_tokens += metrics.completion_tokens
+            ttft = metrics.ttft_seconds
+            if ttft is None:
+                ttft = metrics.first_chunk_seconds
+            if ttft is not None:
+                histograms.ttft.observe(ttft)
+            if intervals is not None:
+                for interval in intervals:
+                    histograms.inter_token_latency.observe(interval)
+            elif metrics.inter_token_latency.count:
+                histograms.inter_token_latency.observe(metrics.inter_token_latency.mean)
+            if metrics.tokens_per_second:
+                histograms.tokens_per_second.observe(metrics.tokens_per_second)
+
+    def snapshot(self, reset: bool = False) -> dict[str, DeploymentTokenMetrics]:
+        """Current metrics by deployment name.
+
+        Args:
+            reset: If True, start over afterwards, e.g. to look at one interval at a time
+
+        Returns:
+            dict[str, DeploymentTokenMetrics]: Metrics of each deployment with streams
+        """
+        with self._lock:
+            snapshot = {name: h.snapshot() for name, h in self._deployments.items()}
+            if reset:
+                self._deployments = {}
+        return snapshot
+
+    def reset(self) -> None:
+        """Discard all metrics."""
+        with self._lock:
+            self._deployments = {}
+
+
+default_token_metrics = TokenMetrics()
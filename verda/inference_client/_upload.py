@@ -0,0 +1,229 @@
+import asyncio
+import mmap
+import os
+import uuid
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from ._payload import OCTET_STREAM_CONTENT_TYPE, RawBody
+
+DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class StreamingBody:
+    """A request body read piece by piece while it is sent, so it never sits in memory.
+
+    The source can be a file path, a binary file object, an mmap or other buffer, or an
+    iterable of byte chunks. Paths, buffers and seekable files can be sent again, e.g.
+    by retries or hedged requests; iterators and unseekable files only once. Bodies of
+    known size are sent with a Content-Length, others with chunked transfer encoding.
+    """
+
+    def __init__(
+        self,
+        source: str | os.PathLike | Any,
+        content_type: str = OCTET_STREAM_CONTENT_TYPE,
+        length: int | None = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    ) -> None:
+        """Initialize the body.
+
+        Args:
+            source: File path, binary file object, mmap, bytes-like buffer or iterable of
+                byte chunks
+            content_type: Value of the Content-Type header
+            length: Size in bytes, if it can't be determined from the source
+            chunk_size: Number of bytes read from files per chunk
+        """
+        self.source = source
+        self.content_type = content_type
+        self.chunk_size = chunk_size
+        self._start = None
+        if isinstance(source, str | os.PathLike):
+            self.length = length if length is not None else os.path.getsize(source)
+        elif isinstance(source, mmap.mmap | bytes | bytearray | memoryview):
+            self.length = length if length is not None else memoryview(source).nbytes
+        elif hasattr(source, 'read'):
+            self.length = length
+            if _is_seekable(source):
+                self._start = source.tell()
+                if length is None:
+                    self.length = source.seek(0, os.SEEK_END) - self._start
+                    source.seek(self._start)
+        else:
+            self.length = length
+
+    def __iter__(self) -> Iterator[bytes | memoryview]:
+        """Yield the body in chunks."""
+        source = self.source
+        if isinstance(source, str | os.PathLike):
+            with open(source, 'rb') as f:
+                yield from _read_chunks(f, self.chunk_size)
+        elif isinstance(source, mmap.mmap | bytes | bytearray | memoryview):
+            view = memoryview(source).cast('B')
+            for offset in range(0, len(view), self.chunk_size):
+                yield view[offset : offset + self.chunk_size]
+        elif hasattr(source, 'read'):
+            if self._start is not None:
+                source.seek(self._start)
+            yield from _read_chunks(source, self.chunk_size)
+        else:
+            for chunk in source:
+                if chunk:
+                    yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield the body in chunks, reading files in a worker thread."""
+        chunks = iter(self)
+        while True:
+            if isinstance(self.source, mmap.mmap | bytes | bytearray | memoryview):
+                chunk = next(chunks, None)
+            else:
+                chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                return
+            yield bytes(chunk)
+
+
+def _is_seekable(f: Any) -> bool:
+    try:
+        return f.seekable()
+    except (AttributeError, OSError):
+        return False
+
+
+def _read_chunks(f: Any, chunk_size: int) -> Iterator[bytes]:
+    while chunk := f.read(chunk_size):
+        yield chunk
+
+
+@dataclass
+class MultipartFile:
+    """A file part of a multipart upload.
+
+    Attributes:
+        source: File path, binary file object, buffer or iterable of byte chunks.
+        filename: File name sent with the part, defaults to the path's base name.
+        content_type: Content type of the part.
+        length: Size in bytes, if it can't be determined from the source.
+    """
+
+    source: Any
+    filename: str | None = None
+    content_type: str = OCTET_STREAM_CONTENT_TYPE
+    length: int | None = None
+
+
+class MultipartBody:
+    """A multipart/form-data body generated while it is sent.
+
+    Unlike the `files` argument of requests, file parts are streamed from their source
+    instead of being joined into one bytes object, so peak memory doesn't depend on
+    the size of the files.
+
+    Example:
+        ```
+        body = MultipartBody({'model': 'whisper-1', 'file': MultipartFile('talk.wav')})
+        client.post('v1/audio/transcriptions', data=body)
+        ```
+    """
+
+    def __init__(
+        self,
+        fields: Mapping[str, str | bytes | MultipartFile],
+        boundary: str | None = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    ) -> None:
+        """Initialize the body.
+
+        Args:
+            fields: Form fields by name: strings and bytes as plain values,
+                MultipartFile for streamed file parts
+            boundary: Optional part boundary, generated if not given
+            chunk_size: Number of bytes read from files per chunk
+        """
+        self.boundary = boundary or uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        self._parts: list[tuple[bytes, StreamingBody]] = []
+        for name, value in fields.items():
+            if isinstance(value, MultipartFile):
+                filename = value.filename
+                if filename is None and isinstance(value.source, str | os.PathLike):
+                    filename = os.path.basename(value.source)
+                disposition = f'form-data; name="{_quote(name)}"'
+                if filename is not None:
+                    disposition += f'; filename="{_quote(filename)}"'
+                header = (
+                    f'--{self.boundary}\r\nContent-Disposition: {disposition}\r\n'
+                    f'Content-Type: {value.content_type}\r\n\r\n'
+                )
+                body = StreamingBody(value.source, length=value.length, chunk_size=chunk_size)
+            else:
+                header = (
+                    f'--{self.boundary}\r\n'
+                    f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+                )
+                body = StreamingBody(value.encode() if isinstance(value, str) else value)
+            self._parts.append((header.encode(), body))
+        self._closing = f'--{self.boundary}--\r\n'.encode()
+
+    @property
+    def length(self) -> int | None:
+        """Size of the whole body in bytes, or None if a part's size is unknown."""
+        total = len(self._closing)
+        for header, body in self._parts:
+            if body.length is None:
+                return None
+            total += len(header) + body.length + 2
+        return total
+
+    def __iter__(self) -> Iterator[bytes | memoryview]:
+        """Yield the body in chunks."""
+        for header, body in self._parts:
+            yield header
+            yield from body
+            yield b'\r\n'
+        yield self._closing
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield the body in chunks, reading files in a worker thread."""
+        for header, body in self._parts:
+            yield header
+            async for chunk in body:
+                yield chunk
+            yield b'\r\n'
+        yield self._closing
+
+
+def _quote(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\r', '').replace('\n', '')
+
+
+class _SizedChunks:
+    """Iterable of body chunks with a known total size, so requests sends a Content-Length."""
+
+    def __init__(self, chunks: Iterable[bytes | memoryview], length: int) -> None:
+        self._chunks = chunks
+        self._length = length
+
+    def __iter__(self) -> Iterator[bytes | memoryview]:
+        return iter(self._chunks)
+
+    def __len__(self) -> int:
+        return self._length
+
+
+def _streaming_data(body: StreamingBody | MultipartBody) -> Iterable[bytes | memoryview]:
+    """The `data` argument for requests that streams a body."""
+    if body.length is None:
+        # a plain generator makes requests use chunked transfer encoding
+        return (chunk for chunk in body)
+    return _SizedChunks(body, body.length)
+
+
+def _body_kwargs(data: Any) -> dict[str, Any]:
+    """Request keyword arguments sending data as JSON, or as-is if it is already encoded."""
+    if isinstance(data, RawBody | StreamingBody | MultipartBody | bytes | bytearray | memoryview):
+        return {'data': data}
+    return {'json': data}
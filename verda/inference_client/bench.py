@@ -0,0 +1,180 @@
+r"""Benchmark an inference endpoint from the command line.
+
+Measures latency percentiles, throughput and error rates at one or more concurrency
+levels (closed loop) or arrival rates (open loop), e.g. to find the latency curve of a
+deployment before choosing its scaling options:
+
+    python -m verda.inference_client.bench https://containers.datacrunch.io/my-deployment \
+        --data '{"prompt": "Hello {{index}}"}' --path generate --concurrency 1,4,16,64 \
+        --requests 500 --json curve.json --csv curve.csv
+
+The inference key is read from --inference-key or the VERDA_INFERENCE_KEY environment
+variable. Any URL works, including a local stand-in server.
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Sequence
+
+from ._bench import BenchmarkReport, InferenceBenchmark, RequestTemplate, write_reports_csv
+from ._inference_client import InferenceClient
+from ._stats import LatencySummary
+
+
+def _numbers(kind: type):
+    def parse(value: str) -> list:
+        return [kind(item) for item in value.split(',') if item.strip()]
+
+    return parse
+
+
+def _header(value: str) -> tuple[str, str]:
+    name, separator, header_value = value.partition(':')
+    if not separator:
+        raise argparse.ArgumentTypeError(f'Expected NAME:VALUE, got {value!r}')
+    return name.strip(), header_value.strip()
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m verda.inference_client.bench',
+        description='Load test an inference endpoint and report latency and throughput.',
+    )
+    parser.add_argument('url', help='endpoint base URL of the deployment')
+    parser.add_argument(
+        '--inference-key',
+        default=os.environ.get('VERDA_INFERENCE_KEY'),
+        help='inference key, defaults to $VERDA_INFERENCE_KEY',
+    )
+    payload = parser.add_mutually_exclusive_group()
+    payload.add_argument('--data', help='JSON request payload, {{index}} is replaced per request')
+    payload.add_argument('--data-file', help='.json payload or .jsonl file of payloads')
+    parser.add_argument('--path', default='', help='API endpoint path')
+    parser.add_argument('--method', default='POST', help='HTTP method')
+    parser.add_argument(
+        '--header', type=_header, action='append', default=[], help='extra NAME:VALUE header'
+    )
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument(
+        '--concurrency',
+        type=_numbers(int),
+        help='closed loop: comma-separated concurrency levels, default 1',
+    )
+    load.add_argument(
+        '--rate', type=_numbers(float), help='open loop: comma-separated requests per second'
+    )
+    parser.add_argument('--requests', type=int, help='requests per level')
+    parser.add_argument('--duration', type=float, help='seconds per level')
+    parser.add_argument('--warmup', type=int, default=0, help='unmeasured requests per level')
+    parser.add_argument(
+        '--max-in-flight', type=int, default=256, help='open loop: maximum requests in flight'
+    )
+    parser.add_argument('--seed', type=int, help='open loop: seed of the arrival times')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        '--async', dest='async_requests', action='store_true', help='send async requests'
+    )
+    mode.add_argument(
+        '--stream', action='store_true', help='stream responses and measure time to first byte'
+    )
+    parser.add_argument('--timeout', type=int, default=60 * 5, help='request timeout in seconds')
+    parser.add_argument('--json', help='write the reports to this JSON file')
+    parser.add_argument('--csv', help='write the reports to this CSV file')
+    return parser
+
+
+def _format_report(report: BenchmarkReport) -> str:
+    level = (
+        f'concurrency={report.concurrency}' if report.mode == 'closed' else f'rate={report.rate}/s'
+    )
+    lines = [
+        f'{level}: {report.requests} requests in {report.duration_seconds:.2f}s, '
+        f'{report.rps:.2f} req/s, {report.error_rate:.2%} errors {report.errors or ""}'.rstrip(),
+        _format_latency('latency', report.latency),
+    ]
+    if report.ttfb is not None:
+        lines.append(_format_latency('ttfb', report.ttfb))
+    return '\n'.join(lines)
+
+
+def _format_latency(name: str, summary: LatencySummary) -> str:
+    return (
+        f'  {name:<8} p50={summary.p50 * 1000:.1f}ms p90={summary.p90 * 1000:.1f}ms '
+        f'p99={summary.p99 * 1000:.1f}ms max={summary.max * 1000:.1f}ms'
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> list[BenchmarkReport]:
+    """Run the benchmark command line tool.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv[1:]
+
+    Returns:
+        list[BenchmarkReport]: One report per concurrency level or arrival rate
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if not args.inference_key:
+        parser.error('pass --inference-key or set VERDA_INFERENCE_KEY')
+    if args.requests is None and args.duration is None:
+        args.requests = 100
+
+    template_options = {
+        'path': args.path,
+        'http_method': args.method,
+        'headers': dict(args.header) or None,
+    }
+    if args.data_file:
+        template = RequestTemplate.from_file(args.data_file, **template_options)
+    else:
+        template = RequestTemplate([json.loads(args.data or '{}')], **template_options)
+
+    client = InferenceClient(
+        args.inference_key,
+        args.url,
+        timeout_seconds=args.timeout,
+        pool_maxsize=args.max_in_flight if args.rate else max(args.concurrency or [1]),
+    )
+    benchmark = InferenceBenchmark(
+        client,
+        template,
+        async_requests=args.async_requests,
+        stream=args.stream,
+        timeout_seconds=args.timeout,
+    )
+    limits = {
+        'requests': args.requests,
+        'duration_seconds': args.duration,
+        'warmup_requests': args.warmup,
+    }
+    reports = []
+    try:
+        if args.rate:
+            for rate in args.rate:
+                reports.append(
+                    benchmark.open_loop(
+                        rate, max_in_flight=args.max_in_flight, seed=args.seed, **limits
+                    )
+                )
+                print(_format_report(reports[-1]))
+        else:
+            for concurrency in args.concurrency or [1]:
+                reports.append(benchmark.closed_loop(concurrency, **limits))
+                print(_format_report(reports[-1]))
+    finally:
+        client._session.close()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump([report.to_dict() for report in reports], f, indent=2)
+    if args.csv:
+        with open(args.csv, 'w', encoding='utf-8', newline='') as f:
+            write_reports_csv(reports, f)
+    return reports
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])